@@ -1,15 +1,29 @@
+from typing import Literal, Optional
+
 from fastapi import APIRouter, Depends, status, Query, HTTPException, Path, Request
-from app.models.auction import AuctionCreate, AuctionUpdate, AuctionResponse
-from app.services.auction_service import auction_service
+from app.models.auction import AuctionCreate, AuctionUpdate, AuctionResponse, AuctionStatus
+from app.services.archive_service import archive_service
+from app.services.auction_service import AUCTION_EXPORT_COLUMNS, auction_service
 from app.services import socket_service
+from app.services.feed_service import public_feed
+from app.core.config import settings
 from app.core.deps import get_current_admin_user
+from app.utils.export import export_response
+from app.utils.serialization import ResponseSerializer
+from app.utils.urls import UrlResolver, get_url_resolver
 from app.utils.validators import ValidationError
 
 router = APIRouter()
 
+auction_serializer = ResponseSerializer(AuctionResponse)
+
 
 @router.post("/", response_model=AuctionResponse, status_code=status.HTTP_201_CREATED)
-async def create_auction(auction_in: AuctionCreate, admin=Depends(get_current_admin_user)):
+async def create_auction(
+    auction_in: AuctionCreate,
+    admin=Depends(get_current_admin_user),
+    urls: UrlResolver = Depends(get_url_resolver),
+):
     try:
         auction_data = auction_in.model_dump()
         if getattr(admin, "studioId", None):
@@ -33,7 +47,7 @@ async def create_auction(auction_in: AuctionCreate, admin=Depends(get_current_ad
             "created_at": getattr(auction, "createdAt", None),
             "updated_at": getattr(auction, "updatedAt", None),
             "studioId": getattr(auction, "studioId", None),
-            "studio": getattr(auction, "studio", None),
+            "studio": urls.studio(getattr(auction, "studio", None)),
         }
     except ValidationError as e:
         raise HTTPException(
@@ -46,7 +60,8 @@ async def create_auction(auction_in: AuctionCreate, admin=Depends(get_current_ad
 async def update_auction(
     auction_in: AuctionUpdate,
     auction_id: int = Path(..., gt=0),
-    admin=Depends(get_current_admin_user)
+    admin=Depends(get_current_admin_user),
+    urls: UrlResolver = Depends(get_url_resolver),
 ):
     try:
         updated = await auction_service.update_auction(auction_id, auction_in.model_dump())
@@ -75,7 +90,7 @@ async def update_auction(
             "created_at": getattr(updated, "createdAt", None),
             "updated_at": getattr(updated, "updatedAt", None),
             "studioId": getattr(updated, "studioId", None),
-            "studio": getattr(updated, "studio", None),
+            "studio": urls.studio(getattr(updated, "studio", None)),
         }
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -97,61 +112,51 @@ async def delete_auction(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def _listing_row(a, urls: UrlResolver) -> dict:
+    """List/feed item for an auction record (without computed price fields)."""
+    return {
+        "id": a.id,
+        "title": a.title,
+        "description": a.description,
+        "allowed_gender": getattr(a, "allowedGender", "ANY"),
+        "start_price": a.startPrice,
+        "floor_price": a.floorPrice,
+        "start_time": a.startTime,
+        "end_time": a.endTime,
+        "scheduled_at": getattr(a, "scheduledAt", None),
+        "drop_interval_mins": a.dropIntervalMins,
+        "drop_amount": a.dropAmount,
+        "turbo_enabled": getattr(a, "turboEnabled", False),
+        "turbo_trigger_mins": getattr(a, "turboTriggerMins", 120),
+        "turbo_drop_amount": getattr(a, "turboDropAmount", None),
+        "turbo_interval_mins": getattr(a, "turboIntervalMins", 10),
+        "status": a.status,
+        "current_price": a.currentPrice if hasattr(a, 'currentPrice') else a.startPrice,
+        "turbo_started_at": getattr(a, "turboStartedAt", None),
+        "created_at": getattr(a, "createdAt", None),
+        "updated_at": getattr(a, "updatedAt", None),
+        "studioId": getattr(a, "studioId", None),
+        # Cards show the resized logo variant with an absolute URL
+        "studio": urls.studio(getattr(a, "studio", None), listing=True),
+    }
+
+
 @router.get("/", response_model=list[AuctionResponse])
-async def list_auctions(request: Request, include_computed: bool = Query(False, description="Include computedPrice and priceDetails")):
+async def list_auctions(
+    include_computed: bool = Query(False, description="Include computedPrice and priceDetails"),
+    urls: UrlResolver = Depends(get_url_resolver),
+):
     # preserve backward-compatible default behavior
     items = await auction_service.list_auctions(include_computed=include_computed) if hasattr(auction_service, "list_auctions") else []
     mapped = []
-    base = str(request.base_url).rstrip('/')
     for a in items:
         # if service returned DB objects (not computed), keep original mapping
         if not isinstance(a, dict):
-            # If auction includes nested studio object, ensure its logoUrl is absolute
-            try:
-                studio_obj = getattr(a, 'studio', None)
-                if studio_obj and getattr(studio_obj, 'logoUrl', None) and str(studio_obj.logoUrl).startswith('/uploads/'):
-                    studio_obj.logoUrl = f"{base}{studio_obj.logoUrl}"
-            except Exception:
-                pass
-
-            mapped.append({
-                "id": a.id,
-                "title": a.title,
-                "description": a.description,
-                "allowed_gender": getattr(a, "allowedGender", "ANY"),
-                "start_price": a.startPrice,
-                "floor_price": a.floorPrice,
-                "start_time": a.startTime,
-                "end_time": a.endTime,
-                "scheduled_at": getattr(a, "scheduledAt", None),
-                "drop_interval_mins": a.dropIntervalMins,
-                "drop_amount": a.dropAmount,
-                "turbo_enabled": getattr(a, "turboEnabled", False),
-                "turbo_trigger_mins": getattr(a, "turboTriggerMins", 120),
-                "turbo_drop_amount": getattr(a, "turboDropAmount", None),
-                "turbo_interval_mins": getattr(a, "turboIntervalMins", 10),
-                "status": a.status,
-                "current_price": a.currentPrice if hasattr(a, 'currentPrice') else a.startPrice,
-                "turbo_started_at": getattr(a, "turboStartedAt", None),
-                "created_at": getattr(a, "createdAt", None),
-                "updated_at": getattr(a, "updatedAt", None),
-                "studioId": getattr(a, "studioId", None),
-                "studio": getattr(a, "studio", None),
-            })
+            mapped.append(_listing_row(a, urls))
         else:
             # item already contains computed fields from service
             # If currentPrice or computedPrice is in the dict, map it to current_price
             current_p = a.get("computedPrice") or a.get("currentPrice") or a.get("start_price")
-            # item already contains computed fields from service
-            # normalize nested studio logoUrl if present
-            try:
-                studio_obj = a.get('studio')
-                if studio_obj and isinstance(studio_obj, dict) and studio_obj.get('logoUrl') and str(studio_obj.get('logoUrl')).startswith('/uploads/'):
-                    studio_obj['logoUrl'] = f"{base}{studio_obj.get('logoUrl')}"
-                    a['studio'] = studio_obj
-            except Exception:
-                pass
-
             mapped.append({
                 "id": a.get("id"),
                 "title": a.get("title"),
@@ -176,25 +181,80 @@ async def list_auctions(request: Request, include_computed: bool = Query(False,
                 "created_at": a.get("created_at"),
                 "updated_at": a.get("updated_at"),
                 "studioId": a.get("studioId"),
-                "studio": a.get("studio")
+                "studio": urls.studio(a.get("studio"), listing=True),
             })
+    if settings.FAST_RESPONSE_SERIALIZATION:
+        # Built from our own records: skip re-validating every item into AuctionResponse
+        return auction_serializer.response(mapped)
     return mapped
 
 
+@router.get("/feed", response_model=list[AuctionResponse])
+async def public_auction_feed(request: Request, urls: UrlResolver = Depends(get_url_resolver)):
+    """
+    Public auction list served from an in-memory snapshot.
+
+    Same items as `GET /` without computed price fields; rebuilt only after
+    auction/studio writes (see app.services.feed_service).
+    """
+    async def build() -> bytes:
+        items = await auction_service.list_auctions()
+        return auction_serializer.dumps(_listing_row(a, urls) for a in items)
+
+    snapshot = await public_feed.get(urls.base_url, build)
+    return snapshot.response(request.headers.get("if-none-match"))
+
+
+@router.get("/export")
+async def export_auctions(
+    export_format: Literal["csv", "ndjson"] = Query(default="csv", alias="format"),
+    status_filter: Optional[AuctionStatus] = Query(default=None, alias="status"),
+    studio_id: Optional[int] = Query(default=None),
+    admin=Depends(get_current_admin_user),
+):
+    """
+    Stream all auctions (stored columns, id order) as CSV or NDJSON. Admin only.
+    """
+    async def fetch_page(cursor, limit):
+        return await auction_service.export_page(
+            cursor, limit, status=status_filter.value if status_filter else None, studio_id=studio_id
+        )
+
+    return export_response(fetch_page, export_format, AUCTION_EXPORT_COLUMNS, "auctions", settings.EXPORT_BATCH_SIZE)
+
+
+@router.get("/archive")
+async def list_archived_auctions(
+    studio_id: Optional[int] = Query(default=None),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    admin=Depends(get_current_admin_user),
+):
+    """
+    Archived (finished, past retention) auctions, most recently ended first.
+
+    Pass the returned `next_cursor` as `cursor` to fetch the next page.
+    """
+    try:
+        return await archive_service.list_archived_auctions(studio_id=studio_id, cursor=cursor, limit=limit)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get("/archive/{auction_id}")
+async def get_archived_auction(auction_id: int = Path(..., gt=0), admin=Depends(get_current_admin_user)):
+    """Archived auction with its reservation and notifications."""
+    archived = await archive_service.get_archived_auction(auction_id)
+    if not archived:
+        raise HTTPException(status_code=404, detail="Archived auction not found")
+    return archived
+
+
 @router.get("/{auction_id}", response_model=AuctionResponse)
-async def get_auction(request: Request, auction_id: int = Path(..., gt=0)):
+async def get_auction(auction_id: int = Path(..., gt=0), urls: UrlResolver = Depends(get_url_resolver)):
     auction = await auction_service.get_auction(auction_id)
     if not auction:
         raise HTTPException(status_code=404, detail="Auction not found")
-    # Ensure nested studio logoUrl is absolute when necessary
-    try:
-        base = str(request.base_url).rstrip('/')
-        studio_obj = getattr(auction, 'studio', None)
-        if studio_obj and getattr(studio_obj, 'logoUrl', None) and str(studio_obj.logoUrl).startswith('/uploads/'):
-            studio_obj.logoUrl = f"{base}{studio_obj.logoUrl}"
-    except Exception:
-        pass
-
     return {
         "id": auction.id,
         "title": auction.title,
@@ -217,7 +277,7 @@ async def get_auction(request: Request, auction_id: int = Path(..., gt=0)):
         "created_at": getattr(auction, "createdAt", None),
         "updated_at": getattr(auction, "updatedAt", None),
         "studioId": getattr(auction, "studioId", None),
-        "studio": getattr(auction, "studio", None),
+        "studio": urls.studio(getattr(auction, "studio", None)),
     }
 
 
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, status, Depends, BackgroundTasks, Request
+from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel
 from app.models.user import UserCreate, UserResponse, UserLogin, Token, UserPasswordUpdate
 from app.services.user_service import user_service
@@ -7,24 +7,27 @@ from app.core import security
 from app.core.deps import get_current_user
 from app.core.token_revocation import is_refresh_token_revoked, revoke_refresh_token
 from app.core.db import db
-from app.core.email import send_verification_email
+from app.services.email_outbox_service import email_outbox_service
 from datetime import timedelta
 from app.core.config import settings
 from app.core.timezone import now_tr
+from app.utils.urls import UrlResolver, get_url_resolver
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 @router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
-async def register(user_in: UserCreate, background_tasks: BackgroundTasks):
+async def register(user_in: UserCreate, urls: UrlResolver = Depends(get_url_resolver)):
     """
     User registration endpoint.
     
     Validates input, checks for duplicates, creates user, and returns JWT token.
-    Sends verification email in background.
+    Queues the verification email in the outbox for the delivery worker.
     
     Args:
         user_in: UserCreate model with email, phone, full_name, gender, password
-        background_tasks: FastAPI BackgroundTasks
         
     Returns:
         Token: access_token, token_type, and user data
@@ -61,7 +64,11 @@ async def register(user_in: UserCreate, background_tasks: BackgroundTasks):
         is_verified = getattr(user, 'is_verified', getattr(user, 'isVerified', False))
         if not is_verified:
             verification_token = security.create_verification_token(user.email)
-            background_tasks.add_task(send_verification_email, user.email, verification_token)
+            try:
+                await email_outbox_service.enqueue_verification_email(user.email, verification_token)
+            except Exception as e:
+                # The account exists already; the user can request verification again later
+                logger.warning(f"Failed to queue verification email: {e}")
         
         # Generate Access Token (so user is logged in immediately)
         # They can access the site but might be restricted on some features until verified
@@ -84,7 +91,7 @@ async def register(user_in: UserCreate, background_tasks: BackgroundTasks):
             is_verified=getattr(user, 'is_verified', getattr(user, 'isVerified', False)),
             created_at=getattr(user, 'created_at', getattr(user, 'createdAt', now_tr())),
             studioId=getattr(user, 'studioId', None),
-            studio=getattr(user, 'studio', None),
+            studio=urls.studio(getattr(user, 'studio', None)),
         )
         
         # Emit socket event for real-time admin panel update
@@ -93,7 +100,7 @@ async def register(user_in: UserCreate, background_tasks: BackgroundTasks):
             await emit_user_created(user_dict)
         except Exception as e:
             # Log but don't fail the registration if socket emit fails
-            print(f"[Auth] Warning: Failed to emit user_created event: {str(e)}")
+            logger.warning(f"Failed to emit user_created event: {e}")
         
         return {
             "access_token": access_token,
@@ -104,8 +111,7 @@ async def register(user_in: UserCreate, background_tasks: BackgroundTasks):
     except Exception as e:
         # Catch database constraint violations, validation errors, etc.
         # Log the error for debugging
-        print(f"Registration error attributes: {dir(user)}")
-        print(f"Registration error: {str(e)}")
+        logger.exception(f"Registration error: {e}")
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Kayıt sırasında bir hata oluştu. Lütfen bilgilerinizi kontrol edin."
@@ -146,7 +152,7 @@ async def verify_email(token: str):
     return {"message": "Email adresi başarıyla doğrulandı"}
 
 @router.post("/login", response_model=Token)
-async def login(user_in: UserLogin):
+async def login(user_in: UserLogin, urls: UrlResolver = Depends(get_url_resolver)):
     """
     User login endpoint.
     
@@ -164,7 +170,7 @@ async def login(user_in: UserLogin):
     # Verify user exists and password is correct
     user = await user_service.get_user_by_email(user_in.email)
     hashed_password = getattr(user, 'hashed_password', getattr(user, 'hashedPassword', ''))
-    if not user or not security.verify_password(user_in.password, hashed_password):
+    if not user or not await security.verify_password_async(user_in.password, hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Email veya şifre hatalı",
@@ -197,7 +203,7 @@ async def login(user_in: UserLogin):
         is_verified=getattr(user, 'is_verified', getattr(user, 'isVerified', False)),
         created_at=getattr(user, 'created_at', getattr(user, 'createdAt', now_tr())),
         studioId=getattr(user, 'studioId', None),
-        studio=getattr(user, 'studio', None),
+        studio=urls.studio(getattr(user, 'studio', None)),
     )
     
     return {
@@ -213,9 +219,9 @@ class RefreshRequest(BaseModel):
 
 
 @router.post("/refresh", response_model=Token)
-async def refresh_token(request: Request, req: RefreshRequest):
+async def refresh_token(req: RefreshRequest, urls: UrlResolver = Depends(get_url_resolver)):
     # Reject if this refresh token has been revoked
-    if is_refresh_token_revoked(req.refresh_token):
+    if await is_refresh_token_revoked(req.refresh_token):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revoked")
 
     payload = security.decode_token(req.refresh_token)
@@ -238,14 +244,6 @@ async def refresh_token(request: Request, req: RefreshRequest):
     refresh_token_expires = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
     new_refresh_token = security.create_refresh_token(subject=user.id, expires_delta=refresh_token_expires)
 
-    # Normalize nested studio.logoUrl to absolute when necessary
-    try:
-        base = str(request.base_url).rstrip('/')
-        if user and getattr(user, 'studio', None) and getattr(user.studio, 'logoUrl', None) and str(user.studio.logoUrl).startswith('/uploads/'):
-            user.studio.logoUrl = f"{base}{user.studio.logoUrl}"
-    except Exception:
-        pass
-
     user_response = UserResponse(
         id=user.id,
         email=getattr(user, 'email', ''),
@@ -256,7 +254,7 @@ async def refresh_token(request: Request, req: RefreshRequest):
         is_verified=getattr(user, 'is_verified', getattr(user, 'isVerified', False)),
         created_at=getattr(user, 'created_at', getattr(user, 'createdAt', now_tr())),
         studioId=getattr(user, 'studioId', None),
-        studio=getattr(user, 'studio', None),
+        studio=urls.studio(getattr(user, 'studio', None)),
     )
 
     return {
@@ -273,15 +271,15 @@ async def revoke_token(req: RefreshRequest):
     payload = security.decode_token(req.refresh_token)
     if not payload or payload.get("type") != "refresh":
         # Still accept and mark token string as revoked to be safe
-        revoke_refresh_token(req.refresh_token)
+        await revoke_refresh_token(req.refresh_token)
         return {"message": "Token revoked"}
 
     # Mark token as revoked
-    revoke_refresh_token(req.refresh_token)
+    await revoke_refresh_token(req.refresh_token)
     return {"message": "Token revoked"}
 
 @router.get("/me", response_model=UserResponse)
-async def read_users_me(request: Request, current_user=Depends(get_current_user)):
+async def read_users_me(current_user=Depends(get_current_user), urls: UrlResolver = Depends(get_url_resolver)):
     """
     Get current user profile.
     
@@ -293,14 +291,6 @@ async def read_users_me(request: Request, current_user=Depends(get_current_user)
     Returns:
         UserResponse: Full user profile with all public data
     """
-    # Normalize nested studio.logoUrl to absolute when necessary
-    try:
-        base = str(request.base_url).rstrip('/')
-        if getattr(current_user, 'studio', None) and getattr(current_user.studio, 'logoUrl', None) and str(current_user.studio.logoUrl).startswith('/uploads/'):
-            current_user.studio.logoUrl = f"{base}{current_user.studio.logoUrl}"
-    except Exception:
-        pass
-
     return UserResponse(
         id=current_user.id,
         email=getattr(current_user, 'email', ''),
@@ -311,7 +301,7 @@ async def read_users_me(request: Request, current_user=Depends(get_current_user)
         is_verified=getattr(current_user, 'is_verified', getattr(current_user, 'isVerified', False)),
         created_at=getattr(current_user, 'created_at', getattr(current_user, 'createdAt', now_tr())),
         studioId=getattr(current_user, 'studioId', None),
-        studio=getattr(current_user, 'studio', None),
+        studio=urls.studio(getattr(current_user, 'studio', None)),
     )
 
 
@@ -332,8 +322,10 @@ async def change_password(
     Raises:
         HTTPException 400: If current password is incorrect
     """
-    hashed_password = getattr(current_user, 'hashed_password', getattr(current_user, 'hashedPassword', ''))
-    if not security.verify_password(password_data.current_password, hashed_password):
+    # current_user may come from the user cache, which never holds the hash
+    stored_user = await db.user.find_unique(where={"id": current_user.id})
+    hashed_password = getattr(stored_user, 'hashedPassword', None) or ''
+    if not await security.verify_password_async(password_data.current_password, hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Mevcut şifreniz hatalı"
@@ -2,11 +2,16 @@
 Reservations API Endpoints (Booking endpoints for HotHour auctions)
 """
 
-from fastapi import APIRouter, HTTPException, Depends, status, Query, Request
-from app.models.reservation import ReservationCreate, ReservationResponse
+from datetime import datetime
+from typing import Literal, Optional
+from fastapi import APIRouter, HTTPException, Depends, status, Query
+from app.core.config import settings
+from app.models.reservation import ReservationCreate, ReservationResponse, PaymentStatus
 from app.core.deps import get_current_user
+from app.services.archive_service import archive_service
 from app.services.booking_service import (
     booking_service,
+    RESERVATION_EXPORT_COLUMNS,
     AuctionNotFoundError,
     AuctionNotActiveError,
     AuctionAlreadyBookedError,
@@ -15,6 +20,8 @@ from app.services.booking_service import (
     GenderNotEligibleError,
     BookingError,
 )
+from app.utils.export import export_response
+from app.utils.urls import UrlResolver, get_url_resolver
 
 router = APIRouter(prefix="/api/v1/reservations", tags=["reservations"])
 
@@ -153,12 +160,73 @@ async def get_reservation(
 
 
 @router.get("/admin/all")
-async def get_all_reservations(current_user = Depends(get_current_user)):
+async def get_all_reservations(
+    status_filter: Optional[PaymentStatus] = Query(default=None, alias="status"),
+    studio_id: Optional[int] = Query(default=None),
+    auction_id: Optional[int] = Query(default=None),
+    date_from: Optional[datetime] = Query(default=None),
+    date_to: Optional[datetime] = Query(default=None),
+    search: Optional[str] = Query(default=None, max_length=100),
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    current_user = Depends(get_current_user),
+):
     """
-    Get ALL reservations (Admin only).
-    
+    Get reservations page by page (Admin only), newest first.
+
+    Pass the returned `next_cursor` as `cursor` to fetch the next page.
+    `search` matches booking code, user name or auction title.
+
+    Returns:
+    - 200: {"reservations": [...], "next_cursor": str | null, "count": int,
+            "counts": {...} on the first page}
+    - 400: Invalid cursor
+    - 403: Forbidden (if not admin)
+    """
+    if current_user.role != "ADMIN":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin privileges required"
+        )
+
+    try:
+        return await booking_service.get_all_reservations(
+            status=status_filter.value if status_filter else None,
+            studio_id=studio_id,
+            auction_id=auction_id,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+            cursor=cursor,
+            limit=limit,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+@router.get("/admin/export")
+async def export_reservations(
+    export_format: Literal["csv", "ndjson"] = Query(default="csv", alias="format"),
+    status_filter: Optional[PaymentStatus] = Query(default=None, alias="status"),
+    studio_id: Optional[int] = Query(default=None),
+    auction_id: Optional[int] = Query(default=None),
+    date_from: Optional[datetime] = Query(default=None),
+    date_to: Optional[datetime] = Query(default=None),
+    search: Optional[str] = Query(default=None, max_length=100),
+    current_user = Depends(get_current_user),
+):
+    """
+    Stream every reservation matching the filters as CSV or NDJSON (Admin only).
+
+    Same filters and order as `/admin/all`; rows are read EXPORT_BATCH_SIZE at
+    a time and written as they arrive, so the export size does not affect
+    worker memory.
+
     Returns:
-    - 200: List of reservations with user details
+    - 200: text/csv or application/x-ndjson attachment
     - 403: Forbidden (if not admin)
     """
     if current_user.role != "ADMIN":
@@ -167,8 +235,21 @@ async def get_all_reservations(current_user = Depends(get_current_user)):
             detail="Admin privileges required"
         )
 
-    reservations = await booking_service.get_all_reservations()
-    return reservations
+    async def fetch_page(cursor, limit):
+        return await booking_service.export_page(
+            cursor,
+            limit,
+            status=status_filter.value if status_filter else None,
+            studio_id=studio_id,
+            auction_id=auction_id,
+            date_from=date_from,
+            date_to=date_to,
+            search=search,
+        )
+
+    return export_response(
+        fetch_page, export_format, RESERVATION_EXPORT_COLUMNS, "reservations", settings.EXPORT_BATCH_SIZE
+    )
 
 
 @router.get("/admin/notifications/cancellations")
@@ -289,7 +370,7 @@ async def get_admin_reservation_details(
 
 
 @router.get("/my/all")
-async def get_my_reservations(request: Request, current_user = Depends(get_current_user)):
+async def get_my_reservations(current_user = Depends(get_current_user), urls: UrlResolver = Depends(get_url_resolver)):
     """
     Get all reservations for the current user.
     
@@ -297,18 +378,11 @@ async def get_my_reservations(request: Request, current_user = Depends(get_curre
     - 200: List of reservations
     """
     reservations = await booking_service.get_user_reservations(current_user.id)
-    # Normalize nested studio.logoUrl to absolute when needed
-    try:
-        base = str(request.base_url).rstrip('/')
-        for r in reservations:
-            studio = r.get('studio') if isinstance(r, dict) else None
-            if studio and isinstance(studio, dict):
-                logo = studio.get('logoUrl')
-                if logo and str(logo).startswith('/uploads/'):
-                    studio['logoUrl'] = f"{base}{logo}"
-                    r['studio'] = studio
-    except Exception:
-        pass
+    # Absolute studio logo URLs, without touching the service's dicts
+    reservations = [
+        {**r, "studio": urls.studio(r["studio"])} if isinstance(r, dict) and r.get("studio") else r
+        for r in reservations
+    ]
 
     return {
         "user_id": current_user.id,
@@ -317,6 +391,29 @@ async def get_my_reservations(request: Request, current_user = Depends(get_curre
     }
 
 
+@router.get("/my/history")
+async def get_my_reservation_history(
+    cursor: Optional[str] = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    current_user = Depends(get_current_user),
+):
+    """
+    Get the current user's archived reservations (auctions that ended before
+    the archive retention window), newest first.
+
+    Returns:
+    - 200: {"reservations": [...], "next_cursor": str | null, "count": int}
+    - 400: Invalid cursor
+    """
+    try:
+        return await archive_service.list_user_history(current_user.id, cursor=cursor, limit=limit)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
 @router.delete("/{reservation_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def cancel_reservation(
     reservation_id: int,
@@ -1,19 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
 from pydantic import BaseModel
 from typing import Optional
 import os
-import shutil
-from uuid import uuid4
+from app.core.config import settings
 from app.core.deps import get_current_admin_user
 from app.models.studio import StudioResponse, StudioUpdate
+from app.services.logo_service import logo_service
 from app.services.studio_service import studio_service
+from app.utils.uploads import UnsupportedUploadError, UploadTooLargeError, save_image_upload
+from app.utils.urls import UrlResolver, get_url_resolver
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 @router.get("/me", response_model=StudioResponse)
-async def get_my_studio(request: Request, current_admin = Depends(get_current_admin_user)):
+async def get_my_studio(current_admin = Depends(get_current_admin_user), urls: UrlResolver = Depends(get_url_resolver)):
     """
     Get the studio details for the currently logged-in admin.
     """
@@ -30,17 +32,8 @@ async def get_my_studio(request: Request, current_admin = Depends(get_current_ad
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Stüdyo veritabanında bulunamadı."
             )
-        
-        # Ensure logoUrl is absolute when it is a relative uploads path
-        try:
-            if getattr(studio, 'logoUrl', None) and str(studio.logoUrl).startswith('/uploads/'):
-                base = str(request.base_url).rstrip('/')
-                studio.logoUrl = f"{base}{studio.logoUrl}"
-        except Exception:
-            # If transformation fails, return studio as-is
-            pass
 
-        return studio
+        return urls.studio(studio)
     except Exception as e:
         logger.error(f"Error fetching studio: {e}")
         raise HTTPException(
@@ -49,7 +42,11 @@ async def get_my_studio(request: Request, current_admin = Depends(get_current_ad
         )
 
 @router.put("/me", response_model=StudioResponse)
-async def update_my_studio(request: Request, studio_in: StudioUpdate, current_admin = Depends(get_current_admin_user)):
+async def update_my_studio(
+    studio_in: StudioUpdate,
+    current_admin = Depends(get_current_admin_user),
+    urls: UrlResolver = Depends(get_url_resolver),
+):
     """
     Update the studio details for the currently logged-in admin.
     """
@@ -61,16 +58,7 @@ async def update_my_studio(request: Request, studio_in: StudioUpdate, current_ad
     
     try:
         updated_studio = await studio_service.update_studio(current_admin.studioId, studio_in)
-
-        # Normalize logoUrl to absolute if it's a relative uploads path
-        try:
-            if getattr(updated_studio, 'logoUrl', None) and str(updated_studio.logoUrl).startswith('/uploads/'):
-                base = str(request.base_url).rstrip('/')
-                updated_studio.logoUrl = f"{base}{updated_studio.logoUrl}"
-        except Exception:
-            pass
-
-        return updated_studio
+        return urls.studio(updated_studio)
     except Exception as e:
         logger.error(f"Error updating studio: {e}")
         raise HTTPException(
@@ -80,9 +68,9 @@ async def update_my_studio(request: Request, studio_in: StudioUpdate, current_ad
 
 @router.post("/me/logo", response_model=StudioResponse)
 async def upload_studio_logo(
-    request: Request,
     file: UploadFile = File(...),
-    current_admin=Depends(get_current_admin_user)
+    current_admin=Depends(get_current_admin_user),
+    urls: UrlResolver = Depends(get_url_resolver),
 ):
     """
     Upload a new logo for the studio and update the URL.
@@ -93,45 +81,46 @@ async def upload_studio_logo(
             detail="Size bağlı bir stüdyo olmadığı için yükleme yapamazsınız."
         )
 
-    # Validate file type
-    if not file.content_type.startswith("image/"):
+    invalid_image_detail = "Lütfen geçerli bir görsel dosyası yükleyin (png, jpeg, gif, webp)."
+    # Validate file type (the content itself is checked while saving)
+    if not (file.content_type or "").startswith("image/"):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Lütfen geçerli bir görsel dosyası yükleyin (png, jpeg, vb)."
+            detail=invalid_image_detail
         )
 
     try:
-        # Create uploads directory if it doesn't exist
-        upload_dir = os.path.join(os.getcwd(), 'uploads', 'studios')
-        os.makedirs(upload_dir, exist_ok=True)
-
-        # Generate a unique filename
-        ext = file.filename.split('.')[-1]
-        unique_filename = f"{current_admin.studioId}_{uuid4().hex[:8]}.{ext}"
-        file_path = os.path.join(upload_dir, unique_filename)
-
-        # Save file to disk
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Stream to disk off the event loop; the extension comes from the file's content
+        try:
+            saved = await save_image_upload(
+                file,
+                os.path.join(settings.UPLOADS_DIR, 'studios'),
+                name_prefix=str(current_admin.studioId),
+                max_bytes=settings.LOGO_MAX_BYTES,
+                chunk_size=settings.UPLOAD_CHUNK_BYTES,
+            )
+        except UnsupportedUploadError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=invalid_image_detail
+            )
+        except UploadTooLargeError:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Logo en fazla {settings.LOGO_MAX_BYTES // 1024} KB olabilir."
+            )
 
         # The public URL will be /uploads/studios/filename
-        # Return an absolute URL so frontends served from other origins can load it directly
-        public_path = f"/uploads/studios/{unique_filename}"
-        base = str(request.base_url).rstrip('/')
-        public_url = f"{base}{public_path}"
+        public_path = f"/uploads/studios/{saved.filename}"
 
         # Update studio with the relative path in DB but return absolute URL in response
-        update_data = StudioUpdate(logoUrl=public_path)
-        updated_studio = await studio_service.update_studio(current_admin.studioId, update_data)
-
-        try:
-            # Attach absolute URL for response
-            if getattr(updated_studio, 'logoUrl', None):
-                updated_studio.logoUrl = public_url
-        except Exception:
-            pass
+        updated_studio = await studio_service.set_logo(current_admin.studioId, public_path)
+        # Resized variants are rendered in the background; listings switch to them when ready
+        logo_service.schedule(current_admin.studioId, saved.path, public_path)
 
-        return updated_studio
+        return urls.studio(updated_studio)
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error uploading logo: {e}")
         raise HTTPException(
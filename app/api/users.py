@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
+from app.core.config import settings
 from app.core.deps import get_current_admin_user
 from app.core.db import db
+from app.core.user_cache import user_cache
+from app.services.user_service import USER_EXPORT_COLUMNS, user_service
+from app.utils.export import export_response
 
 router = APIRouter()
 
@@ -32,6 +38,18 @@ async def get_all_users(current_admin = Depends(get_current_admin_user)):
             detail=f"Kullanıcılar getirilirken hata oluştu: {str(e)}"
         )
 
+@router.get("/export")
+async def export_users(
+    export_format: Literal["csv", "ndjson"] = Query(default="csv", alias="format"),
+    role: Optional[str] = Query(default=None),
+    current_admin = Depends(get_current_admin_user),
+):
+    """Tüm kullanıcıları (şifre hash'i olmadan) CSV veya NDJSON olarak akıtır."""
+    async def fetch_page(cursor, limit):
+        return await user_service.export_page(cursor, limit, role=role)
+
+    return export_response(fetch_page, export_format, USER_EXPORT_COLUMNS, "users", settings.EXPORT_BATCH_SIZE)
+
 @router.put("/{user_id}")
 async def update_user(user_id: int, user_in: UserUpdate, current_admin = Depends(get_current_admin_user)):
     try:
@@ -46,6 +64,7 @@ async def update_user(user_id: int, user_in: UserUpdate, current_admin = Depends
             },
             include={"studio": True}
         )
+        await user_cache.invalidate(user_id)
         u_dict = updated_user.model_dump() if hasattr(updated_user, "model_dump") else updated_user.dict() if hasattr(updated_user, "dict") else dict(updated_user)
         u_dict.pop("hashedPassword", None)
         return u_dict
@@ -70,6 +89,7 @@ async def delete_user(user_id: int, current_admin = Depends(get_current_admin_us
             raise HTTPException(status_code=404, detail="Kullanıcı bulunamadı")
 
         await db.user.delete(where={"id": user_id})
+        await user_cache.invalidate(user_id)
         return {"detail": "Kullanıcı başarıyla silindi"}
     except Exception as e:
         raise HTTPException(
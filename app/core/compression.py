@@ -0,0 +1,244 @@
+"""Response compression (gzip, and brotli when installed).
+
+`CompressionMiddleware` encodes JSON/text responses for clients that accept
+it:
+
+- bodies below `COMPRESSION_MIN_BYTES` and already encoded responses (feed
+  snapshots, precompressed `/uploads` sidecars) are passed through;
+- images and other non-text types are never touched;
+- streaming responses (`more_body`) are compressed chunk by chunk with a sync
+  flush after each one, so nothing is buffered and clients see rows as soon
+  as they are produced;
+- complete bodies that carry an `ETag` and are cacheable are compressed once:
+  the encoded bytes are kept in a small LRU keyed by ETag and encoding, so a
+  snapshot served to every visitor (see `app.services.feed_service`) costs a
+  dictionary lookup instead of a compression per request.
+
+Compressed responses get a weak ETag (`W/"..."`), because the encoded bytes
+differ from the identity representation. If-None-Match uses weak comparison,
+so conditional requests keep working.
+"""
+import gzip
+import logging
+import zlib
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Only these are worth compressing; images, archives and fonts already are
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/javascript", "application/x-ndjson",
+                      "image/svg+xml")
+
+
+def accepted_encodings(header: str) -> set:
+    """Content codings from an Accept-Encoding header value, minus those with q=0."""
+    accepted = set()
+    for part in (header or "").split(","):
+        coding, _, params = part.partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if coding.strip():
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def choose_encoding(header: str) -> Optional[str]:
+    """Best coding this server can produce for an Accept-Encoding header value."""
+    accepted = accepted_encodings(header)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL)
+
+
+def weak_etag(etag: str) -> str:
+    return etag if etag.startswith("W/") else f"W/{etag}"
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """If-None-Match check with weak comparison (RFC 9110 13.1.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == tag for candidate in if_none_match.split(","))
+
+
+class _StreamCompressor:
+    """Incremental encoder; each chunk is flushed so the client can decode it right away."""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self._zlib = None
+        else:
+            self._brotli = None
+            self._zlib = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, chunk: bytes, final: bool) -> bytes:
+        if self._brotli is not None:
+            data = self._brotli.process(chunk) if chunk else b""
+            return data + (self._brotli.finish() if final else self._brotli.flush())
+        data = self._zlib.compress(chunk) if chunk else b""
+        return data + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressedBodyCache:
+    """LRU of encoded bodies keyed by (ETag, encoding, length)."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, int], bytes]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> Optional[bytes]:
+        body = self._entries.get(key)
+        if body is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return body
+
+    def put(self, key, body: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = body
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+compressed_body_cache = CompressedBodyCache(settings.COMPRESSION_CACHE_ENTRIES)
+
+
+def _cacheable(headers: Headers) -> bool:
+    cache_control = headers.get("cache-control", "").lower()
+    return "etag" in headers and "no-store" not in cache_control and "private" not in cache_control
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware compressing eligible responses (see module docstring)."""
+
+    def __init__(self, app, minimum_size: Optional[int] = None, cache: Optional[CompressedBodyCache] = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_BYTES if minimum_size is None else minimum_size
+        self.cache = compressed_body_cache if cache is None else cache
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        start_message = None
+        stream: Optional[_StreamCompressor] = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, stream, passthrough
+            message_type = message["type"]
+
+            if message_type == "http.response.start":
+                headers = Headers(raw=message.get("headers", []))
+                media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+                if not media_type.startswith(COMPRESSIBLE_TYPES) or "content-encoding" in headers:
+                    passthrough = True
+                    await send(message)
+                    return
+                if encoding is None or message["status"] in (204, 206, 304):
+                    passthrough = True
+                    MutableHeaders(scope=message).add_vary_header("Accept-Encoding")
+                    await send(message)
+                    return
+                # Headers depend on the first body chunk (size, streaming or not)
+                start_message = message
+                return
+
+            if message_type != "http.response.body" or passthrough:
+                if start_message is not None and message_type == "http.response.pathsend":
+                    # File sent by the server itself: nothing to compress here
+                    await send(start_message)
+                    start_message = None
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if stream is not None:
+                message["body"] = stream.compress(body, final=not more_body)
+                await send(message)
+                return
+
+            headers = MutableHeaders(scope=start_message)
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body and len(body) < self.minimum_size:
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            if more_body:
+                # Streaming response: encode as it goes, length is unknown
+                stream = _StreamCompressor(encoding)
+                message["body"] = stream.compress(body, final=False)
+                if "content-length" in headers:
+                    del headers["content-length"]
+            else:
+                message["body"] = await self._compress_complete(headers, body, encoding)
+                headers["Content-Length"] = str(len(message["body"]))
+
+            headers["Content-Encoding"] = encoding
+            if "etag" in headers:
+                headers["ETag"] = weak_etag(headers["etag"])
+            await send(start_message)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _compress_complete(self, headers: MutableHeaders, body: bytes, encoding: str) -> bytes:
+        key = (headers["etag"], encoding, len(body)) if _cacheable(headers) else None
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        if len(body) >= settings.COMPRESSION_THREAD_MIN_BYTES:
+            # Large bodies would stall the event loop for milliseconds
+            encoded = await anyio.to_thread.run_sync(compress, body, encoding)
+        else:
+            encoded = compress(body, encoding)
+
+        if key is not None:
+            self.cache.put(key, encoded)
+        return encoded
@@ -40,17 +40,117 @@ class Settings(BaseSettings):
     REDIS_URL: str | None = None
     # Key prefix used in Redis for revoked tokens
     REDIS_REVOKED_KEY_PREFIX: str = "revoked_refresh:"
+    # Pub/sub channel announcing newly revoked refresh-token ids to all workers
+    REDIS_REVOKED_CHANNEL: str = "revoked_refresh_events"
+    # Local Bloom filter fronting revocation checks
+    REVOCATION_BLOOM_CAPACITY: int = 100000
+    REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    # Async Redis client: pool size, per-call timeout and circuit breaker
+    REDIS_MAX_CONNECTIONS: int = 20
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = 0.5
+    REDIS_BREAKER_FAILURE_THRESHOLD: int = 3
+    REDIS_BREAKER_RESET_SECONDS: float = 30.0
+
+    # Authenticated user cache (get_current_user)
+    USER_CACHE_TTL_SECONDS: float = 15.0
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    # Share cached users across workers through Redis (requires REDIS_URL)
+    USER_CACHE_REDIS_ENABLED: bool = False
+    REDIS_USER_CACHE_KEY_PREFIX: str = "user_cache:"
+
+    # Logging: root level, "json" or "text", per-logger levels
+    # ("app.core.socket=WARNING") and 1-in-N sampling below WARNING
+    # ("app.core.socket=100")
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"
+    LOG_LEVELS: str = "apscheduler=WARNING"
+    LOG_SAMPLE_RATES: str = "app.core.socket=100"
+
+    # Prometheus-format metrics at /metrics (per worker process)
+    METRICS_ENABLED: bool = True
+    # When set, /metrics requires "Authorization: Bearer <token>"
+    METRICS_TOKEN: str | None = None
+    # Per-request DB query budget; requests above it (or repeating one
+    # model/operation this often, i.e. N+1) are logged as warnings
+    DB_QUERY_BUDGET: int = 25
+    DB_N_PLUS_ONE_THRESHOLD: int = 10
+    # Event-loop monitor: lag probe interval, stall threshold for the
+    # blocking-stack watchdog, and asyncio debug mode for slow callbacks
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.5
+    LOOP_LAG_WARN_SECONDS: float = 0.2
+    LOOP_MONITOR_DEBUG: bool = False
+    LOOP_SLOW_CALLBACK_SECONDS: float = 0.1
+
+    # Password hashing runs in a thread pool so pbkdf2 never blocks the event loop
+    PASSWORD_HASH_WORKERS: int = 4
+    # Log a warning when more hash jobs than this are waiting for a worker
+    PASSWORD_HASH_QUEUE_WARN: int = 32
+
+    # Large list endpoints encode trusted service data straight to JSON bytes
+    # instead of validating each item into its response model first
+    FAST_RESPONSE_SERIALIZATION: bool = True
+    # Rows per database query for streaming CSV/NDJSON admin exports
+    EXPORT_BATCH_SIZE: int = 500
+    # Finished auctions (with reservations/notifications) move to the archive
+    # tables ARCHIVE_RETENTION_DAYS after their endTime; daily scheduler job
+    ARCHIVE_ENABLED: bool = True
+    ARCHIVE_RETENTION_DAYS: int = 90
+    ARCHIVE_BATCH_SIZE: int = 200
+    # Public feed snapshot (/api/v1/auctions/feed): rebuilt after auction
+    # writes, and at the latest after this many seconds (writes from other
+    # workers)
+    FEED_SNAPSHOT_MAX_AGE_SECONDS: float = 30
+    # Snapshots are kept per base URL; without PUBLIC_BASE_URL that is the
+    # client-supplied Host, so only this many are kept (least recently used out)
+    FEED_SNAPSHOT_MAX_HOSTS: int = 8
+    # gzip/brotli for JSON and text responses of at least COMPRESSION_MIN_BYTES;
+    # bodies with an ETag are compressed once and reused from a small LRU
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_BYTES: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_CACHE_ENTRIES: int = 32
+    # Larger complete bodies are compressed in a worker thread
+    COMPRESSION_THREAD_MIN_BYTES: int = 131072
+
+    # Uploaded files (served at /uploads); logos are streamed to disk in
+    # UPLOAD_CHUNK_BYTES steps and rejected beyond LOGO_MAX_BYTES (from
+    # Content-Length before the body is read, when the client sends it)
+    UPLOADS_DIR: str = "uploads"
+    # Public origin used for absolute /uploads URLs in responses (e.g. a CDN);
+    # defaults to the request's base URL
+    PUBLIC_BASE_URL: str | None = None
+    LOGO_MAX_BYTES: int = 2 * 1024 * 1024
+    UPLOAD_CHUNK_BYTES: int = 64 * 1024
+    # Cache-Control max-age for content-hashed upload names (immutable) and
+    # for anything else under /uploads
+    UPLOADS_IMMUTABLE_MAX_AGE: int = 31536000
+    UPLOADS_MAX_AGE: int = 3600
+    # Resized WebP logo variants (thumb/card/full) rendered in a process pool
+    # after each upload; needs the optional Pillow extra (requirements-images.txt),
+    # otherwise the original is served
+    LOGO_PIPELINE_ENABLED: bool = True
+    LOGO_PIPELINE_WORKERS: int = 2
+    LOGO_VARIANT_QUALITY: int = 80
 
     # Email
     SMTP_HOST: str | None = None
     SMTP_PORT: int | None = None
     SMTP_user: str | None = None
     SMTP_PASSWORD: str | None = None
+    # Disable for plain-text local SMTP sinks such as Mailpit
+    SMTP_STARTTLS: bool = True
+    # Persistent SMTP connections shared between messages
+    SMTP_POOL_SIZE: int = 4
+    SMTP_KEEPALIVE_SECONDS: float = 60.0
+    SMTP_POOL_IDLE_TIMEOUT_SECONDS: float = 240.0
     GMAIL_API_ENABLED: bool = False
     GMAIL_CLIENT_ID: str | None = None
     GMAIL_CLIENT_SECRET: str | None = None
     GMAIL_REFRESH_TOKEN: str | None = None
     GMAIL_SENDER_EMAIL: str | None = None
+    # Refresh the cached Gmail access token this long before it expires
+    GMAIL_TOKEN_REFRESH_MARGIN_SECONDS: float = 300.0
     EMAILS_FROM_EMAIL: str | None = None
     EMAILS_FROM_NAME: str | None = None
 
@@ -64,6 +164,15 @@ class Settings(BaseSettings):
     EMAIL_TEMPLATES_DIR: str = "app/email-templates/build"
     EMAILS_ENABLED: bool = False
 
+    # Email outbox delivery worker (scripts/email_worker.py)
+    EMAIL_OUTBOX_BATCH_SIZE: int = 20
+    EMAIL_OUTBOX_POLL_SECONDS: float = 5.0
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 6
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: float = 30.0
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS: float = 3600.0
+    # SENDING rows older than this are treated as orphaned by a crashed worker
+    EMAIL_OUTBOX_LOCK_TIMEOUT_SECONDS: float = 300.0
+
     @validator("EMAILS_ENABLED", pre=True)
     def get_emails_enabled(cls, v: bool | str, values: dict[str, any]) -> bool:
         smtp_ready = bool(values.get("SMTP_HOST") and values.get("SMTP_PORT") and values.get("EMAILS_FROM_EMAIL"))
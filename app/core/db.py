@@ -2,10 +2,12 @@
 When running tests or when `ENABLE_FAKE_PRISMA` is set, use a lightweight
 in-memory fake Prisma suitable for local tests (no external deps).
 """
+import asyncio
 import os
 import sys
-from datetime import datetime
-from app.core.timezone import TR_TIMEZONE, now_tr
+import time
+from app.core.metrics import DB_QUERY_DURATION, DB_QUERY_ERRORS
+from app.core.query_tracker import record_query
 
 # Detect test environment (pytest sets `PYTEST_CURRENT_TEST`) or explicit env var.
 _force_fake = os.getenv("ENABLE_FAKE_PRISMA", "").lower() in ("1", "true", "yes")
@@ -32,196 +34,8 @@ if not _use_fake:
         _use_fake = True
 
 if _use_fake:
-    # Fallback fake Prisma
-    class _Record:
-        def __init__(self, **kwargs):
-            # mirror provided keys as attributes
-            for k, v in kwargs.items():
-                setattr(self, k, v)
-            # ensure common user/auction fields exist with sensible defaults
-            if not hasattr(self, "isVerified"):
-                setattr(self, "isVerified", False)
-            if not hasattr(self, "role"):
-                setattr(self, "role", "USER")
-            if not hasattr(self, "updatedAt"):
-                setattr(self, "updatedAt", now_tr())
-            if not hasattr(self, "createdAt"):
-                setattr(self, "createdAt", now_tr())
-            if not hasattr(self, "status"):
-                setattr(self, "status", "ACTIVE")
-            if not hasattr(self, "studioId"):
-                setattr(self, "studioId", None)
-            if hasattr(self, "fullName") and not hasattr(self, "firstName"):
-                parts = str(self.fullName).split(" ", 1)
-                setattr(self, "firstName", parts[0])
-                setattr(self, "lastName", parts[1] if len(parts) > 1 else "")
-
-        def dict(self):
-            return self.__dict__
-
-    class _Model:
-        def __init__(self):
-            self._data = {}
-            self._next_id = 1
-
-        def _matches_where(self, item, where):
-            for key, value in where.items():
-                if isinstance(value, dict) and "in" in value:
-                    if item.get(key) not in value.get("in", []):
-                        return False
-                else:
-                    if item.get(key) != value:
-                        return False
-            return True
-
-        async def create(self, *, data, include=None):
-            obj = dict(data)
-            obj_id = obj.get("id") or self._next_id
-            obj["id"] = obj_id
-            obj.setdefault("createdAt", now_tr())
-            self._data[obj_id] = obj
-            self._next_id = max(self._next_id, obj_id + 1)
-            return _Record(**obj)
-
-        async def find_many(self, *, where=None, include=None, order=None, take=None):
-            records = list(self._data.values())
-            if where:
-                records = [
-                    item for item in records
-                    if self._matches_where(item, where)
-                ]
-
-            if order and order.get("createdAt") == "desc":
-                records.sort(key=lambda item: item.get("createdAt") or datetime.min.replace(tzinfo=TR_TIMEZONE), reverse=True)
-            elif order and order.get("createdAt") == "asc":
-                records.sort(key=lambda item: item.get("createdAt") or datetime.min.replace(tzinfo=TR_TIMEZONE))
-
-            if isinstance(take, int) and take >= 0:
-                records = records[:take]
-
-            return [_Record(**value) for value in records]
-
-        async def count(self, *, where=None):
-            records = await self.find_many(where=where)
-            return len(records)
-
-        async def find_unique(self, *, where, include=None):
-            # support where by id or email
-            if "id" in where:
-                _id = where.get("id")
-                v = self._data.get(_id)
-                return _Record(**v) if v is not None else None
-            if "email" in where:
-                for v in self._data.values():
-                    if v.get("email") == where.get("email"):
-                        return _Record(**v)
-            if "bookingCode" in where:
-                for v in self._data.values():
-                    if v.get("bookingCode") == where.get("bookingCode"):
-                        return _Record(**v)
-            return None
-
-        async def delete(self, *, where):
-            # support delete by id or email
-            if "id" in where:
-                _id = where.get("id")
-                return self._data.pop(_id, None)
-            if "email" in where:
-                for k, v in list(self._data.items()):
-                    if v.get("email") == where.get("email"):
-                        return self._data.pop(k, None)
-            return None
-
-        async def delete_many(self, *, where=None):
-            keys = list(self._data.keys())
-            deleted = 0
-            for key in keys:
-                item = self._data.get(key)
-                if item is None:
-                    continue
-                if where is None or self._matches_where(item, where):
-                    del self._data[key]
-                    deleted += 1
-            return {"count": deleted}
-
-        async def update(self, *, where, data, include=None):
-            target_id = None
-
-            if "id" in where:
-                if where.get("id") in self._data:
-                    target_id = where.get("id")
-            elif "email" in where:
-                for record_id, record in self._data.items():
-                    if record.get("email") == where.get("email"):
-                        target_id = record_id
-                        break
-
-            if target_id is None:
-                return None
-
-            self._data[target_id].update(dict(data))
-            return _Record(**self._data[target_id])
-
-    class _ReservationModel(_Model):
-        def __init__(self, prisma_ref):
-            super().__init__()
-            self._prisma_ref = prisma_ref
-
-        async def create(self, *, data, include=None):
-            auction_id = data.get("auctionId")
-            if auction_id is not None:
-                for existing in self._data.values():
-                    if existing.get("auctionId") == auction_id:
-                        raise Exception("Unique constraint failed on fields: (`auctionId`)")
-
-            obj = dict(data)
-            now = now_tr()
-            obj.setdefault("reservedAt", now)
-            obj.setdefault("createdAt", now)
-            return await super().create(data=obj)
-
-        async def find_many(self, *, where=None, include=None, order=None, take=None):
-            records = list(self._data.values())
-            if where:
-                records = [
-                    item for item in records
-                    if all(item.get(key) == value for key, value in where.items())
-                ]
-
-            if order and order.get("createdAt") == "desc":
-                records.sort(key=lambda item: item.get("createdAt") or datetime.min.replace(tzinfo=TR_TIMEZONE), reverse=True)
-            if order and order.get("reservedAt") == "desc":
-                records.sort(key=lambda item: item.get("reservedAt") or datetime.min.replace(tzinfo=TR_TIMEZONE), reverse=True)
-
-            if isinstance(take, int) and take >= 0:
-                records = records[:take]
-
-            response = []
-            for item in records:
-                row = dict(item)
-                if include and include.get("auction"):
-                    row["auction"] = await self._prisma_ref.auction.find_unique(where={"id": row.get("auctionId")})
-                if include and include.get("user"):
-                    row["user"] = await self._prisma_ref.user.find_unique(where={"id": row.get("userId")})
-                response.append(_Record(**row))
-            return response
-
-    class FakePrisma:
-        def __init__(self):
-            self.user = _Model()
-            self.studio = _Model()
-            self.auction = _Model()
-            self.reservation = _ReservationModel(self)
-            self.notification = _Model()
-
-        def is_connected(self):
-            return True
-
-        async def connect(self):
-            return None
-
-        async def disconnect(self):
-            return None
+    # Fallback fake Prisma (indexed in-memory store, see app/core/fake_prisma.py)
+    from app.core.fake_prisma import FakePrisma
 
     db = FakePrisma()
 
@@ -230,3 +44,80 @@ if _use_fake:
 
     async def disconnect_db():
         return None
+
+
+# Delegate methods that change rows; successful calls notify write listeners
+WRITE_METHODS = frozenset(
+    ("create", "create_many", "update", "update_many", "upsert", "delete", "delete_many")
+)
+
+
+class InstrumentedModel:
+    """Proxy around a Prisma model delegate timing every async call."""
+
+    def __init__(self, model, model_name: str):
+        self._model = model
+        self._model_name = model_name
+        self._wrapped = {}
+        self._write_listeners = []
+
+    def __getattr__(self, name):
+        attr = getattr(self._model, name)
+        if name.startswith("_") or not asyncio.iscoroutinefunction(attr):
+            return attr
+        wrapped = self._wrapped.get(name)
+        if wrapped is None or wrapped.__wrapped__ != attr:
+            model_name = self._model_name
+            histogram = DB_QUERY_DURATION.labels(model_name, name)
+            errors = DB_QUERY_ERRORS.labels(model_name, name)
+            listeners = self._write_listeners if name in WRITE_METHODS else ()
+
+            async def wrapped(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    result = await attr(*args, **kwargs)
+                    for listener in listeners:
+                        listener(model_name, name)
+                    return result
+                except Exception:
+                    errors.inc()
+                    raise
+                finally:
+                    elapsed = time.perf_counter() - started
+                    histogram.observe(elapsed)
+                    record_query(model_name, name, elapsed)
+
+            wrapped.__wrapped__ = attr
+            self._wrapped[name] = wrapped
+        return wrapped
+
+
+class InstrumentedPrisma:
+    """
+    Proxy around the Prisma client: model delegates are wrapped so every call
+    is timed for /metrics and counted against the current request's query
+    budget (app.core.query_tracker), and writes are reported to listeners
+    registered with `add_write_listener` (cache invalidation). Everything
+    else passes through.
+    """
+
+    def __init__(self, client, model_names):
+        self._client = client
+        self._models = {name: InstrumentedModel(getattr(client, name), name) for name in model_names}
+
+    def __getattr__(self, name):
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        return getattr(self._client, name)
+
+    def add_write_listener(self, listener, models) -> None:
+        """Call `listener(model_name, method)` after every successful write to `models`."""
+        for name in models:
+            self._models[name]._write_listeners.append(listener)
+
+
+db = InstrumentedPrisma(db, (
+    "user", "studio", "auction", "reservation", "notification", "emailoutbox",
+    "archivedauction", "archivedreservation", "archivednotification",
+))
@@ -3,6 +3,7 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from app.core.config import settings
 from app.core.db import db
+from app.core.user_cache import user_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
@@ -15,12 +16,18 @@ async def get_current_user(token: str = Depends(oauth2_scheme)):
     except JWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
+    user_id = int(sub)
+    user = await user_cache.get(user_id)
+    if user is not None:
+        return user
+
     user = await db.user.find_unique(
-        where={"id": int(sub)},
+        where={"id": user_id},
         include={"studio": True}
     )
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+    await user_cache.set(user_id, user)
     return user
 
 async def get_current_admin_user(current_user=Depends(get_current_user)):
@@ -0,0 +1,145 @@
+"""Precompiled email templates.
+
+Templates live in `EMAIL_TEMPLATES_DIR` as HTML files with `${name}`
+placeholders. Each template's body is inlined into `_layout.html` and split
+once into static fragments and variable slots. Values that only depend on
+settings (project name, frontend URL, ...) are substituted at compile time,
+so rendering a message only joins the cached fragments with the per-message
+values. Values substituted into the HTML body are escaped.
+"""
+import html
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from app.core.config import settings
+
+_PLACEHOLDER = re.compile(r"\$\{(\w+)\}")
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+_LAYOUT_FILE = "_layout.html"
+
+
+@dataclass(frozen=True)
+class TemplateDefinition:
+    filename: str
+    subject: str
+    header_title: str
+    header_subtitle: str
+
+
+TEMPLATE_DEFINITIONS: Dict[str, TemplateDefinition] = {
+    "verification": TemplateDefinition(
+        filename="verification.html",
+        subject="🔥 ${display_project_name} - Arenaya Giriş İçin Son Bir Adım",
+        header_title="Arenaya Hoş Geldin",
+        header_subtitle="Son Bir Adım Kaldı",
+    ),
+    "booking_confirmation": TemplateDefinition(
+        filename="booking_confirmation.html",
+        subject="✅ ${display_project_name} - Rezervasyonun Onaylandı (${booking_code})",
+        header_title="Yerin Ayrıldı",
+        header_subtitle="Rezervasyon Onayı",
+    ),
+    "reservation_cancelled": TemplateDefinition(
+        filename="reservation_cancelled.html",
+        subject="${display_project_name} - Rezervasyonun İptal Edildi (${booking_code})",
+        header_title="Rezervasyon İptal Edildi",
+        header_subtitle="Bilgilendirme",
+    ),
+}
+
+
+class CompiledTemplate:
+    """A template split into static strings and variable names: parts[i] is str or (name,)."""
+
+    def __init__(self, source: str, static_values: Dict[str, str], escape: bool = True):
+        self._escape = html.escape if escape else str
+        parts: List[Union[str, Tuple[str]]] = []
+        position = 0
+        for match in _PLACEHOLDER.finditer(source):
+            parts.append(source[position:match.start()])
+            name = match.group(1)
+            if name in static_values:
+                parts.append(self._escape(static_values[name]))
+            else:
+                parts.append((name,))
+            position = match.end()
+        parts.append(source[position:])
+
+        # Merge neighbouring static strings so rendering joins as few pieces as possible
+        merged: List[Union[str, Tuple[str]]] = []
+        for part in parts:
+            if isinstance(part, str) and merged and isinstance(merged[-1], str):
+                merged[-1] += part
+            elif part != "":
+                merged.append(part)
+        self.parts = merged
+        self.variables = {part[0] for part in merged if isinstance(part, tuple)}
+
+    def render(self, context: Dict[str, object]) -> str:
+        missing = self.variables - context.keys()
+        if missing:
+            raise KeyError(f"Email template variables missing: {', '.join(sorted(missing))}")
+        return "".join(
+            part if isinstance(part, str) else self._escape(str(context[part[0]]))
+            for part in self.parts
+        )
+
+
+def _static_values() -> Dict[str, str]:
+    project_name = settings.PROJECT_NAME
+    display_project_name = project_name.replace(" Core", "").replace("Core ", "").replace("Core", "").strip()
+    return {
+        "project_name": project_name,
+        "display_project_name": display_project_name,
+        "frontend_url": settings.FRONTEND_URL,
+    }
+
+
+class EmailTemplateRegistry:
+    """Loads and compiles every template once; recompiles only if the settings-derived values change."""
+
+    def __init__(self, templates_dir: str, definitions: Dict[str, TemplateDefinition]):
+        path = Path(templates_dir)
+        self.templates_dir = path if path.is_absolute() else _PROJECT_ROOT / path
+        self.definitions = definitions
+        self._compiled: Dict[str, Tuple[CompiledTemplate, CompiledTemplate]] = {}
+        self._static_key: Optional[Tuple[Tuple[str, str], ...]] = None
+
+    def load(self) -> None:
+        static_values = _static_values()
+        layout = (self.templates_dir / _LAYOUT_FILE).read_text(encoding="utf-8")
+        compiled = {}
+        for name, definition in self.definitions.items():
+            body = (self.templates_dir / definition.filename).read_text(encoding="utf-8")
+            body = "\n".join(
+                f"            {line}" if line and index else line
+                for index, line in enumerate(body.rstrip("\n").split("\n"))
+            )
+            page = (
+                layout.replace("${header_title}", html.escape(definition.header_title))
+                .replace("${header_subtitle}", html.escape(definition.header_subtitle))
+                .replace("${content}", body)
+            )
+            compiled[name] = (
+                CompiledTemplate(definition.subject, static_values, escape=False),
+                CompiledTemplate(page, static_values),
+            )
+        self._compiled = compiled
+        self._static_key = tuple(sorted(static_values.items()))
+
+    def render(self, name: str, **context) -> Tuple[str, str]:
+        """
+        Render a template.
+
+        Returns:
+            (subject, html); the subject is plain text and not HTML-escaped
+        """
+        if self._static_key != tuple(sorted(_static_values().items())):
+            self.load()
+        subject, page = self._compiled[name]
+        return subject.render(context), page.render(context)
+
+
+email_templates = EmailTemplateRegistry(settings.EMAIL_TEMPLATES_DIR, TEMPLATE_DEFINITIONS)
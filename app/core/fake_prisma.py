@@ -0,0 +1,390 @@
+"""In-memory stand-in for `prisma.Prisma`, used by tests and benchmarks.
+
+Each model keeps rows in insertion order plus hash indexes:
+
+- unique indexes (the schema's @unique fields) enforce constraints and serve
+  `find_unique` and equality filters in O(1)
+- secondary indexes (status, auctionId, userId, ...) narrow `find_many`,
+  `count`, `update_many` and `delete_many` to the matching rows before the
+  remaining filters are applied
+
+Rows handed out are copies (copy-on-read), and rows stored are copies of the
+input data, so callers can never mutate the store behind its indexes' back.
+That keeps the fake faithful enough for 100k-row benchmarks.
+"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set
+
+from app.core.timezone import now_tr
+
+
+class _Record:
+    def __init__(self, **kwargs):
+        # mirror provided keys as attributes
+        for k, v in kwargs.items():
+            setattr(self, k, v)
+        # ensure common user/auction fields exist with sensible defaults
+        if not hasattr(self, "isVerified"):
+            setattr(self, "isVerified", False)
+        if not hasattr(self, "role"):
+            setattr(self, "role", "USER")
+        if not hasattr(self, "updatedAt"):
+            setattr(self, "updatedAt", now_tr())
+        if not hasattr(self, "createdAt"):
+            setattr(self, "createdAt", now_tr())
+        if not hasattr(self, "status"):
+            setattr(self, "status", "ACTIVE")
+        if not hasattr(self, "studioId"):
+            setattr(self, "studioId", None)
+        if hasattr(self, "fullName") and not hasattr(self, "firstName"):
+            parts = str(self.fullName).split(" ", 1)
+            setattr(self, "firstName", parts[0])
+            setattr(self, "lastName", parts[1] if len(parts) > 1 else "")
+
+    def dict(self):
+        return self.__dict__
+
+
+def _copy_row(row: dict) -> dict:
+    # Rows hold scalars plus the odd JSON list/dict; copy those one level deep
+    return {key: list(value) if isinstance(value, list) else dict(value) if isinstance(value, dict) else value
+            for key, value in row.items()}
+
+
+_COMPARISONS = (
+    ("lt", lambda a, b: a < b),
+    ("lte", lambda a, b: a <= b),
+    ("gt", lambda a, b: a > b),
+    ("gte", lambda a, b: a >= b),
+)
+
+
+class _Model:
+    def __init__(self, unique_fields: Iterable[str] = (), indexed_fields: Iterable[str] = ()):
+        self._unique_fields = tuple(unique_fields)
+        self._indexed_fields = tuple(indexed_fields)
+        # relation name -> (callable returning the related model, foreign key field)
+        self._relations: Dict[str, tuple] = {}
+        self._clear()
+
+    def _clear(self) -> None:
+        self._data: Dict[int, dict] = {}
+        self._next_id = 1
+        self._unique: Dict[str, Dict[object, int]] = {field: {} for field in self._unique_fields}
+        self._indexes: Dict[str, Dict[object, Set[int]]] = {field: defaultdict(set) for field in self._indexed_fields}
+        # Insertion sequence, so index lookups keep the unordered find_many order
+        self._sequence: Dict[int, int] = {}
+        self._next_sequence = 0
+
+    # ── indexes ────────────────────────────────────────────────
+
+    def _check_unique(self, row: dict, row_id: Optional[int] = None) -> None:
+        for field, index in self._unique.items():
+            value = row.get(field)
+            if value is None:
+                continue
+            owner = index.get(value)
+            if owner is not None and owner != row_id:
+                raise Exception(f"Unique constraint failed on fields: (`{field}`)")
+
+    def _index(self, row_id: int, row: dict) -> None:
+        for field, index in self._unique.items():
+            if row.get(field) is not None:
+                index[row[field]] = row_id
+        for field, index in self._indexes.items():
+            index[row.get(field)].add(row_id)
+
+    def _unindex(self, row_id: int, row: dict) -> None:
+        for field, index in self._unique.items():
+            if row.get(field) is not None and index.get(row[field]) == row_id:
+                del index[row[field]]
+        for field, index in self._indexes.items():
+            ids = index.get(row.get(field))
+            if ids is not None:
+                ids.discard(row_id)
+                if not ids:
+                    del index[row.get(field)]
+
+    def _lookup(self, field: str, value) -> Optional[Set[int]]:
+        """Ids whose `field` equals `value`, or None if `field` is not indexed."""
+        if field == "id":
+            return {value} if value in self._data else set()
+        if field in self._unique:
+            row_id = self._unique[field].get(value)
+            return {row_id} if row_id is not None else set()
+        if field in self._indexes:
+            return set(self._indexes[field].get(value, ()))
+        return None
+
+    def _candidate_ids(self, where: Optional[dict]) -> Optional[Set[int]]:
+        """Smallest id set the indexes can prove contains every match; None means full scan."""
+        if not where:
+            return None
+        best: Optional[Set[int]] = None
+        for key, value in where.items():
+            candidates = None
+            if key == "AND":
+                for clause in value:
+                    clause_ids = self._candidate_ids(clause)
+                    if clause_ids is not None and (candidates is None or len(clause_ids) < len(candidates)):
+                        candidates = clause_ids
+            elif key == "OR":
+                continue
+            elif isinstance(value, dict):
+                if "equals" in value:
+                    candidates = self._lookup(key, value["equals"])
+                elif "in" in value:
+                    found: Set[int] = set()
+                    for item in value["in"]:
+                        ids = self._lookup(key, item)
+                        if ids is None:
+                            found = None
+                            break
+                        found |= ids
+                    candidates = found
+            else:
+                candidates = self._lookup(key, value)
+            if candidates is not None and (best is None or len(candidates) < len(best)):
+                best = candidates
+                if not best:
+                    break
+        return best
+
+    def _matching_rows(self, where: Optional[dict]) -> List[dict]:
+        candidates = self._candidate_ids(where)
+        if candidates is None:
+            rows = self._data.values()
+        else:
+            rows = (self._data[row_id] for row_id in sorted(candidates, key=self._sequence.__getitem__))
+        if not where:
+            return list(rows)
+        return [row for row in rows if self._matches_where(row, where)]
+
+    # ── filtering / ordering ───────────────────────────────────
+
+    def _matches_where(self, item, where):
+        for key, value in where.items():
+            if key == "OR":
+                if not any(self._matches_where(item, clause) for clause in value):
+                    return False
+            elif key == "AND":
+                if not all(self._matches_where(item, clause) for clause in value):
+                    return False
+            elif key == "NOT":
+                clauses = value if isinstance(value, list) else [value]
+                if any(self._matches_where(item, clause) for clause in clauses):
+                    return False
+            elif key in self._relations and isinstance(value, dict):
+                # Relation filter: {"auction": {"is": {...}}}
+                related_model, foreign_key = self._relations[key]
+                model = related_model()
+                related = model._data.get(item.get(foreign_key))
+                if related is None or not model._matches_where(related, value.get("is") or {}):
+                    return False
+            elif isinstance(value, dict):
+                current = item.get(key)
+                if "contains" in value:
+                    needle, haystack = value["contains"], current or ""
+                    if value.get("mode") == "insensitive":
+                        needle, haystack = needle.lower(), haystack.lower()
+                    if needle not in haystack:
+                        return False
+                if "in" in value and current not in value.get("in", []):
+                    return False
+                if "not_in" in value and current in value["not_in"]:
+                    return False
+                if "equals" in value and current != value["equals"]:
+                    return False
+                if "not" in value and current == value["not"]:
+                    return False
+                for op, compare in _COMPARISONS:
+                    if op in value and (current is None or not compare(current, value[op])):
+                        return False
+            else:
+                if item.get(key) != value:
+                    return False
+        return True
+
+    def _sort_records(self, records, order):
+        # Prisma accepts a single {"field": "asc|desc"} dict or a list of them;
+        # apply the least significant key first so the sort stays stable.
+        # Any field can be used; NULLs sort first ascending, last descending.
+        if not order:
+            return records
+        clauses = order if isinstance(order, list) else [order]
+        for clause in reversed(clauses):
+            for field, direction in clause.items():
+                records.sort(
+                    key=lambda item: (item.get(field) is not None, item.get(field) if item.get(field) is not None else 0),
+                    reverse=str(direction).lower() == "desc",
+                )
+        return records
+
+    def _record(self, row: dict, include=None) -> _Record:
+        return _Record(**_copy_row(row))
+
+    # ── writes ─────────────────────────────────────────────────
+
+    def _insert(self, data: dict) -> dict:
+        obj = _copy_row(data)
+        obj_id = obj.get("id") or self._next_id
+        if obj_id in self._data:
+            raise Exception("Unique constraint failed on fields: (`id`)")
+        obj["id"] = obj_id
+        obj.setdefault("createdAt", now_tr())
+        self._check_unique(obj)
+        self._data[obj_id] = obj
+        self._sequence[obj_id] = self._next_sequence
+        self._next_sequence += 1
+        self._index(obj_id, obj)
+        self._next_id = max(self._next_id, obj_id + 1)
+        return obj
+
+    def _apply_update(self, row: dict, data: dict) -> None:
+        changes = _copy_row(data)
+        updated = {**row, **changes}
+        self._check_unique(updated, row["id"])
+        self._unindex(row["id"], row)
+        row.update(changes)
+        self._index(row["id"], row)
+
+    def _remove(self, row_id: int) -> Optional[dict]:
+        row = self._data.pop(row_id, None)
+        if row is not None:
+            self._unindex(row_id, row)
+            del self._sequence[row_id]
+        return row
+
+    def _unique_row(self, where: dict) -> Optional[dict]:
+        for field, value in where.items():
+            ids = self._lookup(field, value)
+            if ids is not None:
+                row_id = next(iter(ids), None)
+                return self._data.get(row_id) if row_id is not None else None
+        rows = self._matching_rows(where)
+        return rows[0] if rows else None
+
+    # ── Prisma API ─────────────────────────────────────────────
+
+    async def create(self, *, data, include=None):
+        return self._record(self._insert(data), include)
+
+    async def create_many(self, *, data, skip_duplicates=False):
+        created = 0
+        for item in data:
+            try:
+                self._insert(item)
+            except Exception:
+                if not skip_duplicates:
+                    raise
+                continue
+            created += 1
+        return created
+
+    async def find_many(self, *, where=None, include=None, order=None, take=None, skip=None):
+        records = self._matching_rows(where)
+
+        self._sort_records(records, order)
+
+        if isinstance(skip, int) and skip > 0:
+            records = records[skip:]
+        if isinstance(take, int) and take >= 0:
+            records = records[:take]
+
+        return [self._record(value, include) for value in records]
+
+    async def find_first(self, *, where=None, include=None, order=None):
+        records = await self.find_many(where=where, include=include, order=order, take=1)
+        return records[0] if records else None
+
+    async def count(self, *, where=None):
+        if not where:
+            return len(self._data)
+        return len(self._matching_rows(where))
+
+    async def find_unique(self, *, where, include=None):
+        row = self._unique_row(where)
+        return self._record(row, include) if row is not None else None
+
+    async def delete(self, *, where):
+        row = self._unique_row(where)
+        if row is None:
+            return None
+        return self._record(self._remove(row["id"]))
+
+    async def delete_many(self, *, where=None):
+        deleted = 0
+        for row in self._matching_rows(where):
+            self._remove(row["id"])
+            deleted += 1
+        return {"count": deleted}
+
+    async def update_many(self, *, where, data):
+        updated = 0
+        for row in self._matching_rows(where):
+            self._apply_update(row, data)
+            updated += 1
+        return updated
+
+    async def update(self, *, where, data, include=None):
+        row = self._unique_row(where)
+        if row is None:
+            return None
+        self._apply_update(row, data)
+        return self._record(row, include)
+
+
+class _ReservationModel(_Model):
+    def __init__(self, prisma_ref):
+        super().__init__(unique_fields=("auctionId", "bookingCode"), indexed_fields=("status", "userId"))
+        self._prisma_ref = prisma_ref
+        self._relations = {
+            "auction": (lambda: prisma_ref.auction, "auctionId"),
+            "user": (lambda: prisma_ref.user, "userId"),
+        }
+
+    async def create(self, *, data, include=None):
+        obj = dict(data)
+        now = now_tr()
+        obj.setdefault("reservedAt", now)
+        obj.setdefault("createdAt", now)
+        return await super().create(data=obj)
+
+    async def find_many(self, *, where=None, include=None, order=None, take=None, skip=None):
+        records = await super().find_many(where=where, order=order, take=take, skip=skip)
+        if not include:
+            return records
+        for record in records:
+            if include.get("auction"):
+                record.auction = await self._prisma_ref.auction.find_unique(where={"id": record.auctionId})
+            if include.get("user"):
+                record.user = await self._prisma_ref.user.find_unique(where={"id": record.userId})
+        return records
+
+
+class FakePrisma:
+    def __init__(self):
+        self.user = _Model(unique_fields=("email", "phone"), indexed_fields=("role", "studioId"))
+        self.studio = _Model()
+        self.auction = _Model(indexed_fields=("status", "studioId"))
+        self.reservation = _ReservationModel(self)
+        self.notification = _Model(indexed_fields=("userId", "auctionId", "reservationId"))
+        self.emailoutbox = _Model(indexed_fields=("status", "toEmail"))
+        self.archivedauction = _Model(indexed_fields=("studioId",))
+        self.archivedreservation = _Model(unique_fields=("auctionId", "bookingCode"), indexed_fields=("userId",))
+        self.archivednotification = _Model(indexed_fields=("auctionId",))
+
+    def reset(self) -> None:
+        """Drop every row in place (model objects stay the same, so proxies keep working)."""
+        for model in (self.user, self.studio, self.auction, self.reservation, self.notification, self.emailoutbox,
+                      self.archivedauction, self.archivedreservation, self.archivednotification):
+            model._clear()
+
+    def is_connected(self):
+        return True
+
+    async def connect(self):
+        return None
+
+    async def disconnect(self):
+        return None
@@ -0,0 +1,183 @@
+"""Event-loop lag and blocking-call monitor.
+
+FastAPI and Socket.IO share one event loop per worker, so any synchronous
+call (blocking Redis, pbkdf2, file copies, heavy logging) stalls every
+request and socket at once. The monitor has two parts:
+
+- A probe task sleeps `interval` seconds and records how late it woke up
+  (lag gauge/histogram at /metrics, summary in /health).
+- A watchdog thread checks the probe's heartbeat. When the loop has not
+  responded for `stall_threshold` seconds it logs the loop thread's current
+  stack, which points at the blocking call while it is still running.
+
+With `debug=True` asyncio debug mode is enabled as well, and callbacks slower
+than `slow_callback_duration` are counted and kept (with asyncio's report,
+which includes where the callback was created) in `recent_slow_callbacks`.
+Debug mode adds overhead; use it while hunting a culprit, not permanently.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+EVENT_LOOP_LAG = registry.gauge(
+    "hothour_event_loop_lag_seconds",
+    "Delay of the last event-loop lag probe beyond its scheduled wake-up",
+)
+EVENT_LOOP_LAG_MAX = registry.gauge(
+    "hothour_event_loop_lag_max_seconds",
+    "Largest event-loop lag observed since start",
+)
+EVENT_LOOP_LAG_HISTOGRAM = registry.histogram(
+    "hothour_event_loop_lag_distribution_seconds",
+    "Distribution of event-loop lag probe delays",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EVENT_LOOP_STALLS = registry.counter(
+    "hothour_event_loop_stalls",
+    "Times the watchdog found the event loop blocked beyond the stall threshold",
+)
+SLOW_CALLBACKS = registry.counter(
+    "hothour_slow_callbacks",
+    "Callbacks slower than the slow-callback threshold (asyncio debug mode only)",
+)
+
+
+class _SlowCallbackHandler(logging.Handler):
+    """Receives asyncio's "Executing <Handle ...> took N seconds" debug reports."""
+
+    def __init__(self, monitor: "EventLoopMonitor"):
+        super().__init__(level=logging.WARNING)
+        self.monitor = monitor
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = record.getMessage()
+        if message.startswith("Executing ") and " took " in message:
+            SLOW_CALLBACKS.inc()
+            self.monitor.slow_callbacks += 1
+            self.monitor.recent_slow_callbacks.append(message)
+
+
+class EventLoopMonitor:
+    def __init__(self, interval: float, stall_threshold: float, debug: bool = False,
+                 slow_callback_duration: float = 0.1, keep_recent: int = 20):
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.debug = debug
+        self.slow_callback_duration = slow_callback_duration
+        self.recent_stalls: Deque[Dict] = deque(maxlen=keep_recent)
+        self.recent_slow_callbacks: Deque[str] = deque(maxlen=keep_recent)
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        # Totals since start; the deques above only keep the latest reports
+        self.stalls = 0
+        self.slow_callbacks = 0
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._debug_handler: Optional[_SlowCallbackHandler] = None
+        # Loop debug settings to restore in stop()
+        self._saved_debug: Optional[tuple] = None
+
+    async def _probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._heartbeat = time.monotonic()
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record_lag(max(0.0, loop.time() - expected))
+
+    def record_lag(self, lag: float) -> None:
+        self._heartbeat = time.monotonic()
+        self.last_lag = lag
+        EVENT_LOOP_LAG.set(lag)
+        EVENT_LOOP_LAG_HISTOGRAM.observe(lag)
+        if lag > self.max_lag:
+            self.max_lag = lag
+            EVENT_LOOP_LAG_MAX.set(lag)
+
+    def _watch(self) -> None:
+        reported_for = None
+        while not self._stop.wait(min(self.interval, self.stall_threshold) / 2):
+            heartbeat = self._heartbeat
+            # The probe refreshes the heartbeat at least every `interval` seconds
+            blocked_for = time.monotonic() - heartbeat - self.interval
+            if blocked_for < self.stall_threshold or reported_for == heartbeat:
+                continue
+            reported_for = heartbeat
+            self._report_stall(blocked_for)
+
+    def _report_stall(self, blocked_for: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        stack = "".join(traceback.format_stack(frame)) if frame is not None else "<stack unavailable>"
+        EVENT_LOOP_STALLS.inc()
+        self.stalls += 1
+        self.recent_stalls.append({"blocked_seconds": round(blocked_for, 3), "stack": stack})
+        logger.warning(f"Event loop blocked for {blocked_for:.3f}s; loop thread stack:\n{stack}")
+
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.create_task(self._probe())
+
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+        if self.debug:
+            self._saved_debug = (loop, loop.get_debug(), loop.slow_callback_duration)
+            loop.set_debug(True)
+            loop.slow_callback_duration = self.slow_callback_duration
+            self._debug_handler = _SlowCallbackHandler(self)
+            logging.getLogger("asyncio").addHandler(self._debug_handler)
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._debug_handler is not None:
+            logging.getLogger("asyncio").removeHandler(self._debug_handler)
+            self._debug_handler = None
+        if self._saved_debug is not None:
+            loop, was_debug, slow_callback_duration = self._saved_debug
+            if not loop.is_closed():
+                loop.set_debug(was_debug)
+                loop.slow_callback_duration = slow_callback_duration
+            self._saved_debug = None
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "lag_ms": round(self.last_lag * 1000, 2),
+            "max_lag_ms": round(self.max_lag * 1000, 2),
+            "stalls": self.stalls,
+            "slow_callbacks": self.slow_callbacks,
+            "debug": self.debug,
+        }
+
+
+event_loop_monitor = EventLoopMonitor(
+    interval=settings.LOOP_MONITOR_INTERVAL_SECONDS,
+    stall_threshold=settings.LOOP_LAG_WARN_SECONDS,
+    debug=settings.LOOP_MONITOR_DEBUG,
+    slow_callback_duration=settings.LOOP_SLOW_CALLBACK_SECONDS,
+)
@@ -0,0 +1,150 @@
+"""Reusable email transports.
+
+`GmailTokenCache` keeps the Gmail OAuth access token until shortly before it
+expires, so the refresh-token exchange happens once per token lifetime
+instead of once per email. Concurrent senders share a single refresh.
+
+`SMTPConnectionPool` keeps authenticated SMTP connections open between
+messages. Idle connections are checked with NOOP before reuse and dropped
+after `idle_timeout` seconds, well below typical server-side limits.
+"""
+import asyncio
+import time
+from email.message import EmailMessage
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+import aiosmtplib
+from fastapi_mail import ConnectionConfig
+
+
+class GmailTokenCache:
+    """Caches one access token and refreshes it `refresh_margin` seconds before expiry."""
+
+    def __init__(self, refresh_margin: float):
+        self.refresh_margin = refresh_margin
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.refreshes = 0
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _valid_token(self) -> Optional[str]:
+        if self._token and time.monotonic() < self._expires_at - self.refresh_margin:
+            return self._token
+        return None
+
+    async def get(self, fetch: Callable[[], Awaitable[Tuple[str, float]]]) -> str:
+        """
+        Return a cached token, calling `fetch` (→ (token, expires_in_seconds)) when stale.
+        Only one caller refreshes; the others wait for and reuse its result.
+        """
+        token = self._valid_token()
+        if token:
+            return token
+        async with self._get_lock():
+            token = self._valid_token()
+            if token:
+                return token
+            token, expires_in = await fetch()
+            self._token = token
+            self._expires_at = time.monotonic() + expires_in
+            self.refreshes += 1
+            return token
+
+    def invalidate(self) -> None:
+        self._token = None
+        self._expires_at = 0.0
+
+
+class SMTPConnectionPool:
+    """Bounded pool of persistent, logged-in aiosmtplib connections."""
+
+    def __init__(self, config: ConnectionConfig, max_size: int, keepalive: float, idle_timeout: float):
+        self.config = config
+        self.max_size = max(1, max_size)
+        self.keepalive = keepalive
+        self.idle_timeout = idle_timeout
+        self._idle: List[Tuple[aiosmtplib.SMTP, float]] = []
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.connections_opened = 0
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores bind to the loop they first wait on; keep one per loop
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_size)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        client = aiosmtplib.SMTP(
+            hostname=self.config.MAIL_SERVER,
+            port=self.config.MAIL_PORT,
+            timeout=self.config.TIMEOUT,
+            use_tls=self.config.MAIL_SSL_TLS,
+            start_tls=self.config.MAIL_STARTTLS,
+            validate_certs=self.config.VALIDATE_CERTS,
+        )
+        await client.connect()
+        if self.config.USE_CREDENTIALS:
+            await client.login(self.config.MAIL_USERNAME, self.config.MAIL_PASSWORD.get_secret_value())
+        self.connections_opened += 1
+        return client
+
+    async def _discard(self, client: aiosmtplib.SMTP) -> None:
+        try:
+            await client.quit()
+        except Exception:
+            client.close()
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        while self._idle:
+            client, last_used = self._idle.pop()
+            idle_for = time.monotonic() - last_used
+            if idle_for >= self.idle_timeout or not client.is_connected:
+                await self._discard(client)
+                continue
+            if idle_for >= self.keepalive:
+                try:
+                    await client.noop()
+                except Exception:
+                    await self._discard(client)
+                    continue
+            return client
+        return await self._connect()
+
+    def _release(self, client: aiosmtplib.SMTP) -> None:
+        if client.is_connected:
+            self._idle.append((client, time.monotonic()))
+
+    async def send(self, message: EmailMessage) -> None:
+        """Send `message` on a pooled connection, reconnecting once if the server dropped it."""
+        async with self._get_semaphore():
+            client = await self._acquire()
+            try:
+                await client.send_message(message)
+            except aiosmtplib.SMTPServerDisconnected:
+                client.close()
+                client = await self._connect()
+                try:
+                    await client.send_message(message)
+                except Exception:
+                    await self._discard(client)
+                    raise
+            except Exception:
+                await self._discard(client)
+                raise
+            self._release(client)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for client, _ in idle:
+            await self._discard(client)
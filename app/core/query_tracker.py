@@ -0,0 +1,103 @@
+"""Per-request database query accounting.
+
+Every Prisma call made through `app.core.db.db` is recorded into the
+`QueryStats` of the current context (a contextvar, so concurrent requests
+never mix and tasks spawned by a request are attributed to it).
+
+`QueryTrackingMiddleware` opens a fresh `QueryStats` per HTTP request, adds a
+`Server-Timing: db;dur=...;desc="N queries"` header and logs a warning when a
+request exceeds `DB_QUERY_BUDGET` queries or repeats the same model/operation
+`DB_N_PLUS_ONE_THRESHOLD` times (the usual N+1 shape). Tests use
+`track_queries()` directly to assert budgets per endpoint.
+"""
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    def __init__(self, parent: Optional["QueryStats"] = None):
+        self.parent = parent
+        self.count = 0
+        self.duration = 0.0
+        self.operations: Counter = Counter()
+
+    def record(self, model: str, operation: str, duration: float) -> None:
+        stats = self
+        while stats is not None:
+            stats.count += 1
+            stats.duration += duration
+            stats.operations[(model, operation)] += 1
+            stats = stats.parent
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """(model.operation, count) pairs issued at least `threshold` times."""
+        return [
+            (f"{model}.{operation}", count)
+            for (model, operation), count in self.operations.most_common()
+            if count >= threshold
+        ]
+
+    def summary(self) -> str:
+        calls = ", ".join(f"{model}.{operation}×{count}" for (model, operation), count in self.operations.most_common())
+        return f"{self.count} queries in {self.duration * 1000:.1f}ms ({calls})"
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def record_query(model: str, operation: str, duration: float) -> None:
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(model, operation, duration)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect queries issued inside the block; nested trackers also report to their parent."""
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class QueryTrackingMiddleware:
+    """Pure ASGI middleware: per-request query stats, Server-Timing header and budget warnings."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    timing = f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"'
+                    message.setdefault("headers", [])
+                    message["headers"] = list(message["headers"]) + [(b"server-timing", timing.encode("latin-1"))]
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                self._check_budget(scope, stats)
+
+    def _check_budget(self, scope, stats: QueryStats) -> None:
+        budget = settings.DB_QUERY_BUDGET
+        repeated = stats.repeated(settings.DB_N_PLUS_ONE_THRESHOLD)
+        if stats.count > budget or repeated:
+            logger.warning(
+                f"DB query budget: {scope.get('method')} {scope.get('path')} issued {stats.summary()}"
+                f" (budget {budget}{', possible N+1: ' + ', '.join(name for name, _ in repeated) if repeated else ''})"
+            )
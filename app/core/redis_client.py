@@ -1,7 +1,23 @@
-from typing import Optional
+"""Redis access helpers.
+
+`get_redis_client` returns the synchronous client kept for scripts and other
+non-async callers. Request handlers must use the asyncio client through
+`redis_call`, which adds a pooled connection, per-call timeouts and a circuit
+breaker: after repeated failures Redis is skipped for a cool-down period and
+callers fall back to their in-memory path instead of waiting on timeouts.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
 from app.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 _redis = None
+_async_redis = None
+
 
 def get_redis_client():
     """Lazily create and return a Redis client based on `REDIS_URL`.
@@ -21,6 +37,131 @@ def get_redis_client():
         return None
 
 
+def get_async_redis_client():
+    """Lazily create and return an asyncio Redis client based on `REDIS_URL`.
+    The client uses a bounded connection pool with socket timeouts.
+    Returns None if Redis is not configured or the import fails.
+    """
+    global _async_redis
+    if _async_redis is not None:
+        return _async_redis
+    if not settings.REDIS_URL:
+        return None
+    try:
+        import redis.asyncio as _redis_asyncio
+        pool = _redis_asyncio.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        )
+        _async_redis = _redis_asyncio.Redis(connection_pool=pool)
+        return _async_redis
+    except Exception:
+        _async_redis = None
+        return None
+
+
+async def close_async_redis_client() -> None:
+    global _async_redis
+    if _async_redis is None:
+        return
+    try:
+        await _async_redis.aclose()
+    except Exception:
+        pass
+    _async_redis = None
+
+
+class CircuitBreaker:
+    """
+    Minimal circuit breaker for Redis calls.
+
+    closed    → calls go through; consecutive failures are counted
+    open      → calls are skipped until `reset_timeout` seconds have passed
+    half-open → a single trial call is let through while concurrent callers are
+                still skipped; success closes, failure re-opens
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "open" or self._probe_in_flight:
+            return False
+        self._probe_in_flight = True
+        return True
+
+    def release_probe(self) -> None:
+        """Let another caller probe; for a trial call that ended without a verdict (cancelled)."""
+        self._probe_in_flight = False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probe_in_flight = False
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logger.warning("Redis circuit opened after %s failures", self.failures)
+            self.opened_at = time.monotonic()
+
+
+redis_breaker = CircuitBreaker(
+    failure_threshold=settings.REDIS_BREAKER_FAILURE_THRESHOLD,
+    reset_timeout=settings.REDIS_BREAKER_RESET_SECONDS,
+)
+
+
+async def redis_call(operation: Callable[[Any], Awaitable[Any]]) -> Tuple[bool, Any]:
+    """
+    Run `operation(client)` against the async Redis client.
+
+    Returns:
+        (True, result) on success, (False, None) when Redis is not configured,
+        the circuit is open, or the call failed/timed out. Callers use the
+        False branch to fall back to their in-memory path.
+    """
+    client = get_async_redis_client()
+    if client is None or not redis_breaker.allow():
+        return False, None
+    try:
+        result = await asyncio.wait_for(operation(client), timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS)
+    except asyncio.CancelledError:
+        redis_breaker.release_probe()
+        raise
+    except Exception:
+        redis_breaker.record_failure()
+        return False, None
+    redis_breaker.record_success()
+    return True, result
+
+
+async def ping_redis_async() -> bool:
+    """Return True if Redis responds to PING; False otherwise."""
+    ok, result = await redis_call(lambda client: client.ping())
+    return bool(ok and result is True)
+
+
 def ping_redis(timeout: float = 1.0) -> bool:
     """Return True if Redis responds to PING; False otherwise."""
     client = get_redis_client()
@@ -0,0 +1,58 @@
+"""Early rejection of oversized upload requests.
+
+FastAPI parses a multipart body, spooling file parts to disk, before the
+endpoint runs, so a size check in the handler only fires after the whole
+upload was received. `RequestSizeLimitMiddleware` looks at Content-Length
+first and answers 413 without reading the body when it cannot fit.
+
+Requests without a Content-Length (chunked) are still capped while the file
+is copied (see `app.utils.uploads.save_image_upload`).
+"""
+import json
+from typing import Callable, Dict
+
+# Multipart boundaries and part headers around the file itself
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+
+
+class RequestSizeLimitMiddleware:
+    """
+    Pure ASGI middleware; `limits` maps an exact path to a callable returning
+    the file size cap in bytes (read per request, so settings changes apply).
+    """
+
+    def __init__(self, app, limits: Dict[str, Callable[[], int]]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope.get("path", "")) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        max_bytes = limit()
+        content_length = None
+        for name, value in scope.get("headers", ()):
+            if name == b"content-length":
+                try:
+                    content_length = int(value)
+                except ValueError:
+                    pass
+                break
+
+        if content_length is None or content_length <= max_bytes + MULTIPART_OVERHEAD_BYTES:
+            await self.app(scope, receive, send)
+            return
+
+        body = json.dumps({"detail": f"Dosya en fazla {max_bytes // 1024} KB olabilir."}).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,8 +1,12 @@
+import logging
+
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from app.services.auction_service import auction_service
 from app.core.socket import sio
 from app.core.db import db
 
+logger = logging.getLogger(__name__)
+
 scheduler = AsyncIOScheduler()
 
 async def update_auctions_job():
@@ -46,7 +50,7 @@ async def update_auctions_job():
                 })
                 
     except Exception as e:
-        print(f"Scheduler Error: {e}")
+        logger.exception(f"Scheduler Error: {e}")
 
 def start_scheduler():
     scheduler.add_job(update_auctions_job, "interval", seconds=60) # Run every minute
@@ -1,10 +1,17 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any, Union
+from typing import Any, Callable, Union
+from uuid import uuid4
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 from app.core.timezone import now_tr
 
+logger = logging.getLogger(__name__)
+
 pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
 ALGORITHM = "HS256"
@@ -27,7 +34,8 @@ def create_refresh_token(subject: Union[str, Any], expires_delta: timedelta = No
     else:
         expire = now_tr() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
 
-    to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
+    # jti gives each refresh token a short unique id used as its revocation key
+    to_encode = {"exp": expire, "sub": str(subject), "type": "refresh", "jti": uuid4().hex}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
@@ -53,3 +61,127 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+class PasswordHashPool:
+    """
+    Runs password hashing/verification in a bounded thread pool.
+
+    pbkdf2 takes tens of milliseconds per call; running it inline in an async
+    handler freezes every socket and price broadcast on the worker. hashlib
+    releases the GIL while hashing, so a small thread pool keeps the event
+    loop responsive while at most `max_workers` hashes run at once. Extra
+    callers wait on a semaphore and are counted as queued.
+
+    A queue deeper than `queue_warn_threshold` is logged at most once every
+    `WARN_INTERVAL_SECONDS`; during a login burst every caller crosses the
+    threshold and would otherwise log a line each.
+    """
+
+    WARN_INTERVAL_SECONDS = 30.0
+
+    def __init__(self, max_workers: int, queue_warn_threshold: int):
+        self.max_workers = max(1, max_workers)
+        self.queue_warn_threshold = queue_warn_threshold
+        self._executor: ThreadPoolExecutor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+        self.queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.max_queued = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+        self.max_run_seconds = 0.0
+        self.queue_warnings = 0
+        self._last_warned_at: float | None = None
+
+    def _warn_queue_depth(self) -> None:
+        self.queue_warnings += 1
+        now = time.monotonic()
+        if self._last_warned_at is not None and now - self._last_warned_at < self.WARN_INTERVAL_SECONDS:
+            return
+        self._last_warned_at = now
+        logger.warning(
+            f"Password hash queue depth {self.queued} exceeds {self.queue_warn_threshold}"
+            f" ({self.queue_warnings} times so far)"
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores bind to the loop they first wait on; keep one per loop
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        queued_at = time.perf_counter()
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+        if self.queued > self.queue_warn_threshold:
+            self._warn_queue_depth()
+
+        admitted = False
+        try:
+            async with self._get_semaphore():
+                admitted = True
+                self.queued -= 1
+                started_at = time.perf_counter()
+                self.total_wait_seconds += started_at - queued_at
+                self.in_flight += 1
+                try:
+                    return await loop.run_in_executor(self._get_executor(), func, *args)
+                finally:
+                    elapsed = time.perf_counter() - started_at
+                    self.in_flight -= 1
+                    self.completed += 1
+                    self.total_run_seconds += elapsed
+                    self.max_run_seconds = max(self.max_run_seconds, elapsed)
+        finally:
+            # Cancelled while still waiting for a worker
+            if not admitted:
+                self.queued -= 1
+
+    def stats(self) -> dict:
+        completed = self.completed or 1
+        return {
+            "workers": self.max_workers,
+            "queued": self.queued,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "max_queued": self.max_queued,
+            "queue_warnings": self.queue_warnings,
+            "avg_wait_ms": round(self.total_wait_seconds / completed * 1000, 2),
+            "avg_run_ms": round(self.total_run_seconds / completed * 1000, 2),
+            "max_run_ms": round(self.max_run_seconds * 1000, 2),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+password_hash_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    queue_warn_threshold=settings.PASSWORD_HASH_QUEUE_WARN,
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Async `verify_password` that runs off the event loop."""
+    if not hashed_password:
+        return False
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Async `get_password_hash` that runs off the event loop."""
+    return await password_hash_pool.run(get_password_hash, password)
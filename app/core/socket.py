@@ -18,13 +18,28 @@ Events (Server → Client):
   auction_booked      room="auction:{id}"  → {"auction_id", "booking_code"}  (public: auction is taken)
 """
 
+import logging
+
 import socketio
 
+from app.core.metrics import SOCKET_EMITS
+
 # CORS origins accepted by the Socket.io server
 _CORS_ORIGINS = ["http://localhost:3000", "http://localhost:8000", "*"]
 
+# Connection and subscription logs are sampled (LOG_SAMPLE_RATES)
+logger = logging.getLogger(__name__)
+
+class _InstrumentedAsyncServer(socketio.AsyncServer):
+    """AsyncServer that counts emitted events for /metrics."""
+
+    async def emit(self, event, *args, **kwargs):
+        SOCKET_EMITS.labels(event).inc()
+        return await super().emit(event, *args, **kwargs)
+
+
 # Singleton AsyncServer (async_mode="asgi" required for FastAPI/Starlette)
-sio = socketio.AsyncServer(
+sio = _InstrumentedAsyncServer(
     async_mode="asgi",
     cors_allowed_origins=_CORS_ORIGINS,
     logger=False,
@@ -39,13 +54,13 @@ sio = socketio.AsyncServer(
 @sio.event
 async def connect(sid: str, environ: dict, auth: dict = None):
     """Called when a client connects."""
-    print(f"[Socket.io] Client connected: {sid}")
+    logger.info("Client connected: %s", sid, extra={"sid": sid})
 
 
 @sio.event
 async def disconnect(sid: str):
     """Called when a client disconnects."""
-    print(f"[Socket.io] Client disconnected: {sid}")
+    logger.info("Client disconnected: %s", sid, extra={"sid": sid})
 
 
 # ─────────────────────────────────────────────
@@ -65,7 +80,7 @@ async def subscribe_auction(sid: str, data: dict):
     room = f"auction:{auction_id}"
     await sio.enter_room(sid, room)
     await sio.emit("subscribed", {"room": room}, to=sid)
-    print(f"[Socket.io] {sid} subscribed to {room}")
+    logger.info("%s subscribed to %s", sid, room, extra={"sid": sid, "room": room})
 
 
 @sio.event
@@ -93,4 +108,4 @@ async def subscribe_user(sid: str, data: dict):
     room = f"user:{user_id}"
     await sio.enter_room(sid, room)
     await sio.emit("subscribed", {"room": room}, to=sid)
-    print(f"[Socket.io] {sid} subscribed to {room}")
+    logger.info("%s subscribed to %s", sid, room, extra={"sid": sid, "room": room})
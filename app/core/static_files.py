@@ -0,0 +1,75 @@
+"""StaticFiles with HTTP caching for `/uploads`.
+
+Starlette already sends `ETag` / `Last-Modified` and answers conditional
+requests with 304. This adds:
+
+- `Cache-Control`: content-hashed names (see `app.utils.uploads`) never change,
+  so they are `immutable` for a year and browsers/CDNs skip the request
+  entirely; anything else (legacy random names) is revalidated after a short
+  max-age.
+- Precompressed sidecars: for text-like types, `<file>.br` / `<file>.gz` next
+  to the original is served with `Content-Encoding` when the client accepts
+  it. Images are already compressed and are always served as-is.
+"""
+import os
+import stat
+from typing import Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+from app.core.compression import COMPRESSIBLE_TYPES, accepted_encodings
+from app.utils.uploads import is_content_hashed
+
+# Sidecar suffix per Content-Encoding, in order of preference
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+
+def _find_sidecar(path: str, accepted: set) -> Optional[Tuple[str, str, os.stat_result]]:
+    for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+        if encoding not in accepted:
+            continue
+        try:
+            stat_result = os.stat(path + suffix)
+        except OSError:
+            continue
+        if stat.S_ISREG(stat_result.st_mode):
+            return encoding, path + suffix, stat_result
+    return None
+
+
+class CachedStaticFiles(StaticFiles):
+    def __init__(self, *args, immutable_max_age: int = 31536000, max_age: int = 3600, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.immutable_max_age = immutable_max_age
+        self.max_age = max_age
+
+    def cache_control(self, path: str) -> str:
+        if is_content_hashed(os.path.basename(path)):
+            return f"public, max-age={self.immutable_max_age}, immutable"
+        return f"public, max-age={self.max_age}"
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+
+        if isinstance(response, FileResponse) and (response.media_type or "").startswith(COMPRESSIBLE_TYPES):
+            accepted = accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+            sidecar = await anyio.to_thread.run_sync(_find_sidecar, str(response.path), accepted)
+            if sidecar is not None:
+                encoding, sidecar_path, stat_result = sidecar
+                response = FileResponse(
+                    sidecar_path,
+                    stat_result=stat_result,
+                    media_type=response.media_type,
+                    headers={"Content-Encoding": encoding},
+                )
+                if self.is_not_modified(response.headers, Headers(scope=scope)):
+                    response = NotModifiedResponse(response.headers)
+            response.headers["Vary"] = "Accept-Encoding"
+
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = self.cache_control(path)
+        return response
@@ -1,48 +1,225 @@
 """Refresh-token revocation store.
 
+Revocations are keyed by the token's `jti` claim (or a SHA-256 of the token
+string for legacy/undecodable tokens), not the full JWT, to keep keys small.
+Revocations written before that change live under `prefix + <full JWT>`;
+those keys are still checked and folded into the filter until they expire
+(REFRESH_TOKEN_EXPIRE_DAYS after the upgrade), after which the legacy lookup
+can be removed.
+
 This module uses Redis for cross-process revocation when a `REDIS_URL`
-is configured in settings. If Redis is not configured/available it
-falls back to a process-local in-memory set (not durable, not shared
-across workers). The functions below provide a minimal API used by
-the auth endpoints: `revoke_refresh_token` and
-`is_refresh_token_revoked`.
+is configured in settings. If Redis is not configured/available (or its
+circuit breaker is open) it falls back to a process-local in-memory set
+(not durable, not shared across workers).
+
+A local Bloom filter sits in front of both: a token id that is not in the
+filter is definitely not revoked and is answered without any network I/O.
+Redis is consulted only on possible hits. Workers keep their filter in sync
+by rebuilding it from Redis and listening for new revocations on the
+`REDIS_REVOKED_CHANNEL` pub/sub channel. While that sync is not established
+every check goes to Redis, as before. A publish that fails is retried in the
+background; until it goes through, other workers would answer that id from
+their filter, so the retry keeps going for `_PUBLISH_RETRIES` attempts.
+
+The functions below provide a minimal async API used by the auth endpoints:
+`revoke_refresh_token` and `is_refresh_token_revoked`.
 """
+import asyncio
+import hashlib
+import logging
 from typing import Optional, Set
 
+from jose import jwt
+
 from app.core.config import settings
-from app.core.redis_client import get_redis_client
+from app.core import redis_client
+from app.core.redis_client import redis_call
+from app.utils.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
 
 _revoked_tokens: Set[str] = set()
 
-_redis_client = get_redis_client()
+_bloom = BloomFilter(settings.REVOCATION_BLOOM_CAPACITY, settings.REVOCATION_BLOOM_ERROR_RATE)
+# True once the filter was rebuilt from Redis while the pub/sub listener is subscribed
+_bloom_synced = False
+_sync_task: Optional[asyncio.Task] = None
+# Ids added while a rebuild is scanning Redis, replayed into the new filter
+_rebuild_buffer: Optional[Set[str]] = None
+# Background publish retries, kept referenced until they finish
+_publish_tasks: Set[asyncio.Task] = set()
+_PUBLISH_RETRIES = 6
+_PUBLISH_RETRY_DELAY = 1.0
+
 
+def _redis_key(token_id: str) -> str:
+    return f"{settings.REDIS_REVOKED_KEY_PREFIX}{token_id}"
 
-def _redis_key(token: str) -> str:
+
+def _legacy_redis_key(token: str) -> str:
+    # Pre-jti revocations stored the whole JWT in the key
     return f"{settings.REDIS_REVOKED_KEY_PREFIX}{token}"
 
 
-def revoke_refresh_token(token: str) -> None:
+def token_revocation_id(token: str) -> str:
+    """Return the revocation key for a refresh token: its jti, else a SHA-256 of the token."""
+    try:
+        jti = jwt.get_unverified_claims(token).get("jti")
+    except Exception:
+        jti = None
+    if jti:
+        return str(jti)
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _new_bloom() -> BloomFilter:
+    return BloomFilter(settings.REVOCATION_BLOOM_CAPACITY, settings.REVOCATION_BLOOM_ERROR_RATE)
+
+
+def _add_to_filter(token_id: str) -> None:
+    _bloom.add(token_id)
+    if _rebuild_buffer is not None:
+        _rebuild_buffer.add(token_id)
+
+
+async def _publish(token_id: str) -> bool:
+    ok, _ = await redis_call(lambda client: client.publish(settings.REDIS_REVOKED_CHANNEL, token_id))
+    return ok
+
+
+async def _retry_publish(token_id: str) -> None:
+    delay = _PUBLISH_RETRY_DELAY
+    for _ in range(_PUBLISH_RETRIES):
+        await asyncio.sleep(delay)
+        if await _publish(token_id):
+            return
+        delay = min(delay * 2, 30.0)
+    # Subscribers still pick it up when they next rebuild from Redis
+    logger.warning(f"Could not publish refresh token revocation {token_id[:8]}… after {_PUBLISH_RETRIES} retries")
+
+
+async def revoke_refresh_token(token: str) -> None:
     if not token:
         return
+    token_id = token_revocation_id(token)
+    _add_to_filter(token_id)
+
     # If redis is configured use it with TTL equal to refresh token lifetime
-    if _redis_client:
-        try:
-            ttl = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
-            _redis_client.set(_redis_key(token), "1", ex=ttl)
-            return
-        except Exception:
-            # if redis fails, fall back to in-memory
-            pass
-    _revoked_tokens.add(token)
+    ttl = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+    ok, _ = await redis_call(lambda client: client.set(_redis_key(token_id), "1", ex=ttl))
+    if ok:
+        if not await _publish(token_id):
+            task = asyncio.create_task(_retry_publish(token_id))
+            _publish_tasks.add(task)
+            task.add_done_callback(_publish_tasks.discard)
+        return
+    # if redis fails, fall back to in-memory
+    _revoked_tokens.add(token_id)
 
 
-def is_refresh_token_revoked(token: str) -> bool:
+async def is_refresh_token_revoked(token: str) -> bool:
     if not token:
         return False
-    if _redis_client:
+    token_id = token_revocation_id(token)
+
+    redis_configured = redis_client.get_async_redis_client() is not None
+    if token_id not in _bloom and (_bloom_synced or not redis_configured):
+        # Definitely not revoked
+        return False
+
+    if token_id in _revoked_tokens:
+        return True
+    ok, exists = await redis_call(
+        lambda client: client.exists(_redis_key(token_id), _legacy_redis_key(token))
+    )
+    if ok:
+        return exists >= 1
+    # fall back to in-memory check on redis error
+    return False
+
+
+async def rebuild_revocation_filter() -> bool:
+    """
+    Rebuild the Bloom filter from the revocation keys in Redis plus the local set.
+    Rebuilding also drops ids whose Redis keys have expired.
+
+    Returns:
+        True if the filter now mirrors Redis, False if Redis was unavailable
+    """
+    global _bloom, _rebuild_buffer
+    client = redis_client.get_async_redis_client()
+    if client is None:
+        return False
+
+    fresh = _new_bloom()
+    prefix = settings.REDIS_REVOKED_KEY_PREFIX
+    _rebuild_buffer = set()
+    try:
+        async for key in client.scan_iter(match=f"{prefix}*", count=1000):
+            suffix = key[len(prefix):]
+            # Legacy keys hold a full JWT (the only ids containing dots)
+            fresh.add(token_revocation_id(suffix) if "." in suffix else suffix)
+    except Exception as exc:
+        logger.warning(f"Revocation filter rebuild failed: {exc}")
+        return False
+    finally:
+        pending, _rebuild_buffer = _rebuild_buffer, None
+
+    for token_id in _revoked_tokens | pending:
+        fresh.add(token_id)
+    _bloom = fresh
+    return True
+
+
+async def _listen_for_revocations() -> None:
+    global _bloom_synced
+    retry_delay = 1.0
+    while True:
+        client = redis_client.get_async_redis_client()
+        if client is None:
+            return
+        pubsub = client.pubsub()
         try:
-            return _redis_client.exists(_redis_key(token)) == 1
-        except Exception:
-            # fall back to in-memory check on redis error
-            pass
-    return token in _revoked_tokens
+            # Subscribe before rebuilding so nothing published in between is missed
+            await pubsub.subscribe(settings.REDIS_REVOKED_CHANNEL)
+            if await rebuild_revocation_filter():
+                _bloom_synced = True
+                retry_delay = 1.0
+            async for message in pubsub.listen():
+                if message.get("type") == "message" and message.get("data"):
+                    _add_to_filter(str(message["data"]))
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning(f"Revocation pub/sub listener error: {exc}")
+        finally:
+            _bloom_synced = False
+            try:
+                await pubsub.aclose()
+            except Exception:
+                pass
+        await asyncio.sleep(retry_delay)
+        retry_delay = min(retry_delay * 2, 30.0)
+
+
+def start_revocation_sync() -> None:
+    """Start the background pub/sub listener (no-op without Redis)."""
+    global _sync_task
+    if redis_client.get_async_redis_client() is None or (_sync_task and not _sync_task.done()):
+        return
+    _sync_task = asyncio.create_task(_listen_for_revocations())
+
+
+async def stop_revocation_sync() -> None:
+    global _sync_task, _bloom_synced
+    _bloom_synced = False
+    for task in list(_publish_tasks):
+        task.cancel()
+    if _sync_task is None:
+        return
+    _sync_task.cancel()
+    try:
+        await _sync_task
+    except (asyncio.CancelledError, Exception):
+        pass
+    _sync_task = None
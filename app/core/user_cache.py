@@ -0,0 +1,154 @@
+"""Authenticated-user cache used by `get_current_user`.
+
+Every authenticated request used to load the user (with its studio) from the
+database. This module keeps a small process-local LRU of those records keyed
+by user id, with a short TTL so role/studio changes made on another worker are
+picked up quickly. When `USER_CACHE_REDIS_ENABLED` is set and Redis is
+reachable, a shared Redis tier sits behind the local LRU.
+
+Writers must call `invalidate` / `invalidate_studio` after changing a user or
+studio so the next request reloads it.
+
+Cached users never carry the password hash (`hashedPassword` is None), in
+either tier; code that verifies a password loads it from the database.
+"""
+import copy
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from app.core.config import settings
+from app.core.redis_client import get_async_redis_client, redis_call
+
+
+# Never kept in the cache, in process or in Redis
+_SECRET_FIELDS = ("hashedPassword",)
+
+
+def _without_secrets(user: Any) -> Any:
+    if hasattr(user, "model_copy"):
+        return user.model_copy(update=dict.fromkeys(_SECRET_FIELDS))
+    if isinstance(user, dict):
+        return {key: value for key, value in user.items() if key not in _SECRET_FIELDS}
+    clone = copy.copy(user)
+    for field in _SECRET_FIELDS:
+        if hasattr(clone, field):
+            setattr(clone, field, None)
+    return clone
+
+
+def _copy_user(user: Any) -> Any:
+    # Shallow: a handler assigning an attribute cannot change the cached
+    # record, but the nested studio is shared and must be treated read-only
+    # (app.utils.urls builds new dicts instead of patching logoUrl).
+    if hasattr(user, "model_copy"):
+        return user.model_copy()
+    return copy.copy(user)
+
+
+def _serialize(user: Any) -> Optional[str]:
+    if hasattr(user, "model_dump_json"):
+        return user.model_dump_json(exclude=set(_SECRET_FIELDS))
+    return None
+
+
+def _deserialize(raw: str) -> Any:
+    from prisma.models import User
+
+    # The model requires the hash; fill a placeholder and blank it again
+    user = User.model_validate({**json.loads(raw), **dict.fromkeys(_SECRET_FIELDS, "")})
+    return _without_secrets(user)
+
+
+class UserCache:
+    """Bounded LRU of user records with a per-entry TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, tuple[float, Any]]" = OrderedDict()
+
+    def _redis_enabled(self) -> bool:
+        return settings.USER_CACHE_REDIS_ENABLED and get_async_redis_client() is not None
+
+    def _redis_key(self, user_id: int) -> str:
+        return f"{settings.REDIS_USER_CACHE_KEY_PREFIX}{user_id}"
+
+    def _store_local(self, user_id: int, user: Any) -> None:
+        self._entries[user_id] = (time.monotonic() + self.ttl_seconds, user)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, user_id: int) -> Optional[Any]:
+        """Return a copy of the cached user, or None on miss/expiry."""
+        if self.ttl_seconds <= 0:
+            return None
+
+        entry = self._entries.get(user_id)
+        if entry is not None:
+            expires_at, user = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(user_id)
+                return _copy_user(user)
+            self._entries.pop(user_id, None)
+
+        if not self._redis_enabled():
+            return None
+        ok, raw = await redis_call(lambda client: client.get(self._redis_key(user_id)))
+        if not ok or not raw:
+            return None
+        try:
+            user = _deserialize(raw)
+        except Exception:
+            return None
+        self._store_local(user_id, user)
+        return _copy_user(user)
+
+    async def set(self, user_id: int, user: Any) -> None:
+        if self.ttl_seconds <= 0 or user is None:
+            return
+        self._store_local(user_id, _without_secrets(user))
+
+        if not self._redis_enabled():
+            return
+        raw = _serialize(user)
+        if raw is not None:
+            ttl = max(1, int(self.ttl_seconds))
+            await redis_call(lambda client: client.set(self._redis_key(user_id), raw, ex=ttl))
+
+    async def invalidate(self, user_id: int) -> None:
+        self._entries.pop(user_id, None)
+
+        if self._redis_enabled():
+            await redis_call(lambda client: client.delete(self._redis_key(user_id)))
+
+    async def invalidate_studio(self, studio_id: int) -> None:
+        """Drop every cached user that embeds the given studio."""
+        user_ids = [
+            user_id for user_id, (_, user) in self._entries.items()
+            if getattr(user, "studioId", None) == studio_id
+        ]
+
+        if self._redis_enabled():
+            from app.core.db import db
+
+            try:
+                members = await db.user.find_many(where={"studioId": studio_id})
+                user_ids.extend(getattr(member, "id", None) for member in members)
+            except Exception:
+                pass
+
+        for user_id in set(user_ids):
+            if user_id is not None:
+                await self.invalidate(user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+user_cache = UserCache(
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
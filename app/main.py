@@ -1,17 +1,40 @@
-from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import logging
 import os
+import secrets
 from app.core.config import settings
 from app.core.db import connect_db, disconnect_db
 from app.core.socket import sio
+from app.core.security import password_hash_pool
+from app.core.static_files import CachedStaticFiles
+from app.core.compression import CompressionMiddleware, compressed_body_cache
+from app.core.email_templates import email_templates
+from app.core.metrics import (
+    MetricsMiddleware,
+    SCHEDULER_JOB_DURATION,
+    SCHEDULER_JOB_ERRORS,
+    registry as metrics_registry,
+)
+from app.core.log_config import configure_logging, stop_logging
+from app.core.loop_monitor import event_loop_monitor
+from app.core.query_tracker import QueryTrackingMiddleware
+from app.core.request_limits import RequestSizeLimitMiddleware
+from app.core.redis_client import close_async_redis_client, ping_redis_async, redis_breaker
+from app.core.token_revocation import rebuild_revocation_filter, start_revocation_sync, stop_revocation_sync
 from app.api import auth
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from app.services.archive_service import archive_service
 from app.services.auction_service import auction_service
 from app.services.booking_service import booking_service
+from app.services.feed_service import public_feed
+from app.services.logo_service import logo_service
 import socketio
 
+logger = logging.getLogger(__name__)
+
 scheduler = AsyncIOScheduler()
 
 async def update_auctions_job():
@@ -19,31 +42,59 @@ async def update_auctions_job():
     Periodic job to update auction statuses.
     Only checks DRAFT and ACTIVE auctions to reduce server load.
     """
-    try:
-        # Fetch status candidates (DRAFT and ACTIVE only)
-        count = await auction_service.check_pending_auctions()
-        auto_cancelled = await booking_service.auto_cancel_overdue_pending_reservations()
-        # print(f"Checked {count} pending auctions for status updates.")
-    except Exception as e:
-        print(f"Scheduler Error: {e}")
+    with SCHEDULER_JOB_DURATION.labels("update_auctions").time():
+        try:
+            # Fetch status candidates (DRAFT and ACTIVE only)
+            count = await auction_service.check_pending_auctions()
+            auto_cancelled = await booking_service.auto_cancel_overdue_pending_reservations()
+            # print(f"Checked {count} pending auctions for status updates.")
+        except Exception as e:
+            SCHEDULER_JOB_ERRORS.labels("update_auctions").inc()
+            logger.exception(f"Scheduler Error: {e}")
+
+async def archive_auctions_job():
+    """Daily move of finished auctions past the retention window to the archive."""
+    with SCHEDULER_JOB_DURATION.labels("archive_auctions").time():
+        try:
+            await archive_service.archive_finished_auctions()
+        except Exception as e:
+            SCHEDULER_JOB_ERRORS.labels("archive_auctions").inc()
+            logger.exception(f"Archive job error: {e}")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup: Connect to DB
+    # Startup: log through a queue so formatting and I/O leave the event loop
+    configure_logging()
+    # Connect to DB
     await connect_db()
+    email_templates.load()
     
+    # Keep the refresh-token revocation filter in sync with other workers
+    start_revocation_sync()
+    event_loop_monitor.start()
+
     # Simple Background Scheduler
     scheduler.add_job(update_auctions_job, 'interval', seconds=60)
+    # Periodic rebuild drops expired revocations from the Bloom filter
+    scheduler.add_job(rebuild_revocation_filter, 'interval', hours=6)
+    if settings.ARCHIVE_ENABLED:
+        scheduler.add_job(archive_auctions_job, 'interval', hours=24)
     scheduler.start()
     
     yield
     # Shutdown: Disconnect DB
     await disconnect_db()
     scheduler.shutdown()
+    password_hash_pool.shutdown()
+    logo_service.shutdown()
+    await stop_revocation_sync()
+    await event_loop_monitor.stop()
+    await close_async_redis_client()
+    stop_logging()
 
 def create_application() -> FastAPI:
     # Ensure uploads directory exists
-    os.makedirs(os.path.join(os.getcwd(), 'uploads', 'studios'), exist_ok=True)
+    os.makedirs(os.path.join(settings.UPLOADS_DIR, 'studios'), exist_ok=True)
     
     application = FastAPI(
         title=settings.PROJECT_NAME,
@@ -54,8 +105,23 @@ def create_application() -> FastAPI:
     )
 
     # Mount static files directory
-    application.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+    # Content-hashed uploads are cached as immutable; ETag/304 for the rest
+    application.mount(
+        "/uploads",
+        CachedStaticFiles(
+            directory=settings.UPLOADS_DIR,
+            immutable_max_age=settings.UPLOADS_IMMUTABLE_MAX_AGE,
+            max_age=settings.UPLOADS_MAX_AGE,
+        ),
+        name="uploads",
+    )
 
+    # 413 from Content-Length before the multipart body is spooled; added
+    # before CORS so the browser can read the rejection
+    application.add_middleware(
+        RequestSizeLimitMiddleware,
+        limits={"/api/v1/studios/me/logo": lambda: settings.LOGO_MAX_BYTES},
+    )
     application.add_middleware(
         CORSMiddleware,
         allow_origins=[str(origin) for origin in settings.BACKEND_CORS_ORIGINS],
@@ -65,6 +131,13 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
     
+    if settings.COMPRESSION_ENABLED:
+        # gzip/br for JSON and text; streamed responses are encoded chunk by chunk
+        application.add_middleware(CompressionMiddleware)
+    application.add_middleware(QueryTrackingMiddleware)
+    if settings.METRICS_ENABLED:
+        application.add_middleware(MetricsMiddleware)
+
     # Include Routers
     application.include_router(auth.router, prefix="/api/v1/auth", tags=["auth"])
     from app.api import users
@@ -82,18 +155,55 @@ def create_application() -> FastAPI:
     @application.get("/health")
     async def health_check():
         # Include Redis health information when available
-        from app.core.redis_client import ping_redis
-
-        redis_ok = ping_redis()
+        redis_ok = await ping_redis_async()
         return {
             "status": "active",
             "version": settings.PROJECT_VERSION,
             "project": settings.PROJECT_NAME,
             "redis": "available" if redis_ok else "unavailable",
+            "redis_circuit": redis_breaker.state,
+            "password_hashing": password_hash_pool.stats(),
+            "event_loop": event_loop_monitor.stats(),
+            "logo_pipeline": logo_service.stats(),
+            "public_feed": public_feed.stats(),
+            "compression_cache": compressed_body_cache.stats(),
         }
 
+    if settings.METRICS_ENABLED:
+        _register_runtime_metrics()
+
+        @application.get("/metrics", include_in_schema=False)
+        async def metrics(authorization: str | None = Header(default=None)):
+            if settings.METRICS_TOKEN and not secrets.compare_digest(
+                authorization or "", f"Bearer {settings.METRICS_TOKEN}"
+            ):
+                raise HTTPException(status_code=401, detail="Invalid metrics token")
+            return PlainTextResponse(
+                metrics_registry.render(),
+                media_type="text/plain; version=0.0.4; charset=utf-8",
+            )
+
     return application
 
+def _register_runtime_metrics():
+    """Expose state kept by other components as gauges read at scrape time."""
+    def password_pool_values():
+        stats = password_hash_pool.stats()
+        return {(key,): stats[key] for key in ("queued", "in_flight", "completed", "max_queued")}
+
+    metrics_registry.callback_gauge(
+        "hothour_password_hash_pool",
+        "Password hashing thread pool counters",
+        password_pool_values,
+        ("stat",),
+    )
+    metrics_registry.callback_gauge(
+        "hothour_redis_circuit_state",
+        "Redis circuit breaker state (1 for the current state)",
+        lambda: {(state,): int(redis_breaker.state == state) for state in ("closed", "open", "half-open")},
+        ("state",),
+    )
+
 _fastapi_app = create_application()
 
 # Mount Socket.io ASGI app alongside FastAPI
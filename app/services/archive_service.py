@@ -0,0 +1,223 @@
+"""
+Archive Service - moves finished auctions out of the hot tables.
+
+SOLD / EXPIRED / CANCELLED auctions whose `endTime` is older than
+ARCHIVE_RETENTION_DAYS are copied, with their reservation and notifications,
+into `archived_auctions` / `archived_reservations` / `archived_notifications`
+and then deleted from the live tables. Listing, status checks and their
+indexes only ever see the live working set.
+
+Each batch is idempotent: archive rows keep their original ids and are
+written with `skip_duplicates`, and live rows are deleted only after their
+copies exist. A run interrupted half way is finished by the next run; no
+row is lost or duplicated.
+
+History stays readable through `list_archived_auctions`,
+`get_archived_auction` and `list_user_history`.
+"""
+
+import logging
+from datetime import timedelta
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.core.db import db
+from app.core.timezone import now_tr, to_tr_aware
+from app.utils.pagination import encode_cursor, keyset_where_desc
+
+logger = logging.getLogger(__name__)
+
+FINISHED_STATUSES = ("SOLD", "EXPIRED", "CANCELLED")
+
+# Live columns copied into the archive tables
+AUCTION_COLUMNS = (
+    "id", "title", "description", "allowedGender", "startPrice", "floorPrice", "currentPrice",
+    "startTime", "endTime", "scheduledAt", "dropIntervalMins", "dropAmount", "turboEnabled",
+    "turboTriggerMins", "turboDropAmount", "turboIntervalMins", "turboStartedAt", "status",
+    "studioId", "createdAt", "updatedAt",
+)
+RESERVATION_COLUMNS = ("id", "auctionId", "userId", "lockedPrice", "bookingCode", "status", "reservedAt")
+NOTIFICATION_COLUMNS = (
+    "id", "userId", "reservationId", "auctionId", "type", "title", "message", "isRead", "createdAt",
+)
+
+
+def _copy(record, columns) -> Dict:
+    return {column: getattr(record, column, None) for column in columns}
+
+
+def _page(records: List, limit: int, sort_field: str) -> Dict:
+    has_more = len(records) > limit
+    records = records[:limit]
+    next_cursor = None
+    if has_more and records:
+        last = records[-1]
+        next_cursor = encode_cursor(getattr(last, sort_field), last.id)
+    return {"items": records, "next_cursor": next_cursor}
+
+
+class ArchiveService:
+    """Service for archiving finished auctions and reading them back"""
+
+    async def archive_finished_auctions(
+        self,
+        *,
+        retention_days: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        now=None,
+    ) -> Dict[str, int]:
+        """
+        Move finished auctions that ended before the retention window.
+
+        Args:
+            retention_days: Keep auctions this many days after endTime (default ARCHIVE_RETENTION_DAYS)
+            batch_size: Auctions moved per batch (default ARCHIVE_BATCH_SIZE)
+            now: Reference time (defaults to now in TR)
+
+        Returns:
+            Dict with archived "auctions", "reservations" and "notifications" counts
+        """
+        retention_days = settings.ARCHIVE_RETENTION_DAYS if retention_days is None else retention_days
+        batch_size = batch_size or settings.ARCHIVE_BATCH_SIZE
+        cutoff = (to_tr_aware(now) if now else now_tr()) - timedelta(days=retention_days)
+
+        totals = {"auctions": 0, "reservations": 0, "notifications": 0}
+        while True:
+            auctions = await db.auction.find_many(
+                where={"status": {"in": list(FINISHED_STATUSES)}, "endTime": {"lt": cutoff}},
+                order={"id": "asc"},
+                take=batch_size,
+            )
+            if not auctions:
+                break
+            moved = await self._archive_batch(auctions)
+            for key, count in moved.items():
+                totals[key] += count
+            if len(auctions) < batch_size:
+                break
+
+        if totals["auctions"]:
+            logger.info(
+                f"Archived {totals['auctions']} auctions, {totals['reservations']} reservations"
+                f" and {totals['notifications']} notifications ended before {cutoff.isoformat()}"
+            )
+        return totals
+
+    async def _archive_batch(self, auctions: List) -> Dict[str, int]:
+        auction_ids = [a.id for a in auctions]
+        reservations = await db.reservation.find_many(where={"auctionId": {"in": auction_ids}})
+        reservation_ids = [r.id for r in reservations]
+        notification_where = {"auctionId": {"in": auction_ids}}
+        if reservation_ids:
+            notification_where = {"OR": [notification_where, {"reservationId": {"in": reservation_ids}}]}
+        notifications = await db.notification.find_many(where=notification_where)
+        notification_ids = [n.id for n in notifications]
+
+        # Copy first; duplicates from an interrupted earlier run are skipped
+        await db.archivedauction.create_many(
+            data=[_copy(a, AUCTION_COLUMNS) for a in auctions], skip_duplicates=True
+        )
+        if reservations:
+            await db.archivedreservation.create_many(
+                data=[_copy(r, RESERVATION_COLUMNS) for r in reservations], skip_duplicates=True
+            )
+        if notifications:
+            await db.archivednotification.create_many(
+                data=[_copy(n, NOTIFICATION_COLUMNS) for n in notifications], skip_duplicates=True
+            )
+
+        # Then delete, children before parents (foreign keys)
+        if notification_ids:
+            await db.notification.delete_many(where={"id": {"in": notification_ids}})
+        if reservation_ids:
+            await db.reservation.delete_many(where={"id": {"in": reservation_ids}})
+        await db.auction.delete_many(where={"id": {"in": auction_ids}})
+
+        return {
+            "auctions": len(auction_ids),
+            "reservations": len(reservation_ids),
+            "notifications": len(notification_ids),
+        }
+
+    async def list_archived_auctions(
+        self,
+        *,
+        studio_id: Optional[int] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+    ) -> Dict:
+        """
+        One page of archived auctions, most recently ended first.
+
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        where: Dict = keyset_where_desc("endTime", cursor)
+        if studio_id is not None:
+            where["studioId"] = studio_id
+        auctions = await db.archivedauction.find_many(
+            where=where, order=[{"endTime": "desc"}, {"id": "desc"}], take=limit + 1
+        )
+        page = _page(auctions, limit, "endTime")
+        return {
+            "auctions": [_copy(a, AUCTION_COLUMNS + ("archivedAt",)) for a in page["items"]],
+            "next_cursor": page["next_cursor"],
+            "count": len(page["items"]),
+        }
+
+    async def get_archived_auction(self, auction_id: int) -> Optional[Dict]:
+        """Archived auction with its reservation and notifications, or None."""
+        auction = await db.archivedauction.find_unique(where={"id": auction_id})
+        if not auction:
+            return None
+        reservation = await db.archivedreservation.find_unique(where={"auctionId": auction_id})
+        notifications = await db.archivednotification.find_many(
+            where={"auctionId": auction_id}, order={"createdAt": "asc"}
+        )
+        return {
+            "auction": _copy(auction, AUCTION_COLUMNS + ("archivedAt",)),
+            "reservation": _copy(reservation, RESERVATION_COLUMNS) if reservation else None,
+            "notifications": [_copy(n, NOTIFICATION_COLUMNS) for n in notifications],
+        }
+
+    async def list_user_history(self, user_id: int, *, cursor: Optional[str] = None, limit: int = 50) -> Dict:
+        """
+        One page of a user's archived reservations, newest first, with the
+        auction title and time of each.
+
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        where: Dict = keyset_where_desc("reservedAt", cursor)
+        where["userId"] = user_id
+        reservations = await db.archivedreservation.find_many(
+            where=where, order=[{"reservedAt": "desc"}, {"id": "desc"}], take=limit + 1
+        )
+        page = _page(reservations, limit, "reservedAt")
+
+        auction_ids = [r.auctionId for r in page["items"]]
+        auctions = {}
+        if auction_ids:
+            auctions = {a.id: a for a in await db.archivedauction.find_many(where={"id": {"in": auction_ids}})}
+
+        return {
+            "reservations": [
+                {
+                    "id": res.id,
+                    "auction_id": res.auctionId,
+                    "auction_title": getattr(auctions.get(res.auctionId), "title", None),
+                    "scheduled_at": getattr(auctions.get(res.auctionId), "scheduledAt", None),
+                    "studio_id": getattr(auctions.get(res.auctionId), "studioId", None),
+                    "locked_price": str(res.lockedPrice),
+                    "booking_code": res.bookingCode,
+                    "status": getattr(res.status, "name", str(res.status)),
+                    "reserved_at": res.reservedAt.isoformat() if res.reservedAt else None,
+                }
+                for res in page["items"]
+            ],
+            "next_cursor": page["next_cursor"],
+            "count": len(page["items"]),
+        }
+
+
+archive_service = ArchiveService()
@@ -1,13 +1,25 @@
+import copy
+import logging
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from app.core.db import db, connect_db
 from app.core.timezone import now_tr, to_tr_aware
 from app.services import socket_service
 from app.services.price_service import price_service
+from app.utils.pagination import keyset_where_after_id
 from app.utils.validators import ValidationError, auction_validator
 
+logger = logging.getLogger(__name__)
+
+
+# Columns written by the admin auction export, in order
+AUCTION_EXPORT_COLUMNS = (
+    "id", "title", "status", "studioId", "allowedGender", "startPrice", "floorPrice", "currentPrice",
+    "startTime", "endTime", "scheduledAt", "turboEnabled", "turboStartedAt", "createdAt",
+)
+
 
 class AuctionService:
     async def _find_many_auctions_with_reconnect(self):
@@ -72,6 +84,29 @@ class AuctionService:
 
         return auction
 
+    async def _with_current_price(self, auction, now: Optional[datetime] = None):
+        """
+        ACTIVE auction with `currentPrice` recomputed in memory, without a write.
+
+        Listing every auction used to persist each price drop, one update per
+        row per request; the scheduler (`check_pending_auctions`) keeps the
+        stored price current and emits the socket events.
+        """
+        if not auction or getattr(auction, "status", None) != "ACTIVE":
+            return auction
+
+        mapping = await self._to_mapping(auction)
+        computed_price, _ = price_service.compute_current_price(mapping, now=to_tr_aware(now) if now else now_tr())
+        current_price = mapping.get("currentPrice")
+        if current_price is not None and Decimal(str(current_price)) == Decimal(str(computed_price)):
+            return auction
+
+        if hasattr(auction, "model_copy"):
+            return auction.model_copy(update={"currentPrice": computed_price})
+        priced = copy.copy(auction)
+        priced.currentPrice = computed_price
+        return priced
+
     async def _check_and_update_status(self, auction) -> object:
         if not auction:
             return None
@@ -108,7 +143,7 @@ class AuctionService:
 
         return auction
 
-    async def _sync_status_with_reservation(self, auction):
+    async def _sync_status_with_reservation(self, auction, reservations=None):
         if not auction:
             return None
 
@@ -116,7 +151,9 @@ class AuctionService:
         if auction_id is None:
             return auction
 
-        reservations = await db.reservation.find_many(where={"auctionId": auction_id})
+        # Callers syncing many auctions prefetch reservations in one query
+        if reservations is None:
+            reservations = await db.reservation.find_many(where={"auctionId": auction_id})
         if not reservations:
             return auction
 
@@ -151,7 +188,7 @@ class AuctionService:
         if auction_status != "ACTIVE":
             return auction
 
-        result = await self.check_and_trigger_turbo(auction_id, now=now)
+        result = await self.check_and_trigger_turbo(auction_id, now=now, auction=auction)
         if result.get("triggered"):
             refreshed = await db.auction.find_unique(where={"id": auction_id})
             return refreshed or auction
@@ -225,7 +262,9 @@ class AuctionService:
                     "status": {
                         "in": ["DRAFT", "ACTIVE"]
                     }
-                }
+                },
+                # Matches auctions_live_startTime_endTime_idx (partial, DRAFT/ACTIVE only)
+                order={"startTime": "asc"},
             )
             for item in items:
                 checked = await self._check_and_update_status(item)
@@ -233,20 +272,59 @@ class AuctionService:
                 await self._sync_current_price(checked, emit_event=True)
             return len(items)
         except Exception as e:
-            print(f"Error checking pending auctions: {e}")
+            logger.exception(f"Error checking pending auctions: {e}")
             return 0
 
+    async def export_page(
+        self,
+        cursor: Optional[str],
+        limit: int,
+        *,
+        status: Optional[str] = None,
+        studio_id: Optional[int] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        One id-ordered page of raw auction rows for the admin export.
+
+        Read-only: unlike `list_auctions`, stored statuses and prices are
+        exported as they are, without syncing them first.
+
+        Returns:
+            (rows with AUCTION_EXPORT_COLUMNS, cursor for the next page or None)
+
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        where = keyset_where_after_id(cursor)
+        if status:
+            where["status"] = status
+        if studio_id is not None:
+            where["studioId"] = studio_id
+
+        auctions = await db.auction.find_many(where=where, order={"id": "asc"}, take=limit + 1)
+        has_more = len(auctions) > limit
+        auctions = auctions[:limit]
+        rows = [{column: getattr(a, column, None) for column in AUCTION_EXPORT_COLUMNS} for a in auctions]
+        return rows, str(auctions[-1].id) if has_more else None
+
     async def list_auctions(self, include_computed: bool = False, now=None):
         items = await self._find_many_auctions_with_reconnect()
 
         normalized_now = to_tr_aware(now) if now else None
 
+        reservations_by_auction = {}
+        auction_ids = [item.id for item in items if getattr(item, "id", None) is not None]
+        if auction_ids:
+            for reservation in await db.reservation.find_many(where={"auctionId": {"in": auction_ids}}):
+                reservations_by_auction.setdefault(reservation.auctionId, []).append(reservation)
+
+        # Per row only rare transitions write (reservation/status/turbo); prices are computed in memory
         updated_items = []
         for item in items:
-            checked = await self._sync_status_with_reservation(item)
+            checked = await self._sync_status_with_reservation(item, reservations_by_auction.get(item.id, []))
             checked = await self._check_and_update_status(checked)
             checked = await self._ensure_turbo_triggered(checked)
-            checked = await self._sync_current_price(checked)
+            checked = await self._with_current_price(checked, now=normalized_now)
             updated_items.append(checked)
         items = updated_items
 
@@ -422,12 +500,14 @@ class AuctionService:
         price, details = price_service.compute_current_price(mapping, now=normalized_now)
         return {"price": str(price), "details": details}
 
-    async def check_and_trigger_turbo(self, auction_id: int, now: Optional[datetime] = None):
+    async def check_and_trigger_turbo(self, auction_id: int, now: Optional[datetime] = None, auction=None):
         now_value = to_tr_aware(now) if now else now_tr()
         if now_value is None:
             now_value = now_tr()
 
-        auction = await db.auction.find_unique(where={"id": auction_id})
+        # Callers that just loaded the auction pass it to skip the lookup
+        if auction is None:
+            auction = await db.auction.find_unique(where={"id": auction_id})
         if not auction:
             return {"triggered": False, "reason": "auction_not_found", "turbo_started_at": None}
 
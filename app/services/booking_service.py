@@ -9,13 +9,20 @@ Key Design:
 """
 
 from app.core.db import db
+from app.core.metrics import BOOKING_DURATION, BOOKING_OUTCOMES
 from app.core.timezone import now_tr, to_tr_aware
 from app.services.price_service import price_service
 from app.utils.booking_utils import generate_booking_code
+from app.utils.pagination import encode_cursor, keyset_where_desc
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Dict, Optional, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
 from app.services import socket_service
+from app.services.email_outbox_service import email_outbox_service
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class BookingError(Exception):
@@ -53,6 +60,13 @@ class GenderNotEligibleError(BookingError):
     pass
 
 
+# Columns written by the admin reservation export, in order
+RESERVATION_EXPORT_COLUMNS = (
+    "id", "booking_code", "status", "auction_id", "auction_title", "studio_id", "user_id", "user_name",
+    "locked_price", "scheduled_at", "created_at",
+)
+
+
 class BookingService:
     """Service for managing booking/reservation operations"""
 
@@ -118,7 +132,26 @@ class BookingService:
 
         return cancelled_count
     
-    async def book_auction(
+    async def book_auction(self, auction_id: int, user_id: int) -> Dict:
+        """Book an auction, recording the outcome and duration for /metrics (see _book_auction)."""
+        started = time.perf_counter()
+        try:
+            result = await self._book_auction(auction_id, user_id)
+        except (AuctionAlreadyBookedError, AuctionNotActiveError):
+            BOOKING_OUTCOMES.labels("lost").inc()
+            raise
+        except (AuctionNotFoundError, UserNotFoundError, AdminCannotBookError, GenderNotEligibleError):
+            BOOKING_OUTCOMES.labels("rejected").inc()
+            raise
+        except Exception:
+            BOOKING_OUTCOMES.labels("error").inc()
+            raise
+        finally:
+            BOOKING_DURATION.observe(time.perf_counter() - started)
+        BOOKING_OUTCOMES.labels("won").inc()
+        return result
+
+    async def _book_auction(
         self, 
         auction_id: int, 
         user_id: int
@@ -242,6 +275,7 @@ class BookingService:
                 auction_id=auction_id,
                 status=str(getattr(reservation.status, "name", reservation.status)),
             )
+            await self._queue_booking_confirmation(user, auction, reservation)
 
             return result
         
@@ -254,6 +288,19 @@ class BookingService:
                     f"Auction {auction_id} is already reserved or race condition detected"
                 )
             raise BookingError(f"Booking failed: {str(e)}")
+
+    async def _queue_booking_confirmation(self, user, auction, reservation) -> None:
+        # The reservation stands even if the email cannot be queued
+        try:
+            await email_outbox_service.enqueue_booking_confirmation(user, auction, reservation)
+        except Exception as exc:
+            logger.warning(f"Booking confirmation email for reservation {reservation.id} not queued: {exc}")
+
+    async def _queue_cancellation_email(self, user, auction, reservation, cancel_source: str) -> None:
+        try:
+            await email_outbox_service.enqueue_reservation_cancelled(user, auction, reservation, cancel_source)
+        except Exception as exc:
+            logger.warning(f"Cancellation email for reservation {reservation.id} not queued: {exc}")
     
     async def get_reservation(self, reservation_id: int) -> Optional[Dict]:
         """Get reservation details by ID"""
@@ -314,34 +361,132 @@ class BookingService:
             for res in reservations
         ]
 
-    async def get_all_reservations(self) -> list[Dict]:
+    async def get_all_reservations(
+        self,
+        *,
+        status: Optional[str] = None,
+        studio_id: Optional[int] = None,
+        auction_id: Optional[int] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        include_counts: bool = True,
+    ) -> Dict:
         """
-        Get all reservations with user and auction details.
+        Get one page of reservations for the admin table, newest first.
+
+        Uses keyset pagination on (reservedAt, id) so deep pages cost the same
+        as the first one. Only the columns rendered by the admin table are
+        returned. The first page (no cursor) also carries `counts` for the
+        stats cards, computed over every matching reservation rather than the
+        loaded pages.
+
+        Args:
+            status: Optional PaymentStatus filter
+            studio_id: Only reservations for auctions of this studio
+            auction_id: Only the reservation of this auction
+            date_from: Inclusive lower bound on reservedAt
+            date_to: Inclusive upper bound on reservedAt
+            search: Case-insensitive match on booking code, user name or auction title
+            cursor: `next_cursor` from the previous page
+            limit: Page size
+            include_counts: Add `counts` to the first page
+
+        Returns:
+            Dict {"reservations": list, "next_cursor": str | None, "count": int,
+                  "counts": {"total", "pending_on_site", "completed"} (first page only)}
+
+        Raises:
+            ValueError: If cursor is malformed
         """
+        # Scope of the stats cards: studio/auction/date filters only
+        scope: Dict = {}
+        if auction_id is not None:
+            scope["auctionId"] = auction_id
+        if studio_id is not None:
+            scope["auction"] = {"is": {"studioId": studio_id}}
+
+        reserved_at_range = {}
+        if date_from:
+            reserved_at_range["gte"] = to_tr_aware(date_from)
+        if date_to:
+            reserved_at_range["lte"] = to_tr_aware(date_to)
+        if reserved_at_range:
+            scope["reservedAt"] = reserved_at_range
+
+        clauses = [scope]
+        if status:
+            clauses.append({"status": status})
+        if search and search.strip():
+            text = {"contains": search.strip(), "mode": "insensitive"}
+            clauses.append({"OR": [
+                {"bookingCode": text},
+                {"user": {"is": {"fullName": text}}},
+                {"auction": {"is": {"title": text}}},
+            ]})
+        keyset = keyset_where_desc("reservedAt", cursor)
+        if keyset:
+            clauses.append(keyset)
+        where: Dict = {"AND": clauses} if len(clauses) > 1 else scope
+
+        # Fetch one extra row to know whether another page exists
         reservations = await db.reservation.find_many(
+            where=where,
             include={
                 "user": True,
                 "auction": True
             },
-            order={"reservedAt": "desc"}
+            order=[{"reservedAt": "desc"}, {"id": "desc"}],
+            take=limit + 1,
         )
-        
-        return [
-            {
-                "id": res.id,
-                "auction_id": res.auctionId,
-                "user_id": res.userId,
-                "user_name": res.user.fullName if res.user else "Unknown User",
-                "auction_title": res.auction.title if res.auction else "Unknown Auction",
-                "scheduled_at": getattr(res.auction, "scheduledAt", None) if res.auction else None,
-                "studio_id": getattr(res.auction, "studioId", None) if res.auction else None,
-                "locked_price": str(res.lockedPrice),
-                "booking_code": res.bookingCode,
-                "status": getattr(res.status, 'name', str(res.status)) if res.status else 'CONFIRMED',
-                "created_at": res.reservedAt.isoformat() if res.reservedAt else None,
+
+        has_more = len(reservations) > limit
+        reservations = reservations[:limit]
+        next_cursor = None
+        if has_more and reservations:
+            last = reservations[-1]
+            next_cursor = encode_cursor(last.reservedAt, last.id)
+
+        page = {
+            "reservations": [
+                {
+                    "id": res.id,
+                    "auction_id": res.auctionId,
+                    "user_id": res.userId,
+                    "user_name": res.user.fullName if res.user else "Unknown User",
+                    "auction_title": res.auction.title if res.auction else "Unknown Auction",
+                    "scheduled_at": getattr(res.auction, "scheduledAt", None) if res.auction else None,
+                    "studio_id": getattr(res.auction, "studioId", None) if res.auction else None,
+                    "locked_price": str(res.lockedPrice),
+                    "booking_code": res.bookingCode,
+                    "status": getattr(res.status, 'name', str(res.status)) if res.status else 'CONFIRMED',
+                    "created_at": res.reservedAt.isoformat() if res.reservedAt else None,
+                }
+                for res in reservations
+            ],
+            "next_cursor": next_cursor,
+            "count": len(reservations),
+        }
+        if include_counts and not cursor:
+            page["counts"] = {
+                "total": await db.reservation.count(where=scope),
+                "pending_on_site": await db.reservation.count(where={**scope, "status": "PENDING_ON_SITE"}),
+                "completed": await db.reservation.count(where={**scope, "status": "COMPLETED"}),
             }
-            for res in reservations
-        ]
+        return page
+
+    async def export_page(self, cursor: Optional[str], limit: int, **filters) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Admin table rows for a streaming export; same filters and order as
+        `get_all_reservations`.
+
+        Returns:
+            (rows, cursor for the next page or None)
+        """
+        page = await self.get_all_reservations(cursor=cursor, limit=limit, include_counts=False, **filters)
+        return page["reservations"], page["next_cursor"]
 
     async def get_reservation_with_details(self, reservation_id: int) -> Optional[Dict]:
         """
@@ -423,6 +568,8 @@ class BookingService:
             reservation_id=reservation_id,
             auction_id=auction_id,
         )
+        if user:
+            await self._queue_cancellation_email(user, auction, reservation, cancel_source)
 
         user_name = getattr(user, "fullName", "Bilinmeyen Kullanıcı")
         auction_title = getattr(auction, "title", "Bilinmeyen Oturum")
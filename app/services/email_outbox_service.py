@@ -0,0 +1,199 @@
+"""
+Email Outbox Service - persistent queue for transactional email.
+
+Request handlers only insert a row into `email_outbox`; a separate delivery
+worker (scripts/email_worker.py) drains it. This keeps SMTP/Gmail latency
+out of web workers and survives restarts.
+
+Delivery rules:
+1. Claim: a row is moved PENDING → SENDING with a conditional update, so two
+   workers never send the same message
+2. Retry: failures go back to PENDING with exponential backoff
+3. Dead-letter: after EMAIL_OUTBOX_MAX_ATTEMPTS the row is marked DEAD and
+   kept for inspection
+4. Recovery: SENDING rows whose lock is older than the timeout (crashed
+   worker) are claimed again
+"""
+
+import asyncio
+import logging
+from datetime import timedelta
+from decimal import Decimal
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.db import db
+from app.core.email import render_verification_email, send_email
+from app.core.email_templates import email_templates
+from app.core.timezone import now_tr, to_tr_aware
+
+logger = logging.getLogger(__name__)
+
+# `reason` line of the reservation_cancelled email, by cancel_source
+CANCEL_REASONS = {
+    "USER": "Rezervasyonunu sen iptal ettin.",
+    "ADMIN": "Rezervasyonun stüdyo tarafından iptal edildi.",
+    "AUTO_NO_SHOW": "Seans saatine kadar stüdyoda giriş yapılmadığı için rezervasyon otomatik iptal edildi.",
+    "SYSTEM": "Rezervasyonun sistem tarafından iptal edildi.",
+}
+
+Sender = Callable[[str, str, str], Awaitable[None]]
+
+
+class EmailOutboxService:
+    """Service for queueing and delivering outbox emails"""
+
+    async def enqueue(self, email_to: str, subject: str, html: str):
+        return await db.emailoutbox.create(
+            data={
+                "toEmail": str(email_to),
+                "subject": subject,
+                "html": html,
+                "status": "PENDING",
+                "attempts": 0,
+                "nextAttemptAt": now_tr(),
+            }
+        )
+
+    async def enqueue_verification_email(self, email_to: str, token: str) -> None:
+        if not settings.EMAILS_ENABLED:
+            logger.info(f"Verification token for {email_to}: {token}") # Log token for dev without email server
+            return
+        subject, html_content = render_verification_email(token)
+        await self.enqueue(email_to, subject, html_content)
+
+    async def enqueue_template(self, template_name: str, email_to: str, **context):
+        """Render a registered email template and queue it."""
+        subject, html_content = email_templates.render(template_name, **context)
+        return await self.enqueue(email_to, subject, html_content)
+
+    async def enqueue_booking_confirmation(self, user, auction, reservation) -> None:
+        """Queue the booking confirmation for a new reservation."""
+        if not settings.EMAILS_ENABLED:
+            return
+        studio_id = getattr(auction, "studioId", None)
+        studio = await db.studio.find_unique(where={"id": studio_id}) if studio_id else None
+        scheduled_at = to_tr_aware(getattr(auction, "scheduledAt", None) or getattr(auction, "startTime", None))
+        await self.enqueue_template(
+            "booking_confirmation",
+            user.email,
+            full_name=getattr(user, "fullName", ""),
+            auction_title=getattr(auction, "title", ""),
+            booking_code=reservation.bookingCode,
+            scheduled_at=scheduled_at.strftime("%d.%m.%Y %H:%M") if scheduled_at else "-",
+            locked_price=f"{Decimal(str(reservation.lockedPrice)):.2f}",
+            studio_name=getattr(studio, "name", "") or "",
+            studio_address=f"({studio.address})" if getattr(studio, "address", None) else "",
+        )
+
+    async def enqueue_reservation_cancelled(self, user, auction, reservation, cancel_source: str) -> None:
+        """Queue the cancellation notice; the reason depends on who cancelled."""
+        if not settings.EMAILS_ENABLED:
+            return
+        await self.enqueue_template(
+            "reservation_cancelled",
+            user.email,
+            full_name=getattr(user, "fullName", ""),
+            auction_title=getattr(auction, "title", "") if auction else "",
+            booking_code=reservation.bookingCode,
+            reason=CANCEL_REASONS.get(str(cancel_source or "").upper(), CANCEL_REASONS["SYSTEM"]),
+        )
+
+    def _retry_delay(self, attempts: int) -> float:
+        delay = settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0))
+        return min(delay, settings.EMAIL_OUTBOX_RETRY_MAX_SECONDS)
+
+    async def _claim(self, message, now) -> bool:
+        # Matching on the previous status and lock makes the claim a compare-and-set
+        claimed = await db.emailoutbox.update_many(
+            where={"id": message.id, "status": message.status, "lockedAt": getattr(message, "lockedAt", None)},
+            data={"status": "SENDING", "lockedAt": now},
+        )
+        return claimed == 1
+
+    async def _deliver_one(self, message, sender: Sender) -> str:
+        attempts = (getattr(message, "attempts", 0) or 0) + 1
+        try:
+            await sender(message.toEmail, message.subject, message.html)
+        except Exception as e:
+            error = f"{type(e).__name__}: {str(e)}"[:1000]
+            if attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                logger.error(f"❌ Outbox email {message.id} to {message.toEmail} dead-lettered: {error}")
+                data = {"status": "DEAD", "attempts": attempts, "lastError": error, "lockedAt": None}
+                result = "dead"
+            else:
+                logger.warning(f"Outbox email {message.id} attempt {attempts} failed: {error}")
+                data = {
+                    "status": "PENDING",
+                    "attempts": attempts,
+                    "lastError": error,
+                    "lockedAt": None,
+                    "nextAttemptAt": now_tr() + timedelta(seconds=self._retry_delay(attempts)),
+                }
+                result = "retried"
+            await db.emailoutbox.update(where={"id": message.id}, data=data)
+            return result
+
+        await db.emailoutbox.update(
+            where={"id": message.id},
+            data={"status": "SENT", "attempts": attempts, "sentAt": now_tr(), "lockedAt": None},
+        )
+        return "sent"
+
+    async def deliver_due(self, batch_size: Optional[int] = None, sender: Optional[Sender] = None) -> Dict[str, int]:
+        """
+        Deliver one batch of due outbox emails.
+
+        Args:
+            batch_size: Max messages to claim (defaults to EMAIL_OUTBOX_BATCH_SIZE)
+            sender: Coroutine (email_to, subject, html) used for delivery (defaults to send_email)
+
+        Returns:
+            Counts of sent, retried and dead-lettered messages
+        """
+        batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+        sender = sender or (lambda to, subject, html: send_email(to, subject, html))
+        now = now_tr()
+        stale_before = now - timedelta(seconds=settings.EMAIL_OUTBOX_LOCK_TIMEOUT_SECONDS)
+
+        candidates = await db.emailoutbox.find_many(
+            where={
+                "OR": [
+                    {"status": "PENDING", "nextAttemptAt": {"lte": now}},
+                    {"status": "SENDING", "lockedAt": {"lt": stale_before}},
+                ]
+            },
+            order=[{"nextAttemptAt": "asc"}, {"id": "asc"}],
+            take=batch_size,
+        )
+
+        claimed = []
+        for message in candidates:
+            if await self._claim(message, now):
+                claimed.append(message)
+
+        results = await asyncio.gather(*(self._deliver_one(message, sender) for message in claimed))
+        return {
+            "sent": results.count("sent"),
+            "retried": results.count("retried"),
+            "dead": results.count("dead"),
+        }
+
+    async def run_worker(self, stop_event: Optional[asyncio.Event] = None) -> None:
+        """Poll the outbox until `stop_event` is set; full batches are drained without waiting."""
+        stop_event = stop_event or asyncio.Event()
+        while not stop_event.is_set():
+            try:
+                counts = await self.deliver_due()
+            except Exception as e:
+                logger.error(f"Email outbox worker error: {type(e).__name__}: {str(e)}")
+                counts = {}
+            if sum(counts.values()) >= settings.EMAIL_OUTBOX_BATCH_SIZE:
+                continue
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=settings.EMAIL_OUTBOX_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+
+email_outbox_service = EmailOutboxService()
@@ -0,0 +1,133 @@
+"""Pre-rendered public auction feed.
+
+Every visitor of the home page gets the same auction list, so it is built
+once, kept in memory as JSON bytes and served as-is. Its ETag also lets
+`CompressionMiddleware` encode each snapshot once per encoding.
+Any successful write to auctions or studios bumps `version` (see
+`InstrumentedPrisma.add_write_listener`); the next request rebuilds the
+snapshot, and concurrent requests wait for that single rebuild instead of
+each running it. `FEED_SNAPSHOT_MAX_AGE_SECONDS` bounds staleness for writes
+made by other worker processes.
+
+Logo URLs in the body are absolute, so there is one snapshot per public base
+URL. With `PUBLIC_BASE_URL` set that is a single snapshot; otherwise the base
+comes from the request's Host header, which clients choose, so at most
+`max_snapshots` are kept and the least recently used is dropped first.
+
+Prices need no rebuild of their own: the scheduler's price drops are auction
+writes, and clients follow live prices through `price_update` events.
+"""
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from fastapi.responses import Response
+
+from app.core.compression import etag_matches
+from app.core.config import settings
+from app.core.db import db
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FeedSnapshot:
+    body: bytes
+    etag: str
+    version: int
+    built_at: float
+
+    def response(self, if_none_match: Optional[str]) -> Response:
+        # Compressed copies carry W/"<etag>"; weak comparison matches both
+        etag = f'"{self.etag}"'
+        headers = {"ETag": etag, "Cache-Control": "public, no-cache", "Vary": "Accept-Encoding"}
+        if etag_matches(etag, if_none_match):
+            return Response(status_code=304, headers=headers)
+        return Response(self.body, headers=headers, media_type="application/json")
+
+
+class PublicFeed:
+    def __init__(self, max_age_seconds: float, max_snapshots: int = 8):
+        self.max_age_seconds = max_age_seconds
+        self.max_snapshots = max_snapshots
+        self.version = 0
+        # One snapshot per public base URL, least recently used first
+        self._snapshots: "OrderedDict[str, FeedSnapshot]" = OrderedDict()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop = None
+        self.hits = 0
+        self.rebuilds = 0
+        self.last_build_ms = 0.0
+
+    def invalidate(self, *_args) -> None:
+        self.version += 1
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Locks bind to the loop they first wait on; keep one per loop
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _fresh(self, snapshot: Optional[FeedSnapshot]) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.version == self.version
+            and time.monotonic() - snapshot.built_at < self.max_age_seconds
+        )
+
+    async def get(self, key: str, build: Callable[[], Awaitable[bytes]]) -> FeedSnapshot:
+        snapshot = self._snapshots.get(key)
+        if self._fresh(snapshot):
+            self._snapshots.move_to_end(key)
+            self.hits += 1
+            return snapshot
+
+        async with self._get_lock():
+            # Another request may have rebuilt it while we waited
+            snapshot = self._snapshots.get(key)
+            if self._fresh(snapshot):
+                self.hits += 1
+                return snapshot
+
+            # Writes made while building leave the snapshot one version behind,
+            # so the next request rebuilds again
+            version = self.version
+            started = time.perf_counter()
+            body = await build()
+            snapshot = FeedSnapshot(
+                body=body,
+                etag=hashlib.sha256(body).hexdigest()[:32],
+                version=version,
+                built_at=time.monotonic(),
+            )
+            self._snapshots[key] = snapshot
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+            self.rebuilds += 1
+            self.last_build_ms = (time.perf_counter() - started) * 1000
+            logger.debug(f"Public feed rebuilt: {len(body)} bytes in {self.last_build_ms:.1f}ms")
+        return snapshot
+
+    def stats(self) -> dict:
+        return {
+            "version": self.version,
+            "snapshots": len(self._snapshots),
+            "hits": self.hits,
+            "rebuilds": self.rebuilds,
+            "last_build_ms": round(self.last_build_ms, 2),
+        }
+
+
+public_feed = PublicFeed(
+    max_age_seconds=settings.FEED_SNAPSHOT_MAX_AGE_SECONDS,
+    max_snapshots=settings.FEED_SNAPSHOT_MAX_HOSTS,
+)
+# Reservations change auctions through auction writes, so these two suffice
+db.add_write_listener(public_feed.invalidate, models=("auction", "studio"))
@@ -0,0 +1,120 @@
+"""Background pipeline that renders resized logo variants.
+
+`upload_studio_logo` saves the original and calls `schedule`; the thumb, card
+and full WebP variants are rendered in a process pool and their URLs stored
+on the studio. Listings then serve `logoCardUrl` instead of the full upload
+(`app.utils.urls.listing_logo_url`).
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Set
+
+from app.core.config import settings
+from app.services.studio_service import studio_service
+from app.utils.images import LOGO_VARIANTS, images_available, render_logo_variants
+
+logger = logging.getLogger(__name__)
+
+
+class LogoService:
+    def __init__(self, max_workers: int, quality: int, enabled: bool = True):
+        self.max_workers = max_workers
+        self.quality = quality
+        self.enabled = enabled
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._warned_unavailable = False
+        self.completed = 0
+        self.failed = 0
+        self.stale = 0
+        self.total_render_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that runs the logging and loop-monitor
+            # threads can copy held locks into the child
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def schedule(self, studio_id: int, source_path: str, public_path: str) -> Optional[asyncio.Task]:
+        """Start rendering variants for a freshly saved logo; returns immediately."""
+        if not self.enabled:
+            return None
+        if not images_available():
+            if not self._warned_unavailable:
+                logger.warning("Pillow is not installed; studio logos are served without resized variants")
+                self._warned_unavailable = True
+            return None
+        task = asyncio.create_task(self.process(studio_id, source_path, public_path))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def process(self, studio_id: int, source_path: str, public_path: str) -> Optional[dict]:
+        directory = os.path.dirname(source_path)
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        url_prefix = public_path.rsplit("/", 1)[0]
+        started_at = time.perf_counter()
+        try:
+            rendered = await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), render_logo_variants,
+                source_path, directory, stem, LOGO_VARIANTS, self.quality,
+            )
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Logo variants failed for studio {studio_id} ({source_path}): {e}")
+            return None
+        self.total_render_seconds += time.perf_counter() - started_at
+
+        variants = {variant: f"{url_prefix}/{filename}" for variant, (filename, _) in rendered.items()}
+        try:
+            applied = await studio_service.set_logo_variants(studio_id, public_path, variants)
+        except Exception as e:
+            self.failed += 1
+            logger.error(f"Storing logo variants failed for studio {studio_id}: {e}")
+            return None
+        if not applied:
+            # A newer logo was uploaded while this one rendered
+            self.stale += 1
+            return None
+
+        self.completed += 1
+        sizes = ", ".join(f"{variant}={size}B" for variant, (_, size) in rendered.items())
+        logger.info(f"Logo variants ready for studio {studio_id}: {sizes}")
+        return variants
+
+    async def drain(self) -> None:
+        """Wait for every scheduled render (tests, graceful shutdown)."""
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def stats(self) -> dict:
+        rendered = (self.completed + self.stale) or 1
+        return {
+            "enabled": self.enabled and images_available(),
+            "workers": self.max_workers,
+            "pending": len(self._tasks),
+            "completed": self.completed,
+            "failed": self.failed,
+            "stale": self.stale,
+            "avg_render_ms": round(self.total_render_seconds / rendered * 1000, 2),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+logo_service = LogoService(
+    max_workers=settings.LOGO_PIPELINE_WORKERS,
+    quality=settings.LOGO_VARIANT_QUALITY,
+    enabled=settings.LOGO_PIPELINE_ENABLED,
+)
@@ -1,5 +1,6 @@
 from typing import Optional
 from app.core.db import db
+from app.core.user_cache import user_cache
 from app.models.studio import StudioCreate, StudioUpdate
 import logging
 
@@ -37,12 +38,43 @@ class StudioService:
             return await self.get_studio_by_id(studio_id)
             
         try:
-            return await db.studio.update(
+            studio = await db.studio.update(
                 where={"id": studio_id},
                 data=update_data
             )
+            # Cached users embed their studio; drop them so the change is visible
+            await user_cache.invalidate_studio(studio_id)
+            return studio
         except Exception as e:
             logger.error(f"Error updating studio {studio_id}: {e}")
             raise
 
+    async def set_logo(self, studio_id: int, logo_url: str):
+        """
+        Point the studio at a new logo and drop the variants of the old one.
+        """
+        try:
+            studio = await db.studio.update(
+                where={"id": studio_id},
+                data={"logoUrl": logo_url, "logoThumbUrl": None, "logoCardUrl": None, "logoFullUrl": None},
+            )
+            await user_cache.invalidate_studio(studio_id)
+            return studio
+        except Exception as e:
+            logger.error(f"Error setting logo for studio {studio_id}: {e}")
+            raise
+
+    async def set_logo_variants(self, studio_id: int, source_url: str, variants: dict) -> bool:
+        """
+        Store resized logo URLs ({"thumb": ..., "card": ..., "full": ...}).
+
+        Only applied while `source_url` is still the studio's logo, so a slow
+        render never overwrites the variants of a newer upload.
+        """
+        data = {f"logo{variant.capitalize()}Url": url for variant, url in variants.items()}
+        updated = await db.studio.update_many(where={"id": studio_id, "logoUrl": source_url}, data=data)
+        if updated:
+            await user_cache.invalidate_studio(studio_id)
+        return bool(updated)
+
 studio_service = StudioService()
\ No newline at end of file
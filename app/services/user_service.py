@@ -1,6 +1,13 @@
+from typing import List, Optional, Tuple
+
 from app.core.db import db
 from app.models.user import UserCreate
 from app.core import security
+from app.core.user_cache import user_cache
+from app.utils.pagination import keyset_where_after_id
+
+# Columns written by the admin user export; never includes hashedPassword
+USER_EXPORT_COLUMNS = ("id", "email", "fullName", "phone", "gender", "role", "isVerified", "studioId", "createdAt")
 
 
 def _turkish_lower(text: str) -> str:
@@ -41,7 +48,7 @@ def _normalize_full_name(full_name: str) -> str:
 
 class UserService:
     async def create_user(self, user_in: UserCreate):
-        hashed_password = security.get_password_hash(user_in.password)
+        hashed_password = await security.get_password_hash_async(user_in.password)
         normalized_full_name = _normalize_full_name(user_in.full_name)
         user = await db.user.create(
             data={
@@ -54,6 +61,24 @@ class UserService:
         )
         return user
 
+    async def export_page(
+        self, cursor: Optional[str], limit: int, *, role: Optional[str] = None
+    ) -> Tuple[List[dict], Optional[str]]:
+        """
+        One id-ordered page of users for the admin export.
+
+        Raises:
+            ValueError: If cursor is malformed
+        """
+        where = keyset_where_after_id(cursor)
+        if role:
+            where["role"] = role
+        users = await db.user.find_many(where=where, order={"id": "asc"}, take=limit + 1)
+        has_more = len(users) > limit
+        users = users[:limit]
+        rows = [{column: getattr(u, column, None) for column in USER_EXPORT_COLUMNS} for u in users]
+        return rows, str(users[-1].id) if has_more else None
+
     async def get_user_by_email(self, email: str):
         return await db.user.find_unique(
             where={"email": email},
@@ -67,16 +92,21 @@ class UserService:
         )
 
     async def verify_user(self, email: str):
-        return await db.user.update(
+        user = await db.user.update(
             where={"email": email},
             data={"isVerified": True}
         )
+        if user is not None:
+            await user_cache.invalidate(user.id)
+        return user
 
     async def update_password(self, user_id: int, new_password: str):
-        hashed_password = security.get_password_hash(new_password)
-        return await db.user.update(
+        hashed_password = await security.get_password_hash_async(new_password)
+        user = await db.user.update(
             where={"id": user_id},
             data={"hashedPassword": hashed_password}
         )
+        await user_cache.invalidate(user_id)
+        return user
             
 user_service = UserService()
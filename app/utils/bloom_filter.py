@@ -0,0 +1,44 @@
+"""Small in-process Bloom filter.
+
+A Bloom filter answers "definitely not present" with no false negatives and a
+configurable false-positive rate. It cannot remove items; rebuild it to drop
+stale entries.
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Bit-array Bloom filter using double hashing over one blake2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false-positive probability at `capacity` items
+        """
+        capacity = max(1, int(capacity))
+        error_rate = min(max(error_rate, 1e-9), 0.5)
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hash_count = max(1, int(round(self.size / capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
@@ -0,0 +1,94 @@
+"""Streaming CSV / NDJSON exports for admin reporting.
+
+An export never holds the whole table: `keyset_batches` pages through the
+database with a keyset cursor (`EXPORT_BATCH_SIZE` rows per query) and
+`export_response` encodes each batch into one chunk as soon as it arrives.
+Worker memory stays at one batch however long the history gets, and the
+client starts receiving rows before the last page is read.
+
+`fetch_page(cursor, limit)` returns ``(rows, next_cursor)``; rows are dicts
+and only the requested `columns` are written, in that order.
+"""
+import csv
+import io
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Sequence, Tuple
+
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_json
+
+from app.core.timezone import now_tr
+
+FetchPage = Callable[[Optional[str], int], Awaitable[Tuple[List[dict], Optional[str]]]]
+
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+async def keyset_batches(fetch_page: FetchPage, batch_size: int) -> AsyncIterator[List[dict]]:
+    """Yield pages from `fetch_page` until it stops returning a cursor."""
+    cursor = None
+    while True:
+        rows, cursor = await fetch_page(cursor, batch_size)
+        if rows:
+            yield rows
+        if not cursor:
+            return
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+async def csv_chunks(batches: AsyncIterator[List[dict]], columns: Sequence[str]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM so spreadsheet apps read Turkish characters as UTF-8
+    buffer.write("﻿")
+    writer.writerow(columns)
+    yield buffer.getvalue().encode("utf-8")
+
+    async for rows in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_value(row.get(column)) for column in columns] for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def ndjson_chunks(batches: AsyncIterator[List[dict]], columns: Sequence[str]) -> AsyncIterator[bytes]:
+    async for rows in batches:
+        yield b"".join(to_json({column: row.get(column) for column in columns}) + b"\n" for row in rows)
+
+
+def export_response(fetch_page: FetchPage, export_format: str, columns: Sequence[str],
+                    name: str, batch_size: int) -> StreamingResponse:
+    """
+    StreamingResponse writing every row reachable through `fetch_page`.
+
+    Args:
+        fetch_page: Keyset page loader, see module docstring
+        export_format: "csv" or "ndjson"
+        columns: Row keys to write, in order
+        name: File name prefix for Content-Disposition
+        batch_size: Rows per database query
+    """
+    batches = keyset_batches(fetch_page, batch_size)
+    chunks = csv_chunks(batches, columns) if export_format == "csv" else ndjson_chunks(batches, columns)
+    filename = f"{name}-{now_tr():%Y%m%d-%H%M}.{export_format}"
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "Cache-Control": "no-store"},
+    )
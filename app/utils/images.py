@@ -0,0 +1,84 @@
+"""Logo derivative rendering.
+
+`render_logo_variants` is a plain top-level function so it can be sent to a
+process pool: decoding, resampling and WebP encoding are CPU bound and would
+otherwise stall the event loop (or hold the GIL in a thread pool). Pillow is
+optional; without it `images_available()` is False and callers keep serving
+the original upload.
+"""
+import hashlib
+import io
+import os
+import tempfile
+from typing import Dict, Tuple
+
+from app.utils.uploads import content_hash_name
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - depends on the environment
+    Image = None
+    ImageOps = None
+
+# name -> longest edge in pixels
+LOGO_VARIANTS: Dict[str, int] = {
+    "thumb": 96,    # navbar / admin lists
+    "card": 320,    # AuctionCard.vue
+    "full": 1024,   # studio detail
+}
+
+VARIANT_EXTENSION = "webp"
+
+
+def images_available() -> bool:
+    return Image is not None
+
+
+def _resize(image, max_edge: int):
+    image = image.copy()
+    # thumbnail() keeps the aspect ratio and never upscales
+    image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+    return image
+
+
+def render_logo_variants(source_path: str, directory: str, stem: str,
+                         sizes: Dict[str, int], quality: int = 80) -> Dict[str, Tuple[str, int]]:
+    """
+    Write one WebP per entry in `sizes` next to the source upload.
+
+    Files are named `<stem>_<variant>_<content hash>.webp` and written through
+    a temporary file + rename, so a half-encoded variant is never served and a
+    changed encoding (e.g. another quality) gets a new URL.
+
+    Returns:
+        {variant: (filename, bytes)}
+    """
+    if Image is None:
+        raise RuntimeError("Pillow is not installed")
+
+    with Image.open(source_path) as source:
+        # Animated GIF/WebP: the first frame is enough for a logo
+        source.seek(0)
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA", "P") else "RGB")
+
+        rendered = {}
+        for variant, max_edge in sizes.items():
+            buffer = io.BytesIO()
+            _resize(image, max_edge).save(buffer, format="WEBP", quality=quality, method=4)
+            data = buffer.getvalue()
+            filename = content_hash_name(f"{stem}_{variant}", hashlib.sha256(data).hexdigest(), VARIANT_EXTENSION)
+            fd, part_path = tempfile.mkstemp(dir=directory, prefix=".variant-", suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as handle:
+                    handle.write(data)
+                os.replace(part_path, os.path.join(directory, filename))
+            except BaseException:
+                try:
+                    os.remove(part_path)
+                except FileNotFoundError:
+                    pass
+                raise
+            rendered[variant] = (filename, len(data))
+    return rendered
@@ -0,0 +1,74 @@
+"""Keyset (cursor) pagination helpers.
+
+Cursors are opaque strings built from the sort key of the last row on a page
+plus its id as a tie-breaker, e.g. ``2026-03-01T12:00:00+03:00|42``. Clients
+send the cursor back unchanged to fetch the next page.
+"""
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+from app.core.timezone import to_tr_aware
+
+
+def encode_cursor(sort_value: Optional[datetime], row_id: int) -> str:
+    """
+    Build a cursor from the last row of a page.
+
+    Args:
+        sort_value: Value of the sort column (e.g. reservedAt) for the last row
+        row_id: Primary key of the last row (tie-breaker for equal sort values)
+
+    Returns:
+        Opaque cursor string
+    """
+    sort_part = sort_value.isoformat() if sort_value else ""
+    return f"{sort_part}|{row_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Parse a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor: Cursor string received from the client
+
+    Returns:
+        Tuple of (sort_value, row_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    sort_part, sep, id_part = (cursor or "").rpartition("|")
+    if not sep or not sort_part:
+        raise ValueError("Invalid cursor")
+    return to_tr_aware(datetime.fromisoformat(sort_part)), int(id_part)
+
+
+def keyset_where_desc(field: str, cursor: Optional[str]) -> dict:
+    """
+    Prisma `where` fragment selecting rows strictly after `cursor` when
+    ordering by ``{field: "desc"}, {"id": "desc"}``.
+    """
+    if not cursor:
+        return {}
+    sort_value, row_id = decode_cursor(cursor)
+    return {
+        "OR": [
+            {field: {"lt": sort_value}},
+            {field: sort_value, "id": {"lt": row_id}},
+        ]
+    }
+
+
+def keyset_where_after_id(cursor: Optional[str]) -> dict:
+    """
+    Prisma `where` fragment selecting rows after `cursor` when ordering by
+    ``{"id": "asc"}``; the cursor is the id of the last row seen.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return {}
+    return {"id": {"gt": int(cursor)}}
@@ -0,0 +1,153 @@
+"""Streaming upload storage.
+
+Uploaded files are copied chunk by chunk. Every disk operation (create, write,
+fsync, rename) runs in a worker thread, so a large file never blocks the event
+loop. The size cap is checked after every chunk and the copy stops as soon as
+it is exceeded. Data goes to a hidden `.part` file that is renamed into place
+only when complete, so readers never see a half-written file. The file type is
+detected from the first chunk's magic bytes; the client's filename and
+Content-Type are not trusted.
+
+Final names end in a hash of the content (`content_hash_name`), so a URL always
+maps to the same bytes and can be cached as immutable (see
+`app.core.static_files`).
+"""
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# (magic bytes, offset, extension, content type)
+_IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", 0, "png", "image/png"),
+    (b"\xff\xd8\xff", 0, "jpg", "image/jpeg"),
+    (b"GIF87a", 0, "gif", "image/gif"),
+    (b"GIF89a", 0, "gif", "image/gif"),
+    (b"WEBP", 8, "webp", "image/webp"),
+)
+
+
+# Hex digits of the SHA-256 kept in file names
+CONTENT_HASH_LENGTH = 16
+CONTENT_HASHED_NAME = re.compile(rf"_[0-9a-f]{{{CONTENT_HASH_LENGTH}}}\.[A-Za-z0-9]+$")
+
+
+def content_hash_name(stem: str, digest: str, extension: str) -> str:
+    """`<stem>_<hash>.<ext>`; the name changes whenever the content does."""
+    return f"{stem}_{digest[:CONTENT_HASH_LENGTH]}.{extension}"
+
+
+def is_content_hashed(filename: str) -> bool:
+    return CONTENT_HASHED_NAME.search(filename) is not None
+
+
+class UploadError(Exception):
+    """Base class for rejected uploads."""
+
+
+class UploadTooLargeError(UploadError):
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Upload exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+class UnsupportedUploadError(UploadError):
+    pass
+
+
+@dataclass(frozen=True)
+class SavedUpload:
+    filename: str
+    path: str
+    size: int
+    content_type: str
+
+
+def sniff_image(head: bytes) -> Optional[Tuple[str, str]]:
+    """(extension, content type) of a PNG/JPEG/GIF/WebP from its first bytes, else None."""
+    for magic, offset, extension, content_type in _IMAGE_SIGNATURES:
+        if head[offset:offset + len(magic)] == magic:
+            if extension == "webp" and head[:4] != b"RIFF":
+                continue
+            return extension, content_type
+    return None
+
+
+def _open_part_file(directory: str):
+    os.makedirs(directory, exist_ok=True)
+    fd, path = tempfile.mkstemp(dir=directory, prefix=".upload-", suffix=".part")
+    return os.fdopen(fd, "wb"), path
+
+
+def _write_chunk(handle, digest, chunk: bytes) -> None:
+    digest.update(chunk)
+    handle.write(chunk)
+
+
+def _finish(handle, part_path: str, final_path: str) -> None:
+    handle.flush()
+    os.fsync(handle.fileno())
+    handle.close()
+    os.replace(part_path, final_path)
+
+
+def _discard(handle, part_path: str) -> None:
+    handle.close()
+    try:
+        os.remove(part_path)
+    except FileNotFoundError:
+        pass
+
+
+async def save_image_upload(upload, directory: str, name_prefix: str, max_bytes: int,
+                            chunk_size: int = 64 * 1024) -> SavedUpload:
+    """
+    Stream an image upload into `directory` as `<name_prefix>_<content hash>.<ext>`.
+
+    Uploading identical bytes again yields the same name, which simply
+    replaces the existing file.
+
+    Args:
+        upload: Starlette/FastAPI UploadFile (anything with `async read(n)`)
+        directory: Target directory (created if missing)
+        name_prefix: Filename prefix, e.g. the studio id
+        max_bytes: Hard size cap
+        chunk_size: Bytes read and written per step
+
+    Raises:
+        UnsupportedUploadError: The content is not a PNG/JPEG/GIF/WebP image
+        UploadTooLargeError: The upload exceeds `max_bytes` (nothing is kept)
+    """
+    # UploadFile knows the spooled size; no need to copy anything to find out
+    declared_size = getattr(upload, "size", None)
+    if declared_size is not None and declared_size > max_bytes:
+        raise UploadTooLargeError(max_bytes)
+
+    chunk = await upload.read(chunk_size)
+    detected = sniff_image(chunk)
+    if detected is None:
+        raise UnsupportedUploadError("Unsupported image format")
+    extension, content_type = detected
+
+    handle, part_path = await asyncio.to_thread(_open_part_file, directory)
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        while chunk:
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLargeError(max_bytes)
+            await asyncio.to_thread(_write_chunk, handle, digest, chunk)
+            chunk = await upload.read(chunk_size)
+
+        filename = content_hash_name(name_prefix, digest.hexdigest(), extension)
+        final_path = os.path.join(directory, filename)
+        await asyncio.to_thread(_finish, handle, part_path, final_path)
+    except BaseException:
+        await asyncio.to_thread(_discard, handle, part_path)
+        raise
+
+    return SavedUpload(filename=filename, path=final_path, size=size, content_type=content_type)
@@ -0,0 +1,74 @@
+"""Response-layer URL resolution for uploaded assets.
+
+Logos are stored as relative `/uploads/...` paths. A `UrlResolver` is built
+once per request (from `PUBLIC_BASE_URL` or the request's base URL) and turns
+a nested studio into a response dict with an absolute `logoUrl`. Models are
+never mutated, so cached users/studios keep their stored paths, and each
+studio is resolved once per request however many auctions embed it.
+"""
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+
+from app.core.config import settings
+
+UPLOADS_PREFIX = "/uploads/"
+
+
+def _field(obj: Any, name: str) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def _fields(obj: Any) -> Dict[str, Any]:
+    if isinstance(obj, dict):
+        return dict(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return dict(vars(obj))
+
+
+def listing_logo_url(studio: Any) -> Optional[str]:
+    """The logo URL auction listings should show: the card variant once rendered."""
+    if studio is None:
+        return None
+    return _field(studio, "logoCardUrl") or _field(studio, "logoUrl")
+
+
+class UrlResolver:
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+        self._studios: Dict[tuple, Dict[str, Any]] = {}
+
+    @classmethod
+    def for_request(cls, request: Request) -> "UrlResolver":
+        return cls(settings.PUBLIC_BASE_URL or str(request.base_url))
+
+    def absolute(self, url: Optional[str]) -> Optional[str]:
+        if url and url.startswith(UPLOADS_PREFIX):
+            return f"{self.base_url}{url}"
+        return url
+
+    def studio(self, studio: Any, listing: bool = False) -> Optional[Dict[str, Any]]:
+        """
+        Response dict for a nested studio with an absolute `logoUrl`.
+
+        `listing=True` serves the card-sized logo variant when it exists. The
+        returned dict is shared between items of the same response; callers
+        must not modify it.
+        """
+        if studio is None:
+            return None
+        key = (_field(studio, "id"), _field(studio, "logoUrl"), _field(studio, "logoCardUrl"), listing)
+        resolved = self._studios.get(key)
+        if resolved is None:
+            logo = listing_logo_url(studio) if listing else _field(studio, "logoUrl")
+            resolved = {**_fields(studio), "logoUrl": self.absolute(logo)}
+            self._studios[key] = resolved
+        return resolved
+
+
+def get_url_resolver(request: Request) -> UrlResolver:
+    """FastAPI dependency: one resolver per request."""
+    return UrlResolver.for_request(request)
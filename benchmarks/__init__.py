@@ -0,0 +1 @@
+"""In-process performance benchmarks (python -m benchmarks.run)."""
@@ -0,0 +1,75 @@
+"""Deterministic benchmark data shaped like `scripts/seed_auctions.py` rows."""
+import random
+from datetime import timedelta
+from decimal import Decimal
+
+from app.core import security
+from app.core.timezone import now_tr
+
+BENCH_PASSWORD = "BenchPass123!"
+
+_hashed_password = None
+
+
+def bench_password_hash() -> str:
+    # pbkdf2 is deliberately slow; hash once and share it between users
+    global _hashed_password
+    if _hashed_password is None:
+        _hashed_password = security.get_password_hash(BENCH_PASSWORD)
+    return _hashed_password
+
+
+def user_rows(count: int, start_id: int = 1):
+    hashed = bench_password_hash()
+    now = now_tr()
+    return [
+        {
+            "id": user_id,
+            "email": f"bench{user_id}@example.com",
+            "phone": f"+90555{user_id:07d}",
+            "fullName": f"Bench User {user_id}",
+            "hashedPassword": hashed,
+            "gender": "FEMALE" if user_id % 2 else "MALE",
+            "role": "USER",
+            "isVerified": True,
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        for user_id in range(start_id, start_id + count)
+    ]
+
+
+def auction_rows(count: int, start_id: int = 1, status: str = "ACTIVE", seed: int = 42):
+    rng = random.Random(seed)
+    now = now_tr()
+    rows = []
+    for auction_id in range(start_id, start_id + count):
+        start_price = Decimal(rng.randrange(200, 800, 10))
+        start_time = now - timedelta(minutes=rng.randint(5, 240))
+        end_time = now + timedelta(minutes=rng.randint(30, 600))
+        turbo = rng.random() < 0.3
+        rows.append({
+            "id": auction_id,
+            "title": f"Bench Session {auction_id}",
+            "description": "Benchmark oturumu",
+            # ANY keeps every benchmark user eligible to book
+            "allowedGender": "ANY",
+            "startPrice": start_price,
+            "floorPrice": (start_price / 2).quantize(Decimal("0.01")),
+            "currentPrice": start_price,
+            "startTime": start_time,
+            "endTime": end_time,
+            "scheduledAt": end_time + timedelta(minutes=45),
+            "dropIntervalMins": rng.choice((5, 10, 15, 30, 60)),
+            "dropAmount": Decimal(rng.randrange(5, 30)),
+            "turboEnabled": turbo,
+            "turboTriggerMins": 120,
+            "turboDropAmount": Decimal("5.00") if turbo else Decimal("0.00"),
+            "turboIntervalMins": 10,
+            "turboStartedAt": None,
+            "status": status,
+            "studioId": None,
+            "createdAt": now,
+            "updatedAt": now,
+        })
+    return rows
@@ -0,0 +1,141 @@
+"""Timing, result and baseline-comparison helpers for the benchmark suite."""
+import asyncio
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    iterations: int
+    concurrency: int
+    total_seconds: float
+    ops_per_sec: float
+    mean_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    extra: Dict[str, object] = field(default_factory=dict)
+
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(percent / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def summarize(name: str, latencies: List[float], total_seconds: float, concurrency: int = 1,
+              extra: Optional[Dict[str, object]] = None) -> BenchmarkResult:
+    ordered = sorted(latencies)
+    return BenchmarkResult(
+        name=name,
+        iterations=len(ordered),
+        concurrency=concurrency,
+        total_seconds=round(total_seconds, 6),
+        ops_per_sec=round(len(ordered) / total_seconds, 2) if total_seconds else 0.0,
+        mean_ms=round(statistics.fmean(ordered) * 1000, 4) if ordered else 0.0,
+        p50_ms=round(_percentile(ordered, 50) * 1000, 4),
+        p95_ms=round(_percentile(ordered, 95) * 1000, 4),
+        p99_ms=round(_percentile(ordered, 99) * 1000, 4),
+        max_ms=round(ordered[-1] * 1000, 4) if ordered else 0.0,
+        extra=extra or {},
+    )
+
+
+async def measure(name: str, operation: Callable[[int], Awaitable[object]], iterations: int,
+                  concurrency: int = 1, warmup: int = 0,
+                  extra: Optional[Dict[str, object]] = None) -> BenchmarkResult:
+    """
+    Run `operation(i)` `iterations` times with up to `concurrency` in flight and
+    record each call's latency. Warm-up calls are run first and not recorded.
+    """
+    for index in range(warmup):
+        await operation(-1 - index)
+
+    latencies: List[float] = []
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def timed(index: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            await operation(index)
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    if concurrency <= 1:
+        for index in range(iterations):
+            await timed(index)
+    else:
+        await asyncio.gather(*(timed(index) for index in range(iterations)))
+    return summarize(name, latencies, time.perf_counter() - started, concurrency, extra)
+
+
+def build_report(results: List[BenchmarkResult], scale: str) -> dict:
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "scale": scale,
+        },
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def load_report(path: str) -> dict:
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compare(report: dict, baseline: dict, metric: str = "p50_ms", threshold: float = 0.10) -> List[dict]:
+    """
+    Compare `metric` per benchmark against a baseline report.
+
+    Returns one row per benchmark present in both reports with the relative
+    change; `regressed` is set when it got slower by more than `threshold`.
+    """
+    rows = []
+    for name, current in report["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        before, after = previous[metric], current[metric]
+        change = (after - before) / before if before else 0.0
+        rows.append({
+            "name": name,
+            "metric": metric,
+            "baseline": before,
+            "current": after,
+            "change": round(change, 4),
+            "regressed": change > threshold,
+        })
+    return rows
+
+
+def format_results(results: List[BenchmarkResult]) -> str:
+    lines = [f"{'benchmark':<28}{'iters':>8}{'ops/s':>12}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<28}{result.iterations:>8}{result.ops_per_sec:>12.1f}"
+            f"{result.p50_ms:>11.3f}{result.p95_ms:>11.3f}{result.p99_ms:>11.3f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[dict]) -> str:
+    lines = [f"{'benchmark':<28}{'baseline':>12}{'current':>12}{'change':>10}"]
+    for row in rows:
+        marker = "  REGRESSION" if row["regressed"] else ""
+        lines.append(
+            f"{row['name']:<28}{row['baseline']:>12.3f}{row['current']:>12.3f}{row['change'] * 100:>9.1f}%{marker}"
+        )
+    return "\n".join(lines)
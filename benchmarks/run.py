@@ -0,0 +1,80 @@
+"""
+HotHour Benchmark Runner
+Kullanım: python -m benchmarks.run [--scale small|full] [--only a,b] [--output out.json]
+                                   [--baseline base.json] [--threshold 0.10] [--fail-on-regression]
+
+Drives the ASGI app in-process against the in-memory FakePrisma, so results
+measure application code (routing, validation, services, Socket.IO fan-out)
+without network or database noise. Typical flow:
+
+    python -m benchmarks.run --output baseline.json          # before a change
+    python -m benchmarks.run --baseline baseline.json        # after it
+
+The comparison uses p50 latency per benchmark; a slowdown beyond
+--threshold is marked as a regression.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Benchmarks always run against the in-memory database
+os.environ["ENABLE_FAKE_PRISMA"] = "1"
+os.environ.setdefault("DATABASE_URL", "postgresql://benchmark@localhost/benchmark")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="HotHour performance benchmarks")
+    parser.add_argument("--scale", default="small", choices=("small", "full"))
+    parser.add_argument("--only", default="", help="Comma-separated benchmark names")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--baseline", help="Compare against a previous JSON report")
+    parser.add_argument("--metric", default="p50_ms", help="Result field used for the baseline comparison")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown before flagging (0.10 = 10%%)")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with status 1 on regressions")
+    return parser.parse_args(argv)
+
+
+async def run(args) -> int:
+    from benchmarks.harness import build_report, compare, format_comparison, format_results, load_report
+    from benchmarks.scenarios import SCALES, SCENARIOS
+
+    selected = [name.strip() for name in args.only.split(",") if name.strip()] or list(SCENARIOS)
+    unknown = [name for name in selected if name not in SCENARIOS]
+    if unknown:
+        print(f"❌ Bilinmeyen benchmark: {', '.join(unknown)} (mevcut: {', '.join(SCENARIOS)})")
+        return 2
+
+    scale = SCALES[args.scale]
+    results = []
+    for name in selected:
+        print(f"⏱️  {name} ...", flush=True)
+        results.append(await SCENARIOS[name](scale))
+
+    report = build_report(results, args.scale)
+    print()
+    print(format_results(results))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, default=str)
+        print(f"\n💾 Rapor yazıldı: {args.output}")
+
+    if args.baseline:
+        rows = compare(report, load_report(args.baseline), metric=args.metric, threshold=args.threshold)
+        print()
+        print(format_comparison(rows))
+        if args.fail_on_regression and any(row["regressed"] for row in rows):
+            return 1
+    return 0
+
+
+def main():
+    sys.exit(asyncio.run(run(parse_args())))
+
+
+if __name__ == "__main__":
+    main()
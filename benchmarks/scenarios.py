@@ -0,0 +1,212 @@
+"""Benchmark scenarios.
+
+Every scenario resets the in-memory database, loads the rows it needs and
+drives the real ASGI `app` (HTTP through httpx's ASGITransport, Socket.IO
+through the server's room manager) so middleware, routing, validation and
+services are all part of the measurement.
+"""
+import random
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+from httpx import ASGITransport, AsyncClient
+
+from app.core import security
+from app.core.db import db
+from app.core.socket import sio
+from app.main import app, update_auctions_job
+from app.services import socket_service
+from benchmarks.dataset import BENCH_PASSWORD, auction_rows, user_rows
+from benchmarks.harness import BenchmarkResult, measure
+
+
+@dataclass(frozen=True)
+class Scale:
+    list_auctions: int
+    detail_requests: int
+    storm_rounds: int
+    storm_size: int
+    scheduler_auctions: int
+    socket_clients: int
+    auth_requests: int
+
+
+SCALES: Dict[str, Scale] = {
+    # Quick sanity run (CI, before/after a small change)
+    "small": Scale(list_auctions=200, detail_requests=300, storm_rounds=10, storm_size=20,
+                   scheduler_auctions=1000, socket_clients=1000, auth_requests=50),
+    # The production-shaped numbers the performance work is measured against
+    "full": Scale(list_auctions=2000, detail_requests=2000, storm_rounds=30, storm_size=100,
+                  scheduler_auctions=10000, socket_clients=10000, auth_requests=200),
+}
+
+
+def _client() -> AsyncClient:
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://bench")
+
+
+def _reset_db() -> None:
+    db._client.reset()
+
+
+def _auth_headers(user_id: int) -> dict:
+    return {"Authorization": f"Bearer {security.create_access_token(subject=user_id)}"}
+
+
+async def bench_auction_list(scale: Scale) -> BenchmarkResult:
+    _reset_db()
+    await db.auction.create_many(data=auction_rows(scale.list_auctions))
+    async with _client() as client:
+        async def list_all(_):
+            response = await client.get("/api/v1/auctions/")
+            assert response.status_code == 200, response.text
+
+        return await measure("auction_list", list_all, iterations=30, warmup=2,
+                             extra={"auctions": scale.list_auctions})
+
+
+async def bench_public_feed(scale: Scale) -> BenchmarkResult:
+    """The cached home-page feed under many concurrent visitors."""
+    _reset_db()
+    await db.auction.create_many(data=auction_rows(scale.list_auctions))
+    async with _client() as client:
+        async def feed(_):
+            response = await client.get("/api/v1/auctions/feed", headers={"Accept-Encoding": "gzip"})
+            assert response.status_code == 200, response.text
+
+        return await measure("public_feed", feed, iterations=scale.detail_requests, concurrency=50, warmup=2,
+                             extra={"auctions": scale.list_auctions})
+
+
+async def bench_auction_detail(scale: Scale) -> BenchmarkResult:
+    _reset_db()
+    await db.auction.create_many(data=auction_rows(scale.list_auctions))
+    rng = random.Random(7)
+    async with _client() as client:
+        async def detail(_):
+            response = await client.get(f"/api/v1/auctions/{rng.randint(1, scale.list_auctions)}")
+            assert response.status_code == 200, response.text
+
+        return await measure("auction_detail", detail, iterations=scale.detail_requests, concurrency=10, warmup=5)
+
+
+async def bench_booking_storm(scale: Scale) -> BenchmarkResult:
+    """`storm_size` users race for each auction; exactly one booking per auction may win."""
+    _reset_db()
+    await db.user.create_many(data=user_rows(scale.storm_size))
+    await db.auction.create_many(data=auction_rows(scale.storm_rounds))
+    headers = {user_id: _auth_headers(user_id) for user_id in range(1, scale.storm_size + 1)}
+    outcomes = {"won": 0, "lost": 0}
+
+    async with _client() as client:
+        async def book(index):
+            auction_id = index // scale.storm_size + 1
+            user_id = index % scale.storm_size + 1
+            response = await client.post(
+                "/api/v1/reservations/book",
+                json={"auction_id": auction_id, "user_id": user_id},
+                headers=headers[user_id],
+            )
+            assert response.status_code in (201, 400, 409), response.text
+            outcomes["won" if response.status_code == 201 else "lost"] += 1
+
+        result = await measure("booking_storm", book, iterations=scale.storm_rounds * scale.storm_size,
+                               concurrency=scale.storm_size)
+
+    assert outcomes["won"] == scale.storm_rounds, outcomes
+    result.extra.update(outcomes)
+    return result
+
+
+async def bench_scheduler_tick(scale: Scale) -> BenchmarkResult:
+    _reset_db()
+    await db.auction.create_many(data=auction_rows(scale.scheduler_auctions))
+
+    async def tick(_):
+        await update_auctions_job()
+
+    return await measure("scheduler_tick", tick, iterations=3, extra={"live_auctions": scale.scheduler_auctions})
+
+
+async def bench_socket_fanout(scale: Scale) -> BenchmarkResult:
+    """Broadcast price updates to `socket_clients` simulated clients in one auction room."""
+    delivered = {"packets": 0}
+    room = "auction:1"
+
+    async def fake_send_packet(eio_sid, packet):
+        delivered["packets"] += 1
+
+    sids = []
+    for index in range(scale.socket_clients):
+        sid = await sio.manager.connect(f"bench-eio-{index}", "/")
+        sio.manager.basic_enter_room(sid, "/", room)
+        sids.append(sid)
+
+    original_send_packet = sio.eio.send_packet
+    sio.eio.send_packet = fake_send_packet
+    try:
+        async def broadcast(index):
+            await socket_service.emit_price_update(1, f"{500 - index % 100}.00", {"source": "benchmark"})
+
+        result = await measure("socket_fanout", broadcast, iterations=20, warmup=1,
+                               extra={"clients": scale.socket_clients})
+    finally:
+        sio.eio.send_packet = original_send_packet
+        for sid in sids:
+            sio.manager.basic_disconnect(sid, "/")
+
+    result.extra["packets_sent"] = delivered["packets"]
+    result.extra["deliveries_per_sec"] = round(result.ops_per_sec * scale.socket_clients, 1)
+    return result
+
+
+async def bench_auth_login(scale: Scale) -> BenchmarkResult:
+    _reset_db()
+    await db.user.create_many(data=user_rows(scale.auth_requests))
+    async with _client() as client:
+        async def login(index):
+            user_id = index % scale.auth_requests + 1
+            response = await client.post(
+                "/api/v1/auth/login", json={"email": f"bench{user_id}@example.com", "password": BENCH_PASSWORD}
+            )
+            assert response.status_code == 200, response.text
+
+        return await measure("auth_login", login, iterations=scale.auth_requests, concurrency=8)
+
+
+async def bench_auth_me(scale: Scale) -> BenchmarkResult:
+    _reset_db()
+    await db.user.create_many(data=user_rows(scale.auth_requests))
+    async with _client() as client:
+        async def me(index):
+            user_id = index % scale.auth_requests + 1
+            response = await client.get("/api/v1/auth/me", headers=_auth_headers(user_id))
+            assert response.status_code == 200, response.text
+
+        return await measure("auth_me", me, iterations=scale.auth_requests * 5, concurrency=10, warmup=5)
+
+
+async def bench_auth_refresh(scale: Scale) -> BenchmarkResult:
+    _reset_db()
+    await db.user.create_many(data=user_rows(1))
+    token = {"refresh": security.create_refresh_token(subject=1)}
+    async with _client() as client:
+        async def refresh(_):
+            response = await client.post("/api/v1/auth/refresh", json={"refresh_token": token["refresh"]})
+            assert response.status_code == 200, response.text
+            token["refresh"] = response.json()["refresh_token"]
+
+        return await measure("auth_refresh", refresh, iterations=scale.auth_requests * 2)
+
+
+SCENARIOS: Dict[str, Callable[[Scale], BenchmarkResult]] = {
+    "auction_list": bench_auction_list,
+    "public_feed": bench_public_feed,
+    "auction_detail": bench_auction_detail,
+    "booking_storm": bench_booking_storm,
+    "scheduler_tick": bench_scheduler_tick,
+    "socket_fanout": bench_socket_fanout,
+    "auth_login": bench_auth_login,
+    "auth_me": bench_auth_me,
+    "auth_refresh": bench_auth_refresh,
+}
@@ -0,0 +1,374 @@
+"""Deterministic synthetic data at production scale.
+
+`SyntheticDataset` streams rows for every table from a seed, so the same
+profile, seed and reference time (`now`, `DEFAULT_NOW` unless given) always
+produce the same database, table by table. Each table
+draws from its own RNG, so changing the user count does not reshuffle the
+auctions.
+
+Rows follow the shapes the app produces:
+- class sessions cluster at popular studio hours, weighted towards weekday
+  evenings, over a window reaching `days_back` into the past and
+  `days_ahead` into the future
+- auction status follows from its times: DRAFT before start, ACTIVE while
+  running, SOLD/EXPIRED once over (`sell_through` of finished auctions sell)
+- bookings land late in the auction window (buyers wait for price drops) at
+  the price the drop schedule had reached
+- past bookings are mostly COMPLETED, with no-show and customer cancellations
+  producing the matching admin notifications
+
+`load_dataset` inserts through `create_many` in batches (FakePrisma or the
+real client); `write_csv` produces files for PostgreSQL `\\copy`.
+"""
+import csv
+import math
+import os
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, Iterator, List, Optional
+
+from app.core import security
+from app.core.timezone import TR_TIMEZONE
+
+# Reference time when none is given; a fixed epoch keeps runs on different days identical
+DEFAULT_NOW = datetime(2026, 1, 5, 12, 0, tzinfo=TR_TIMEZONE)
+
+TABLES = ("studios", "users", "auctions", "reservations", "notifications")
+# Prisma model delegate per table
+MODELS = {
+    "studios": "studio",
+    "users": "user",
+    "auctions": "auction",
+    "reservations": "reservation",
+    "notifications": "notification",
+}
+
+SESSION_HOURS = ((7, 0), (9, 0), (10, 30), (12, 15), (18, 0), (19, 30), (21, 0))
+SESSION_HOUR_WEIGHTS = (8, 10, 6, 7, 20, 25, 12)
+# Monday..Sunday
+WEEKDAY_WEIGHTS = (16, 16, 15, 15, 13, 14, 11)
+ALLOWED_GENDERS = (("ANY", 50), ("FEMALE", 35), ("MALE", 15))
+SESSION_TITLES = (
+    "Sabah Pilates Reformer", "HIIT Cardio Burn", "Spinning Blast 45", "Total Body Strength",
+    "Mat Pilates Flow", "Yin Yoga", "Boxing Fit", "Mobility & Stretch", "Core Sculpt", "Barre Tone",
+)
+FIRST_NAMES = ("Ayşe", "Elif", "Zeynep", "Merve", "Deniz", "Ece", "Can", "Emre", "Mert", "Burak", "Selin", "Kaan")
+LAST_NAMES = ("Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Aydın", "Öztürk", "Arslan", "Doğan")
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    users: int = 50_000
+    admins: int = 5
+    studios: int = 50
+    auctions: int = 100_000
+    days_back: int = 180
+    days_ahead: int = 14
+    # Share of finished auctions that were booked
+    sell_through: float = 0.6
+    seed: int = 1
+
+
+PROFILES: Dict[str, LoadProfile] = {
+    "small": LoadProfile(users=2_000, studios=10, auctions=5_000),
+    "medium": LoadProfile(users=10_000, studios=25, auctions=25_000),
+    "production": LoadProfile(),
+}
+
+
+def _weighted(rng: random.Random, options, weights):
+    return rng.choices(options, weights=weights, k=1)[0]
+
+
+def user_gender(user_id: int) -> str:
+    # Deterministic per id (~65% FEMALE) so reservations can pick eligible users without the user table
+    return "FEMALE" if (user_id * 2654435761) % 100 < 65 else "MALE"
+
+
+class SyntheticDataset:
+    def __init__(self, profile: LoadProfile, now: Optional[datetime] = None, password: str = "LoadTest123!"):
+        self.profile = profile
+        self.now = now or DEFAULT_NOW
+        self.password = password
+        self._hashed_password: Optional[str] = None
+
+    def _rng(self, table: str) -> random.Random:
+        return random.Random(f"{self.profile.seed}:{table}")
+
+    @property
+    def hashed_password(self) -> str:
+        # One pbkdf2 hash shared by every generated user
+        if self._hashed_password is None:
+            self._hashed_password = security.get_password_hash(self.password)
+        return self._hashed_password
+
+    def rows(self, table: str) -> Iterator[dict]:
+        return getattr(self, table)()
+
+    def studios(self) -> Iterator[dict]:
+        created = self.now - timedelta(days=self.profile.days_back + 30)
+        for studio_id in range(1, self.profile.studios + 1):
+            yield {
+                "id": studio_id,
+                "name": f"Studio {studio_id:03d}",
+                "logoUrl": None,
+                "googleMapsUrl": None,
+                "address": f"Bağdat Cad. No:{studio_id}, İstanbul",
+                "createdAt": created,
+                "updatedAt": created,
+            }
+
+    def users(self) -> Iterator[dict]:
+        rng = self._rng("users")
+        history = timedelta(days=self.profile.days_back + 30)
+        for user_id in range(1, self.profile.users + 1):
+            is_admin = user_id <= self.profile.admins
+            # Sign-ups grow over time: more recent accounts than old ones
+            age = history * (1 - math.sqrt(rng.random()))
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            yield {
+                "id": user_id,
+                "email": f"user{user_id}@loadtest.hothour.local",
+                "phone": f"+90530{user_id:07d}",
+                "fullName": f"{first} {last}",
+                "gender": user_gender(user_id),
+                "hashedPassword": self.hashed_password,
+                "role": "ADMIN" if is_admin else "USER",
+                "isVerified": is_admin or rng.random() < 0.92,
+                "createdAt": self.now - age,
+                "studioId": (user_id - 1) % self.profile.studios + 1 if is_admin and self.profile.studios else None,
+            }
+
+    def _session_time(self, rng: random.Random) -> datetime:
+        span_days = self.profile.days_back + self.profile.days_ahead
+        while True:
+            day = (self.now - timedelta(days=self.profile.days_back) + timedelta(days=rng.randrange(span_days))).date()
+            # Reject days in proportion to their weekday weight
+            if rng.random() * max(WEEKDAY_WEIGHTS) <= WEEKDAY_WEIGHTS[day.weekday()]:
+                break
+        hour, minute = _weighted(rng, SESSION_HOURS, SESSION_HOUR_WEIGHTS)
+        return datetime(day.year, day.month, day.day, hour, minute, tzinfo=self.now.tzinfo)
+
+    def auctions(self) -> Iterator[dict]:
+        rng = self._rng("auctions")
+        sell_rng = self._rng("auction-sales")
+        gender_options = [gender for gender, _ in ALLOWED_GENDERS]
+        gender_weights = [weight for _, weight in ALLOWED_GENDERS]
+        for auction_id in range(1, self.profile.auctions + 1):
+            scheduled_at = self._session_time(rng)
+            end_time = scheduled_at - timedelta(minutes=45)
+            start_time = end_time - timedelta(hours=rng.choice((3, 6, 12, 24, 48, 72)))
+            start_price = Decimal(rng.randrange(250, 1200, 50)).quantize(Decimal("0.01"))
+            floor_price = (start_price * Decimal(rng.choice(("0.4", "0.5", "0.6")))).quantize(Decimal("0.01"))
+            drop_interval = rng.choice((10, 15, 30, 60))
+            drop_amount = Decimal(rng.randrange(5, 40, 5)).quantize(Decimal("0.01"))
+            turbo = rng.random() < 0.3
+
+            if self.now < start_time:
+                status, current_price = "DRAFT", start_price
+            elif self.now < end_time:
+                status = "ACTIVE"
+                current_price = self._price_at(start_price, floor_price, drop_amount, drop_interval, start_time, self.now)
+            else:
+                status = "SOLD" if sell_rng.random() < self.profile.sell_through else "EXPIRED"
+                current_price = floor_price if status == "EXPIRED" else start_price
+
+            yield {
+                "id": auction_id,
+                "title": rng.choice(SESSION_TITLES),
+                "description": None,
+                "allowedGender": _weighted(rng, gender_options, gender_weights),
+                "startPrice": start_price,
+                "floorPrice": floor_price,
+                "currentPrice": current_price,
+                "startTime": start_time,
+                "endTime": end_time,
+                "scheduledAt": scheduled_at,
+                "dropIntervalMins": drop_interval,
+                "dropAmount": drop_amount,
+                "turboEnabled": turbo,
+                "turboTriggerMins": 120,
+                "turboDropAmount": Decimal("10.00") if turbo else Decimal("0.00"),
+                "turboIntervalMins": 10,
+                "turboStartedAt": None,
+                "status": status,
+                "studioId": rng.randint(1, self.profile.studios) if self.profile.studios else None,
+                "createdAt": start_time - timedelta(hours=rng.randint(1, 48)),
+                "updatedAt": min(end_time, self.now),
+            }
+
+    @staticmethod
+    def _price_at(start_price, floor_price, drop_amount, drop_interval, start_time, at) -> Decimal:
+        drops = max(0, int((at - start_time).total_seconds() // (drop_interval * 60)))
+        return max(floor_price, start_price - drop_amount * drops)
+
+    def _pick_user(self, rng: random.Random, allowed_gender: str) -> int:
+        first_customer = self.profile.admins + 1
+        customers = self.profile.users - self.profile.admins
+        start = rng.randrange(customers)
+        # Walk forward from a random customer to the first eligible one
+        for offset in range(customers):
+            user_id = first_customer + (start + offset) % customers
+            if allowed_gender == "ANY" or user_gender(user_id) == allowed_gender:
+                return user_id
+        return first_customer + start
+
+    def _bookings(self) -> Iterator[dict]:
+        """Reservation rows (with the auction fields notifications need) for every SOLD auction."""
+        if self.profile.users <= self.profile.admins:
+            return
+        rng = self._rng("reservations")
+        reservation_id = 0
+        for auction in self.auctions():
+            if auction["status"] != "SOLD":
+                continue
+            reservation_id += 1
+            window = auction["endTime"] - auction["startTime"]
+            reserved_at = auction["startTime"] + window * rng.betavariate(3, 1.5)
+            locked_price = self._price_at(
+                auction["startPrice"], auction["floorPrice"], auction["dropAmount"],
+                auction["dropIntervalMins"], auction["startTime"], reserved_at,
+            )
+            if auction["scheduledAt"] > self.now:
+                status = "PENDING_ON_SITE"
+            else:
+                status = rng.choices(("COMPLETED", "NO_SHOW", "CANCELLED"), weights=(85, 8, 7), k=1)[0]
+            yield {
+                "id": reservation_id,
+                "auctionId": auction["id"],
+                "userId": self._pick_user(rng, auction["allowedGender"]),
+                "lockedPrice": locked_price,
+                "bookingCode": f"HOT-{reservation_id:07X}",
+                "status": status,
+                "reservedAt": reserved_at,
+                "_title": auction["title"],
+                "_scheduledAt": auction["scheduledAt"],
+            }
+
+    def reservations(self) -> Iterator[dict]:
+        for booking in self._bookings():
+            yield {key: value for key, value in booking.items() if not key.startswith("_")}
+
+    def notifications(self) -> Iterator[dict]:
+        rng = self._rng("notifications")
+        notification_id = 0
+        admins = range(1, min(self.profile.admins, self.profile.users) + 1)
+        for booking in self._bookings():
+            if booking["status"] == "NO_SHOW":
+                kind, title = "AUTO_CANCEL_NO_SHOW", "Otomatik Rezervasyon İptali"
+                message = f'"{booking["_title"]}" oturumu için (kod: {booking["bookingCode"]}) giriş yapılmadı.'
+                created_at = booking["_scheduledAt"]
+            elif booking["status"] == "CANCELLED":
+                kind, title = "USER_CANCELLED_BY_CUSTOMER", "Müşteri Rezervasyonu İptal Etti"
+                message = f'"{booking["_title"]}" oturumu için rezervasyon (kod: {booking["bookingCode"]}) iptal edildi.'
+                created_at = booking["reservedAt"] + (booking["_scheduledAt"] - booking["reservedAt"]) * rng.random()
+            else:
+                continue
+            # One notification per admin, mirroring BookingService._create_admin_notifications
+            for admin_id in admins:
+                notification_id += 1
+                yield {
+                    "id": notification_id,
+                    "userId": admin_id,
+                    "reservationId": booking["id"],
+                    "auctionId": booking["auctionId"],
+                    "type": kind,
+                    "title": title,
+                    "message": message,
+                    "isRead": created_at < self.now - timedelta(days=3) or rng.random() < 0.3,
+                    "createdAt": created_at,
+                }
+
+
+def batched(rows: Iterator[dict], size: int) -> Iterator[List[dict]]:
+    batch: List[dict] = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def load_dataset(client, dataset: SyntheticDataset, batch_size: int = 5000,
+                       progress: Optional[Callable[[str, int], None]] = None) -> Dict[str, int]:
+    """
+    Insert every table through `create_many` in batches (parents first).
+
+    Rows carry explicit ids so relations line up; on PostgreSQL the id
+    sequences are moved past the inserted ids afterwards.
+    """
+    counts = {}
+    for table in TABLES:
+        model = getattr(client, MODELS[table])
+        inserted = 0
+        for batch in batched(dataset.rows(table), batch_size):
+            inserted += await model.create_many(data=batch)
+            if progress:
+                progress(table, inserted)
+        counts[table] = inserted
+
+    execute_raw = getattr(client, "execute_raw", None)
+    if execute_raw is not None:
+        for table in TABLES:
+            await execute_raw(
+                f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), "
+                f"COALESCE((SELECT MAX(id) FROM \"{table}\"), 0) + 1, false)"
+            )
+    return counts
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def write_csv(dataset: SyntheticDataset, directory: str,
+              progress: Optional[Callable[[str, int], None]] = None) -> Dict[str, int]:
+    """
+    Write one CSV per table plus `load.sql`, which bulk-loads them with psql:
+
+        psql "$DATABASE_URL" -f <directory>/load.sql
+
+    COPY skips per-row statement overhead, which matters at 100k+ rows.
+    Empty fields load as NULL.
+    """
+    os.makedirs(directory, exist_ok=True)
+    counts = {}
+    copy_commands = []
+    for table in TABLES:
+        path = os.path.join(directory, f"{table}.csv")
+        written = 0
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = None
+            for row in dataset.rows(table):
+                if writer is None:
+                    columns = list(row)
+                    writer = csv.writer(handle)
+                    writer.writerow(columns)
+                writer.writerow([_csv_value(row[column]) for column in columns])
+                written += 1
+                if progress and written % 10000 == 0:
+                    progress(table, written)
+        counts[table] = written
+        if writer is not None:
+            column_list = ", ".join(f'"{column}"' for column in columns)
+            copy_commands.append(f"\\copy \"{table}\" ({column_list}) FROM '{table}.csv' WITH (FORMAT csv, HEADER true)")
+
+    with open(os.path.join(directory, "load.sql"), "w", encoding="utf-8") as handle:
+        handle.write("-- Generated by scripts/generate_load_data.py; run from this directory\n")
+        handle.write("BEGIN;\n")
+        handle.write("\n".join(copy_commands) + "\n")
+        for table in TABLES:
+            handle.write(
+                f"SELECT setval(pg_get_serial_sequence('\"{table}\"', 'id'), "
+                f"COALESCE((SELECT MAX(id) FROM \"{table}\"), 0) + 1, false);\n"
+            )
+        handle.write("COMMIT;\n")
+    return counts
@@ -1,10 +1,40 @@
 #!/usr/bin/env sh
+# Kullanım: docker/start.sh [web|email-worker]
+#   web           (varsayılan) migration + gunicorn
+#   email-worker  sadece email outbox worker'ı; ayrı servis/konteyner olarak
+#                 çalıştırın ve web tarafında RUN_EMAIL_WORKER=false verin
 set -eu
 
+ROLE="${1:-web}"
+
+if [ "$ROLE" = "email-worker" ]; then
+  exec python scripts/email_worker.py
+fi
+
+if [ "$ROLE" != "web" ]; then
+  echo "Bilinmeyen rol: $ROLE (web | email-worker)" >&2
+  exit 64
+fi
+
 if [ "${RUN_MIGRATIONS:-true}" = "true" ]; then
   prisma migrate deploy
 fi
 
+# Tek konteyner kurulumları için: worker çıkarsa yeniden başlatılır, sessizce
+# ölüp kuyruğu birikmiş halde bırakmaz
+supervise_email_worker() {
+  while true; do
+    status=0
+    python scripts/email_worker.py || status=$?
+    echo "email worker çıktı (status $status), 5 sn sonra yeniden başlatılıyor" >&2
+    sleep 5
+  done
+}
+
+if [ "${RUN_EMAIL_WORKER:-true}" = "true" ]; then
+  supervise_email_worker &
+fi
+
 exec gunicorn \
   -k uvicorn.workers.UvicornWorker \
   app.main:app \
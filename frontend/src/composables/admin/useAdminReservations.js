@@ -19,13 +19,41 @@ export function useAdminReservations() {
 
     const showFilterDropdown = ref(false)
 
-    // Fetch
+    // Server-side keyset pagination cursor (null when the last page is loaded)
+    const nextCursor = ref(null)
+    const serverPageSize = 100
+
+    // Stats cards: counted by the API over every matching reservation
+    const counts = ref({ total: 0, pending_on_site: 0, completed: 0 })
+
+    // Filter values that are display aliases of a PaymentStatus
+    const SERVER_STATUS = { CONFIRMED: 'PENDING_ON_SITE', CHECKED_IN: 'COMPLETED' }
+
+    const buildReservationsUrl = (cursor = null) => {
+        const params = new URLSearchParams({ limit: String(serverPageSize) })
+        const myStudioId = authStore.user?.studioId
+        if (myStudioId) params.set('studio_id', String(myStudioId))
+        if (statusFilter.value !== 'ALL') {
+            params.set('status', SERVER_STATUS[statusFilter.value] || statusFilter.value)
+        }
+        const search = searchQuery.value.trim()
+        if (search) params.set('search', search)
+        if (cursor) params.set('cursor', cursor)
+        return `/api/v1/reservations/admin/all?${params.toString()}`
+    }
+
+    const pageRows = (payload) => Array.isArray(payload) ? payload : (payload.reservations || [])
+    const pageCursor = (payload) => Array.isArray(payload) ? null : (payload.next_cursor || null)
+
+    // Fetch (first page; resets the loaded list)
     const fetchReservations = async (silent = false) => {
         if (!silent) loading.value = true
         error.value = null
         try {
-            const payload = await adminFetch('/api/v1/reservations/admin/all', {}, authStore)
-            reservations.value = Array.isArray(payload) ? payload : (payload.reservations || [])
+            const payload = await adminFetch(buildReservationsUrl(), {}, authStore)
+            reservations.value = pageRows(payload)
+            nextCursor.value = pageCursor(payload)
+            if (payload.counts) counts.value = payload.counts
         } catch (err) {
             console.error('Rezervasyonlar getirilemedi:', err)
             error.value = err.message
@@ -34,17 +62,55 @@ export function useAdminReservations() {
         }
     }
 
+    // Realtime refresh: merge the newest page into what is already loaded so
+    // the admin keeps their page and the rows fetched with "load more"
+    const refreshLoadedReservations = async () => {
+        try {
+            const payload = await adminFetch(buildReservationsUrl(), {}, authStore)
+            const fresh = pageRows(payload)
+            if (payload.counts) counts.value = payload.counts
+            if (!pageCursor(payload) || reservations.value.length <= fresh.length) {
+                reservations.value = fresh
+                nextCursor.value = pageCursor(payload)
+                return
+            }
+            const freshIds = new Set(fresh.map(r => r.id))
+            const oldest = fresh[fresh.length - 1]
+            const olderLoaded = reservations.value.filter(r =>
+                !freshIds.has(r.id) &&
+                (r.created_at < oldest.created_at || (r.created_at === oldest.created_at && r.id < oldest.id))
+            )
+            reservations.value = [...fresh, ...olderLoaded]
+        } catch (err) {
+            console.error('Rezervasyonlar getirilemedi:', err)
+        }
+    }
+
+    const loadMoreReservations = async () => {
+        if (!nextCursor.value) return
+        try {
+            const payload = await adminFetch(buildReservationsUrl(nextCursor.value), {}, authStore)
+            const page = pageRows(payload)
+            const knownIds = new Set(reservations.value.map(r => r.id))
+            reservations.value = [...reservations.value, ...page.filter(r => !knownIds.has(r.id))]
+            nextCursor.value = pageCursor(payload)
+        } catch (err) {
+            console.error('Rezervasyonlar getirilemedi:', err)
+            error.value = err.message
+        }
+    }
+
     // Realtime: listen for reservation events and refresh
     onMounted(() => {
         if (!SocketService.isConnected) SocketService.connect()
 
         const handleCreated = async (payload) => {
             // payload may contain reservation or reservation_id
-            await fetchReservations(true)
+            await refreshLoadedReservations()
         }
 
         const handleUpdated = async (payload) => {
-            await fetchReservations(true)
+            await refreshLoadedReservations()
         }
 
         SocketService.on('reservation_created', handleCreated)
@@ -62,6 +128,7 @@ export function useAdminReservations() {
     })
 
     onUnmounted(() => {
+        clearTimeout(searchTimer)
         SocketService.off('reservation_created')
         SocketService.off('reservation_updated')
         SocketService.off('reservation_cancelled')
@@ -74,24 +141,8 @@ export function useAdminReservations() {
         return reservations.value.filter(res => res.studio_id === myStudioId)
     })
 
-    // Filter logic
-    const filteredReservations = computed(() => {
-        let result = [...myStudioReservations.value]
-
-        if (statusFilter.value !== 'ALL') {
-            result = result.filter(res => String(res.status || '').toUpperCase() === statusFilter.value)
-        }
-
-        if (searchQuery.value) {
-            const query = searchQuery.value.toLowerCase()
-            result = result.filter(res => 
-                String(res.booking_code || '').toLowerCase().includes(query) ||
-                String(res.user_name || '').toLowerCase().includes(query) ||
-                String(res.auction_title || '').toLowerCase().includes(query)
-            )
-        }
-        return sortReservationsByNewest(result)
-    })
+    // Status and search are applied by the API (see buildReservationsUrl)
+    const filteredReservations = computed(() => sortReservationsByNewest([...myStudioReservations.value]))
 
     // Computed values
     const totalPages = computed(() => {
@@ -115,8 +166,16 @@ export function useAdminReservations() {
         return Math.min(currentPage.value * pageSize, filteredReservations.value.length)
     })
 
-    watch([searchQuery, statusFilter], () => {
+    // Refetch from the first page when filters change; typing is debounced
+    let searchTimer = null
+    watch(statusFilter, () => {
         currentPage.value = 1
+        fetchReservations(true)
+    })
+    watch(searchQuery, () => {
+        currentPage.value = 1
+        clearTimeout(searchTimer)
+        searchTimer = setTimeout(() => fetchReservations(true), 300)
     })
 
     watch(filteredReservations, () => {
@@ -131,16 +190,21 @@ export function useAdminReservations() {
         }
     }
 
-    const goToNextPage = () => {
+    const goToNextPage = async () => {
+        if (currentPage.value >= totalPages.value && nextCursor.value) {
+            await loadMoreReservations()
+        }
         if (currentPage.value < totalPages.value) {
             currentPage.value += 1
         }
     }
 
+    const hasMorePages = computed(() => currentPage.value < totalPages.value || Boolean(nextCursor.value))
+
     // Stats
-    const totalReservationsCount = computed(() => myStudioReservations.value.length)
-    const pendingCheckInsCount = computed(() => myStudioReservations.value.filter(r => r.status === 'PENDING_ON_SITE' || r.status === 'CONFIRMED').length)
-    const checkedInTodayCount = computed(() => myStudioReservations.value.filter(r => r.status === 'COMPLETED').length) 
+    const totalReservationsCount = computed(() => counts.value.total)
+    const pendingCheckInsCount = computed(() => counts.value.pending_on_site)
+    const checkedInTodayCount = computed(() => counts.value.completed)
 
     // Actions
     const handleCheckIn = async (reservationId) => {
@@ -153,6 +217,7 @@ export function useAdminReservations() {
             if (index !== -1) {
                 reservations.value[index].status = 'COMPLETED'
             }
+            await refreshLoadedReservations()
         } catch (err) {
             alert('Hata: ' + err.message)
         }
@@ -168,6 +233,7 @@ export function useAdminReservations() {
             if (index !== -1) {
                 reservations.value[index].status = 'CANCELLED'
             }
+            await refreshLoadedReservations()
         } catch (err) {
             alert('Hata: ' + err.message)
         }
@@ -190,12 +256,14 @@ export function useAdminReservations() {
         totalPages,
         shownStart,
         shownEnd,
+        hasMorePages,
         totalReservationsCount,
         pendingCheckInsCount,
         checkedInTodayCount,
 
         // Actions
         fetchReservations,
+        loadMoreReservations,
         goToPrevPage,
         goToNextPage,
         handleCheckIn,
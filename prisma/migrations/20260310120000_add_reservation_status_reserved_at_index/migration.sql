@@ -0,0 +1,2 @@
+-- CreateIndex
+CREATE INDEX "reservations_status_reservedAt_idx" ON "public"."reservations"("status", "reservedAt");
@@ -0,0 +1,22 @@
+-- CreateEnum
+CREATE TYPE "public"."EmailOutboxStatus" AS ENUM ('PENDING', 'SENDING', 'SENT', 'DEAD');
+
+-- CreateTable
+CREATE TABLE "public"."email_outbox" (
+    "id" SERIAL NOT NULL,
+    "toEmail" TEXT NOT NULL,
+    "subject" TEXT NOT NULL,
+    "html" TEXT NOT NULL,
+    "status" "public"."EmailOutboxStatus" NOT NULL DEFAULT 'PENDING',
+    "attempts" INTEGER NOT NULL DEFAULT 0,
+    "nextAttemptAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "lockedAt" TIMESTAMP(3),
+    "lastError" TEXT,
+    "sentAt" TIMESTAMP(3),
+    "createdAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "email_outbox_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "email_outbox_status_nextAttemptAt_idx" ON "public"."email_outbox"("status", "nextAttemptAt");
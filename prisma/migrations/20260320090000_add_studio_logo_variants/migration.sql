@@ -0,0 +1,4 @@
+-- AlterTable
+ALTER TABLE "public"."studios" ADD COLUMN     "logoThumbUrl" TEXT,
+ADD COLUMN     "logoCardUrl" TEXT,
+ADD COLUMN     "logoFullUrl" TEXT;
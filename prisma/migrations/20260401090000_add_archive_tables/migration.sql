@@ -0,0 +1,75 @@
+-- CreateTable
+CREATE TABLE "public"."archived_auctions" (
+    "id" INTEGER NOT NULL,
+    "title" TEXT NOT NULL,
+    "description" TEXT,
+    "allowedGender" "public"."AllowedGender" NOT NULL,
+    "startPrice" DECIMAL(10,2) NOT NULL,
+    "floorPrice" DECIMAL(10,2) NOT NULL,
+    "currentPrice" DECIMAL(10,2) NOT NULL,
+    "startTime" TIMESTAMP(3) NOT NULL,
+    "endTime" TIMESTAMP(3) NOT NULL,
+    "scheduledAt" TIMESTAMP(3) NOT NULL,
+    "dropIntervalMins" INTEGER NOT NULL,
+    "dropAmount" DECIMAL(10,2) NOT NULL,
+    "turboEnabled" BOOLEAN NOT NULL,
+    "turboTriggerMins" INTEGER NOT NULL,
+    "turboDropAmount" DECIMAL(10,2) NOT NULL,
+    "turboIntervalMins" INTEGER NOT NULL,
+    "turboStartedAt" TIMESTAMP(3),
+    "status" "public"."AuctionStatus" NOT NULL,
+    "studioId" INTEGER,
+    "createdAt" TIMESTAMP(3) NOT NULL,
+    "updatedAt" TIMESTAMP(3) NOT NULL,
+    "archivedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "archived_auctions_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "public"."archived_reservations" (
+    "id" INTEGER NOT NULL,
+    "auctionId" INTEGER NOT NULL,
+    "userId" INTEGER NOT NULL,
+    "lockedPrice" DECIMAL(10,2) NOT NULL,
+    "bookingCode" TEXT NOT NULL,
+    "status" "public"."PaymentStatus" NOT NULL,
+    "reservedAt" TIMESTAMP(3) NOT NULL,
+    "archivedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "archived_reservations_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateTable
+CREATE TABLE "public"."archived_notifications" (
+    "id" INTEGER NOT NULL,
+    "userId" INTEGER NOT NULL,
+    "reservationId" INTEGER,
+    "auctionId" INTEGER,
+    "type" "public"."NotificationType" NOT NULL,
+    "title" TEXT NOT NULL,
+    "message" TEXT NOT NULL,
+    "isRead" BOOLEAN NOT NULL,
+    "createdAt" TIMESTAMP(3) NOT NULL,
+    "archivedAt" TIMESTAMP(3) NOT NULL DEFAULT CURRENT_TIMESTAMP,
+
+    CONSTRAINT "archived_notifications_pkey" PRIMARY KEY ("id")
+);
+
+-- CreateIndex
+CREATE INDEX "archived_auctions_endTime_id_idx" ON "public"."archived_auctions"("endTime", "id");
+
+-- CreateIndex
+CREATE INDEX "archived_auctions_studioId_endTime_idx" ON "public"."archived_auctions"("studioId", "endTime");
+
+-- CreateIndex
+CREATE UNIQUE INDEX "archived_reservations_auctionId_key" ON "public"."archived_reservations"("auctionId");
+
+-- CreateIndex
+CREATE UNIQUE INDEX "archived_reservations_bookingCode_key" ON "public"."archived_reservations"("bookingCode");
+
+-- CreateIndex
+CREATE INDEX "archived_reservations_userId_reservedAt_idx" ON "public"."archived_reservations"("userId", "reservedAt");
+
+-- CreateIndex
+CREATE INDEX "archived_notifications_auctionId_idx" ON "public"."archived_notifications"("auctionId");
@@ -0,0 +1,20 @@
+-- DropIndex (covered by the composite below: status is its leading column)
+DROP INDEX "public"."auctions_status_idx";
+
+-- CreateIndex
+CREATE INDEX "auctions_status_startTime_idx" ON "public"."auctions"("status", "startTime");
+
+-- CreateIndex (partial, not expressible in schema.prisma): only live auctions,
+-- so the scheduler scan and live listing stay small however many finished
+-- auctions the table keeps
+CREATE INDEX "auctions_live_startTime_endTime_idx" ON "public"."auctions"("startTime", "endTime")
+    WHERE "status" IN ('DRAFT', 'ACTIVE');
+
+-- CreateIndex
+CREATE INDEX "reservations_userId_reservedAt_idx" ON "public"."reservations"("userId", "reservedAt");
+
+-- CreateIndex
+CREATE INDEX "reservations_reservedAt_id_idx" ON "public"."reservations"("reservedAt", "id");
+
+-- CreateIndex
+CREATE INDEX "notifications_userId_createdAt_idx" ON "public"."notifications"("userId", "createdAt");
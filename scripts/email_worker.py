@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Email Outbox Delivery Worker
+Kullanım: python scripts/email_worker.py [--once]
+
+email_outbox tablosundaki bekleyen e-postaları gönderir. Web sürecinden
+bağımsız çalışır; SIGTERM/SIGINT ile mevcut batch bitince durur.
+  --once  Tek bir batch gönderip çıkar (cron / manuel kullanım için)
+"""
+
+import asyncio
+import os
+import signal
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.core.db import db
+from app.core.email import close_email_transports
+from app.core.email_templates import email_templates
+from app.core.log_config import configure_logging, stop_logging
+from app.services.email_outbox_service import email_outbox_service
+
+
+async def run(once: bool) -> None:
+    email_templates.load()
+    await db.connect()
+    try:
+        if once:
+            counts = await email_outbox_service.deliver_due()
+            print(f"📧 Outbox: {counts['sent']} gönderildi, {counts['retried']} tekrar denenecek, {counts['dead']} DEAD")
+            return
+
+        stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop_event.set)
+            except NotImplementedError:
+                # Windows: signal handlers are not supported on the event loop
+                pass
+
+        print("📧 Email outbox worker başladı")
+        await email_outbox_service.run_worker(stop_event)
+        print("📧 Email outbox worker durdu")
+    finally:
+        await close_email_transports()
+        await db.disconnect()
+
+
+def main():
+    configure_logging()
+    try:
+        asyncio.run(run(once="--once" in sys.argv))
+    finally:
+        stop_logging()
+
+
+if __name__ == "__main__":
+    main()
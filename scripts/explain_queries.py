@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Query Plan Regression Check
+Kullanım: python scripts/explain_queries.py [--analyze] [--force-index] [--only NAME[,NAME]]
+
+AuctionService / BookingService / ArchiveService / EmailOutboxService'in sık
+çalışan sorgularını DATABASE_URL veritabanında EXPLAIN ile çalıştırır ve her
+planın beklenen indeksi kullandığını kontrol eder. Beklenen indeks planda yoksa
+çıkış kodu 1'dir (CI veya migration sonrası kontrol için).
+
+  --analyze      EXPLAIN (ANALYZE, BUFFERS): sorguları gerçekten çalıştırır, süreleri gösterir
+  --force-index  enable_seqscan = off (küçük/boş lokal veritabanlarında planlayıcı
+                 tabloyu taramayı seçer; indeksin kullanılabilir olduğunu doğrulamak için)
+
+Gerçekçi planlar için önce yük verisi yükleyin:
+  python scripts/generate_load_data.py --profile production --reset
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from typing import Iterator, List, Optional
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.core.db import db
+
+# (name, SQL with literal values as Prisma's custom plans see them, expected index or None)
+QUERIES = [
+    (
+        "live_auctions",  # AuctionService.check_pending_auctions
+        """SELECT * FROM "public"."auctions" WHERE "status" IN ('DRAFT', 'ACTIVE') ORDER BY "startTime" ASC""",
+        "auctions_live_startTime_endTime_idx",
+    ),
+    (
+        "my_reservations",  # BookingService.get_user_reservations
+        """SELECT * FROM "public"."reservations" WHERE "userId" = (SELECT "userId" FROM "public"."reservations" LIMIT 1)
+           ORDER BY "reservedAt" DESC""",
+        "reservations_userId_reservedAt_idx",
+    ),
+    (
+        "admin_reservations_page",  # BookingService.get_all_reservations (first page, no filters)
+        """SELECT * FROM "public"."reservations" ORDER BY "reservedAt" DESC, "id" DESC LIMIT 51""",
+        "reservations_reservedAt_id_idx",
+    ),
+    (
+        "pending_reservations",  # BookingService.auto_cancel_overdue_pending_reservations
+        """SELECT * FROM "public"."reservations" WHERE "status" = 'PENDING_ON_SITE'""",
+        "reservations_status_reservedAt_idx",
+    ),
+    (
+        "admin_notifications",  # BookingService.get_admin_cancellation_notifications
+        """SELECT * FROM "public"."notifications" WHERE "userId" = (SELECT "id" FROM "public"."users" WHERE "role" = 'ADMIN' LIMIT 1)
+           ORDER BY "createdAt" DESC LIMIT 60""",
+        "notifications_userId_createdAt_idx",
+    ),
+    (
+        "archive_candidates",  # ArchiveService.archive_finished_auctions (plan shown, not asserted)
+        """SELECT * FROM "public"."auctions" WHERE "status" IN ('SOLD', 'EXPIRED', 'CANCELLED')
+           AND "endTime" < now() - interval '90 days' ORDER BY "id" ASC LIMIT 200""",
+        None,
+    ),
+    (
+        "outbox_due",  # EmailOutboxService.deliver_due
+        """SELECT * FROM "public"."email_outbox"
+           WHERE ("status" = 'PENDING' AND "nextAttemptAt" <= now())
+              OR ("status" = 'SENDING' AND "lockedAt" < now() - interval '5 minutes')
+           ORDER BY "nextAttemptAt" ASC, "id" ASC LIMIT 50""",
+        "email_outbox_status_nextAttemptAt_idx",
+    ),
+]
+
+TABLES = ("auctions", "reservations", "notifications", "users", "email_outbox")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="EXPLAIN regression check for HotHour hot queries")
+    parser.add_argument("--analyze", action="store_true", help="Run EXPLAIN ANALYZE (executes the queries)")
+    parser.add_argument("--force-index", action="store_true", help="SET enable_seqscan = off")
+    parser.add_argument("--only", help="Comma separated query names")
+    return parser.parse_args(argv)
+
+
+def plan_nodes(node: dict) -> Iterator[dict]:
+    yield node
+    for child in node.get("Plans", ()):
+        yield from plan_nodes(child)
+
+
+def summarize(plan: dict) -> str:
+    root = plan["Plan"]
+    parts = []
+    for node in plan_nodes(root):
+        label = node["Node Type"]
+        if node.get("Index Name"):
+            label += f" using {node['Index Name']}"
+        elif node.get("Relation Name"):
+            label += f" on {node['Relation Name']}"
+        parts.append(label)
+    timing = f", {plan['Execution Time']:.2f}ms" if "Execution Time" in plan else ""
+    return f"cost={root['Total Cost']:.1f}{timing}: " + " -> ".join(parts)
+
+
+async def explain(sql: str, analyze: bool, force_index: bool) -> dict:
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    # SET LOCAL only lasts for the transaction, so the pooled connection is left untouched
+    async with db._client.tx() as tx:
+        if force_index:
+            await tx.execute_raw("SET LOCAL enable_seqscan = off")
+        rows = await tx.query_raw(f"EXPLAIN ({options}) {sql}")
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+async def run(args) -> int:
+    await db.connect()
+    try:
+        # Fresh statistics, otherwise plans reflect whatever was loaded last
+        for table in TABLES:
+            await db.execute_raw(f'ANALYZE "public"."{table}"')
+
+        selected: Optional[List[str]] = args.only.split(",") if args.only else None
+        failures = 0
+        for name, sql, expected in QUERIES:
+            if selected and name not in selected:
+                continue
+            plan = await explain(sql, args.analyze, args.force_index)
+            indexes = {node.get("Index Name") for node in plan_nodes(plan["Plan"])}
+            if expected is None:
+                status = "INFO"
+            elif expected in indexes:
+                status = "OK"
+            else:
+                status = "FAIL"
+                failures += 1
+            print(f"[{status:<4}] {name:<26} {summarize(plan)}")
+            if status == "FAIL":
+                print(f"       beklenen indeks kullanılmadı: {expected}")
+
+        if failures:
+            print(f"\n❌ {failures} sorgu beklenen indeksi kullanmıyor")
+            return 1
+        print("\n✅ Tüm sorgular beklenen indeksleri kullanıyor")
+        return 0
+    finally:
+        await db.disconnect()
+
+
+def main(argv=None) -> int:
+    return asyncio.run(run(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Synthetic Load Data Generator
+Kullanım: python scripts/generate_load_data.py [--profile small|medium|production] [--seed N]
+                                               [--users N] [--auctions N] [--studios N]
+                                               [--now ISO|now] [--csv DIR] [--batch-size N] [--reset]
+
+Aynı profil, seed ve --now ile her zaman aynı veriyi üretir (studios, users,
+auctions, reservations, notifications).
+  --now ISO     Verinin referans zamanı (varsayılan sabit: 2026-01-05T12:00+03:00).
+                Oturum durumları (DRAFT/ACTIVE/SOLD...) buna göre belirlenir;
+                canlı görünen aktif oturumlar için --now now verin
+  (varsayılan)  DATABASE_URL veritabanına create_many ile batch halinde yazar
+  --csv DIR     Tablo başına CSV + load.sql üretir (psql \\copy ile toplu yükleme)
+  --reset       Yüklemeden önce bu tablolardaki TÜM verileri siler
+
+Üretilen kullanıcıların şifresi: LoadTest123!
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from dataclasses import replace
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.core.timezone import TR_TIMEZONE, now_tr
+from benchmarks.synthetic import DEFAULT_NOW, MODELS, PROFILES, TABLES, SyntheticDataset, load_dataset, write_csv
+
+
+def parse_now(value: str) -> datetime:
+    """ISO 8601 time (Europe/Istanbul when no offset is given) or "now"."""
+    if value == "now":
+        return now_tr()
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ISO datetime: {value!r}")
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=TR_TIMEZONE)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="HotHour synthetic load data")
+    parser.add_argument("--profile", default="small", choices=sorted(PROFILES))
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--users", type=int)
+    parser.add_argument("--auctions", type=int)
+    parser.add_argument("--studios", type=int)
+    parser.add_argument("--now", type=parse_now, default=DEFAULT_NOW,
+                        help='Reference time, ISO 8601 or "now" (default: fixed epoch for reproducible data)')
+    parser.add_argument("--csv", dest="csv_dir", help="Write CSV files for psql \\copy instead of inserting")
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--reset", action="store_true", help="Delete existing rows in the generated tables first")
+    return parser.parse_args(argv)
+
+
+def build_profile(args):
+    overrides = {
+        name: getattr(args, name)
+        for name in ("seed", "users", "auctions", "studios")
+        if getattr(args, name) is not None
+    }
+    return replace(PROFILES[args.profile], **overrides)
+
+
+def _progress(table: str, count: int) -> None:
+    print(f"  {table}: {count}", end="\r", flush=True)
+
+
+async def insert(dataset: SyntheticDataset, batch_size: int, reset: bool) -> int:
+    from app.core.db import db
+
+    await db.connect()
+    try:
+        existing = {table: await getattr(db, MODELS[table]).count() for table in TABLES}
+        if any(existing.values()):
+            if not reset:
+                print(f"❌ Tablolar boş değil: {existing}. Silmek için --reset kullanın.")
+                return 1
+            # Children first so foreign keys never block the delete
+            for table in reversed(TABLES):
+                await getattr(db, MODELS[table]).delete_many(where={})
+            print("🗑️  Mevcut veriler silindi.")
+
+        counts = await load_dataset(db, dataset, batch_size=batch_size, progress=_progress)
+    finally:
+        await db.disconnect()
+    print()
+    for table, count in counts.items():
+        print(f"✅ {table}: {count}")
+    return 0
+
+
+def main():
+    args = parse_args()
+    profile = build_profile(args)
+    dataset = SyntheticDataset(profile, now=args.now)
+    print(f"📦 Profil: {args.profile} {profile} (now={args.now.isoformat()})")
+    started = time.perf_counter()
+
+    if args.csv_dir:
+        counts = write_csv(dataset, args.csv_dir, progress=_progress)
+        print()
+        for table, count in counts.items():
+            print(f"✅ {table}: {count}")
+        print(f"💾 CSV dosyaları: {args.csv_dir}  →  cd {args.csv_dir} && psql \"$DATABASE_URL\" -f load.sql")
+        status = 0
+    else:
+        status = asyncio.run(insert(dataset, args.batch_size, args.reset))
+
+    print(f"⏱️  {time.perf_counter() - started:.1f}s")
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
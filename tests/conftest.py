@@ -5,10 +5,12 @@ Handles DB connection and test lifecycle.
 """
 
 import asyncio
+from contextlib import contextmanager
 import pytest
 from httpx import AsyncClient, ASGITransport
 from app.main import app
 from app.core.db import db
+from app.core.query_tracker import track_queries
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -42,3 +44,19 @@ async def client() -> AsyncClient:
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as c:
         yield c
+
+@pytest.fixture
+def query_budget():
+    """
+    Assert the number of DB queries issued inside a block:
+
+        with query_budget(3):
+            await client.get("/api/v1/auctions/")
+    """
+    @contextmanager
+    def _budget(max_queries: int):
+        with track_queries() as stats:
+            yield stats
+        assert stats.count <= max_queries, f"Query budget {max_queries} exceeded: {stats.summary()}"
+
+    return _budget
@@ -0,0 +1,168 @@
+import uuid
+from decimal import Decimal
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+
+from app.main import app
+from app.core import db, security
+
+
+@pytest_asyncio.fixture(scope="function", autouse=True)
+async def db_connect():
+    if not db.db.is_connected():
+        await db.db.connect()
+    yield
+
+
+async def create_user(role: str = "USER", studio_id: int = None):
+    uid = uuid.uuid4().hex[:8]
+    data = {
+        "email": f"page_{uid}@example.com",
+        "phone": f"+907{uuid.uuid4().int % 10**9:09d}",
+        "fullName": "Page Admin" if role == "ADMIN" else f"Page User {uid}",
+        "hashedPassword": security.get_password_hash("TestPass123!"),
+        "role": role,
+        "gender": "FEMALE",
+        "isVerified": True,
+    }
+    if studio_id:
+        data["studioId"] = studio_id
+    return await db.db.user.create(data=data)
+
+
+async def seed_reservations(count: int):
+    studio = await db.db.studio.create(data={"name": f"Paging Studio {uuid.uuid4().hex[:6]}"})
+    admin = await create_user(role="ADMIN", studio_id=studio.id)
+    user = await create_user()
+
+    base = datetime.now(timezone.utc) - timedelta(days=1)
+    reservations = []
+    for index in range(count):
+        auction = await db.db.auction.create(
+            data={
+                "title": f"Paging Auction {index}",
+                "description": "Admin pagination fixture",
+                "allowedGender": "ANY",
+                "startPrice": Decimal("100.00"),
+                "floorPrice": Decimal("50.00"),
+                "currentPrice": Decimal("80.00"),
+                "startTime": base,
+                "endTime": base + timedelta(hours=2),
+                "scheduledAt": base + timedelta(hours=3),
+                "dropIntervalMins": 10,
+                "dropAmount": Decimal("5.00"),
+                "status": "SOLD",
+                "studioId": studio.id,
+            }
+        )
+        reservation = await db.db.reservation.create(
+            data={
+                "auctionId": auction.id,
+                "userId": user.id,
+                "lockedPrice": Decimal("80.00"),
+                "bookingCode": f"PG-{uuid.uuid4().hex[:6]}",
+                "status": "COMPLETED" if index % 2 else "PENDING_ON_SITE",
+                # Two rows share each timestamp to exercise the id tie-breaker
+                "reservedAt": base + timedelta(minutes=index // 2),
+            }
+        )
+        reservations.append(reservation)
+
+    headers = {"Authorization": f"Bearer {security.create_access_token(subject=admin.id)}"}
+    return studio, headers, reservations
+
+
+@pytest.mark.asyncio
+async def test_admin_reservations_keyset_pages_cover_all_rows_once():
+    studio, headers, reservations = await seed_reservations(7)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            params = {"studio_id": studio.id, "limit": 3}
+            if cursor:
+                params["cursor"] = cursor
+            response = await client.get("/api/v1/reservations/admin/all", params=params, headers=headers)
+            assert response.status_code == 200, response.text
+            payload = response.json()
+            seen.extend(item["id"] for item in payload["reservations"])
+            pages += 1
+            cursor = payload["next_cursor"]
+            if not cursor:
+                break
+
+    assert pages == 3
+    expected = [r.id for r in sorted(reservations, key=lambda r: (r.reservedAt, r.id), reverse=True)]
+    assert seen == expected
+
+
+@pytest.mark.asyncio
+async def test_admin_reservations_status_filter_and_projection():
+    studio, headers, _ = await seed_reservations(4)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/api/v1/reservations/admin/all",
+            params={"studio_id": studio.id, "status": "COMPLETED"},
+            headers=headers,
+        )
+    assert response.status_code == 200, response.text
+    rows = response.json()["reservations"]
+    assert len(rows) == 2
+    assert all(row["status"] == "COMPLETED" for row in rows)
+    assert all(row["studio_id"] == studio.id for row in rows)
+    assert "hashedPassword" not in rows[0]
+    assert "user" not in rows[0]
+
+
+@pytest.mark.asyncio
+async def test_admin_reservations_rejects_malformed_cursor():
+    _, headers, _ = await seed_reservations(1)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/api/v1/reservations/admin/all",
+            params={"cursor": "not-a-cursor"},
+            headers=headers,
+        )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_admin_reservations_counts_and_server_side_search():
+    studio, headers, reservations = await seed_reservations(5)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get(
+            "/api/v1/reservations/admin/all", params={"studio_id": studio.id, "limit": 2}, headers=headers
+        )
+        second = await client.get(
+            "/api/v1/reservations/admin/all",
+            params={"studio_id": studio.id, "limit": 2, "cursor": first.json()["next_cursor"]},
+            headers=headers,
+        )
+        searched = await client.get(
+            "/api/v1/reservations/admin/all",
+            params={"studio_id": studio.id, "search": reservations[3].bookingCode.lower()},
+            headers=headers,
+        )
+        by_title = await client.get(
+            "/api/v1/reservations/admin/all",
+            params={"studio_id": studio.id, "search": "paging auction 1", "status": "COMPLETED"},
+            headers=headers,
+        )
+
+    # Counts cover every matching reservation, not just the loaded page
+    assert first.json()["counts"] == {"total": 5, "pending_on_site": 3, "completed": 2}
+    assert "counts" not in second.json()
+    assert [row["id"] for row in searched.json()["reservations"]] == [reservations[3].id]
+    assert [row["id"] for row in by_title.json()["reservations"]] == [reservations[1].id]
@@ -0,0 +1,129 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core import security
+from app.core.db import db
+from app.main import app
+from app.services.archive_service import archive_service
+
+NOW = datetime(2030, 6, 1, 12, tzinfo=timezone.utc)
+
+
+async def _user(role: str = "USER"):
+    uid = uuid.uuid4().hex[:8]
+    return await db.user.create(data={
+        "email": f"archive_{uid}@example.com",
+        "phone": f"+904{uuid.uuid4().int % 10**9:09d}",
+        "fullName": "Archive User",
+        "hashedPassword": "not-used",
+        "role": role,
+        "gender": "FEMALE",
+        "isVerified": True,
+    })
+
+
+async def _auction(status: str, ended_days_ago: int, studio_id: int):
+    end = NOW - timedelta(days=ended_days_ago)
+    return await db.auction.create(data={
+        "title": f"Archive {status} {ended_days_ago}d",
+        "description": None,
+        "startPrice": Decimal("100.00"),
+        "floorPrice": Decimal("50.00"),
+        "currentPrice": Decimal("70.00"),
+        "startTime": end - timedelta(hours=2),
+        "endTime": end,
+        "scheduledAt": end + timedelta(hours=1),
+        "dropIntervalMins": 10,
+        "dropAmount": Decimal("5.00"),
+        "status": status,
+        "studioId": studio_id,
+    })
+
+
+async def _seed():
+    studio = await db.studio.create(data={"name": f"Archive Studio {uuid.uuid4().hex[:6]}"})
+    user = await _user()
+    sold_old = await _auction("SOLD", 120, studio.id)
+    expired_old = await _auction("EXPIRED", 100, studio.id)
+    sold_recent = await _auction("SOLD", 10, studio.id)
+    active_old = await _auction("ACTIVE", 120, studio.id)
+    reservation = await db.reservation.create(data={
+        "auctionId": sold_old.id,
+        "userId": user.id,
+        "lockedPrice": Decimal("70.00"),
+        "bookingCode": f"AR-{uuid.uuid4().hex[:6]}",
+        "status": "COMPLETED",
+        "reservedAt": sold_old.endTime - timedelta(hours=1),
+    })
+    notification = await db.notification.create(data={
+        "userId": user.id,
+        "reservationId": reservation.id,
+        "auctionId": sold_old.id,
+        "type": "SYSTEM",
+        "title": "Rezervasyon",
+        "message": "Tamamlandı",
+        "isRead": True,
+    })
+    return studio, user, (sold_old, expired_old, sold_recent, active_old), reservation, notification
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_only_finished_auctions_past_retention():
+    studio, user, (sold_old, expired_old, sold_recent, active_old), reservation, notification = await _seed()
+
+    moved = await archive_service.archive_finished_auctions(retention_days=90, batch_size=1, now=NOW)
+
+    assert moved["auctions"] >= 2
+    assert await db.auction.find_unique(where={"id": sold_old.id}) is None
+    assert await db.auction.find_unique(where={"id": expired_old.id}) is None
+    assert await db.reservation.find_unique(where={"id": reservation.id}) is None
+    assert await db.notification.find_unique(where={"id": notification.id}) is None
+    assert await db.auction.find_unique(where={"id": sold_recent.id}) is not None
+    assert await db.auction.find_unique(where={"id": active_old.id}) is not None
+
+    archived = await archive_service.get_archived_auction(sold_old.id)
+    assert archived["auction"]["title"] == sold_old.title
+    assert archived["reservation"]["bookingCode"] == reservation.bookingCode
+    assert [n["id"] for n in archived["notifications"]] == [notification.id]
+
+    # Running again finds nothing new and duplicates nothing
+    again = await archive_service.archive_finished_auctions(retention_days=90, now=NOW)
+    assert again["auctions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_archive_history_endpoints():
+    studio, user, (sold_old, expired_old, _, _), reservation, _ = await _seed()
+    await archive_service.archive_finished_auctions(retention_days=90, now=NOW)
+    admin = await _user(role="ADMIN")
+    transport = ASGITransport(app=app)
+
+    def auth(account):
+        return {"Authorization": f"Bearer {security.create_access_token(subject=account.id)}"}
+
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        history = await client.get("/api/v1/reservations/my/history", headers=auth(user))
+        first = await client.get(
+            "/api/v1/auctions/archive", params={"studio_id": studio.id, "limit": 1}, headers=auth(admin)
+        )
+        second = await client.get(
+            "/api/v1/auctions/archive",
+            params={"studio_id": studio.id, "limit": 1, "cursor": first.json()["next_cursor"]},
+            headers=auth(admin),
+        )
+        detail = await client.get(f"/api/v1/auctions/archive/{sold_old.id}", headers=auth(admin))
+        forbidden = await client.get("/api/v1/auctions/archive", headers=auth(user))
+
+    assert history.status_code == 200
+    assert [r["booking_code"] for r in history.json()["reservations"]] == [reservation.bookingCode]
+    assert history.json()["reservations"][0]["auction_title"] == sold_old.title
+    # Most recently ended first, one per page
+    assert [a["id"] for a in first.json()["auctions"]] == [expired_old.id]
+    assert [a["id"] for a in second.json()["auctions"]] == [sold_old.id]
+    assert second.json()["next_cursor"] is None
+    assert detail.json()["reservation"]["id"] == reservation.id
+    assert forbidden.status_code == 403
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from benchmarks.harness import build_report, compare, measure, summarize
+
+
+def test_summarize_percentiles():
+    result = summarize("op", [0.001 * value for value in range(1, 101)], total_seconds=2.0)
+
+    assert result.iterations == 100
+    assert result.ops_per_sec == 50.0
+    assert result.p50_ms == pytest.approx(50.0)
+    assert result.p95_ms == pytest.approx(95.0)
+    assert result.p99_ms == pytest.approx(99.0)
+    assert result.max_ms == pytest.approx(100.0)
+
+
+@pytest.mark.asyncio
+async def test_measure_runs_warmup_separately_and_limits_concurrency():
+    calls, in_flight, peak = [], 0, 0
+
+    async def operation(index):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        calls.append(index)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    result = await measure("op", operation, iterations=10, concurrency=3, warmup=2)
+
+    assert result.iterations == 10
+    assert calls[:2] == [-1, -2]
+    assert peak <= 3
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    baseline = build_report([summarize("fast", [0.010], 1.0), summarize("slow", [0.010], 1.0)], "small")
+    current = build_report([summarize("fast", [0.0105], 1.0), summarize("slow", [0.020], 1.0),
+                            summarize("new", [0.001], 1.0)], "small")
+
+    rows = {row["name"]: row for row in compare(current, baseline, threshold=0.10)}
+
+    assert set(rows) == {"fast", "slow"}
+    assert rows["fast"]["regressed"] is False
+    assert rows["slow"]["regressed"] is True
+    assert rows["slow"]["change"] == pytest.approx(1.0)
@@ -0,0 +1,123 @@
+import asyncio
+import gzip
+import json
+import zlib
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.core.compression import (
+    CompressedBodyCache,
+    CompressionMiddleware,
+    accepted_encodings,
+    choose_encoding,
+    etag_matches,
+)
+
+ROWS = [{"id": i, "title": f"Auction {i}", "studio": "Studio"} for i in range(200)]
+
+
+def _app(cache: CompressedBodyCache) -> Starlette:
+    async def big(request):
+        return JSONResponse(ROWS)
+
+    async def small(request):
+        return JSONResponse({"ok": True})
+
+    async def image(request):
+        return Response(b"\x89PNG" + b"\0" * 4096, media_type="image/png")
+
+    async def snapshot(request):
+        return Response(json.dumps(ROWS).encode(), media_type="application/json",
+                        headers={"ETag": '"snap-1"', "Cache-Control": "public, no-cache"})
+
+    async def stream(request):
+        async def rows():
+            for row in ROWS[:3]:
+                yield json.dumps(row).encode() + b"\n"
+        return StreamingResponse(rows(), media_type="application/x-ndjson")
+
+    app = Starlette(routes=[
+        Route("/big", big), Route("/small", small), Route("/image", image),
+        Route("/snapshot", snapshot), Route("/stream", stream),
+    ])
+    return CompressionMiddleware(app, minimum_size=500, cache=cache)
+
+
+def test_accept_encoding_negotiation():
+    assert accepted_encodings("gzip;q=1.0, br;q=0, deflate") == {"gzip", "deflate"}
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("identity") is None
+    assert etag_matches('"abc"', 'W/"abc", "other"')
+    assert not etag_matches('"abc"', '"abd"')
+
+
+@pytest.mark.asyncio
+async def test_compresses_large_json_only():
+    transport = ASGITransport(app=_app(CompressedBodyCache(8)))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        big = await client.get("/big", headers={"Accept-Encoding": "gzip"})
+        small = await client.get("/small", headers={"Accept-Encoding": "gzip"})
+        image = await client.get("/image", headers={"Accept-Encoding": "gzip"})
+        plain = await client.get("/big", headers={"Accept-Encoding": "identity"})
+
+    assert big.headers["content-encoding"] == "gzip"
+    assert int(big.headers["content-length"]) < len(json.dumps(ROWS))
+    assert big.json() == ROWS
+    assert big.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in small.headers
+    assert "content-encoding" not in image.headers
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == ROWS
+
+
+@pytest.mark.asyncio
+async def test_etag_responses_are_compressed_once():
+    cache = CompressedBodyCache(8)
+    transport = ASGITransport(app=_app(cache))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        responses = [await client.get("/snapshot", headers={"Accept-Encoding": "gzip"}) for _ in range(3)]
+
+    assert cache.stats() == {"entries": 1, "hits": 2, "misses": 1}
+    assert all(r.headers["etag"] == 'W/"snap-1"' for r in responses)
+    assert responses[0].json() == ROWS
+
+
+@pytest.mark.asyncio
+async def test_streaming_responses_are_compressed_per_chunk():
+    app = _app(CompressedBodyCache(8))
+    messages = []
+    requested = False
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # StreamingResponse listens for a disconnect until the body is sent
+        await asyncio.sleep(3600)
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": "/stream", "raw_path": b"/stream", "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")], "http_version": "1.1", "scheme": "http",
+        "server": ("test", 80), "client": ("test", 1), "root_path": "",
+    }
+    await app(scope, receive, send)
+
+    start, *bodies = messages
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    # Every chunk is decodable as soon as it arrives: nothing was buffered
+    decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    first_row = decoder.decompress(bodies[0]["body"])
+    assert first_row == json.dumps(ROWS[0]).encode() + b"\n"
+    rest = b"".join(decoder.decompress(m["body"]) for m in bodies[1:])
+    assert (first_row + rest).count(b"\n") == 3
+    assert gzip.decompress(b"".join(m["body"] for m in bodies)).startswith(first_row)
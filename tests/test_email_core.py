@@ -1,6 +1,6 @@
 import pytest
 from unittest.mock import AsyncMock, patch
-from pydantic import SecretStr, NameEmail
+from pydantic import SecretStr
 
 from app.core import email as email_module
 
@@ -10,9 +10,13 @@ def test_connection_config_uses_secretstr_password():
 
 
 @pytest.mark.asyncio
-async def test_send_email_builds_nameemail_recipient():
-    with patch.object(email_module.settings, "EMAILS_ENABLED", True):
-        with patch("app.core.email.FastMail.send_message", new_callable=AsyncMock) as mock_send:
+async def test_send_email_uses_pooled_smtp_connection():
+    with patch.object(email_module.settings, "EMAILS_ENABLED", True), \
+            patch.object(email_module.settings, "GMAIL_API_ENABLED", False), \
+            patch.object(email_module.settings, "SMTP_HOST", "localhost"), \
+            patch.object(email_module.settings, "SMTP_PORT", 1025), \
+            patch.object(email_module.settings, "EMAILS_FROM_EMAIL", "noreply@example.com"):
+        with patch.object(email_module.smtp_pool, "send", new_callable=AsyncMock) as mock_send:
             await email_module.send_email(
                 email_to="test@example.com",
                 subject_template="Test Subject",
@@ -22,15 +26,15 @@ async def test_send_email_builds_nameemail_recipient():
             assert mock_send.await_count == 1
             args, _ = mock_send.await_args_list[0]
             message = args[0]
-            assert len(message.recipients) == 1
-            assert isinstance(message.recipients[0], NameEmail)
-            assert message.recipients[0].email == "test@example.com"
+            assert message["To"] == "test@example.com"
+            assert message["Subject"] == "Test Subject"
+            assert "<p>Test</p>" in message.get_body(preferencelist=("html",)).get_content()
 
 
 @pytest.mark.asyncio
 async def test_send_email_skips_when_disabled():
     with patch.object(email_module.settings, "EMAILS_ENABLED", False):
-        with patch("app.core.email.FastMail.send_message", new_callable=AsyncMock) as mock_send:
+        with patch.object(email_module.smtp_pool, "send", new_callable=AsyncMock) as mock_send:
             await email_module.send_email(
                 email_to="skip@example.com",
                 subject_template="Skip",
@@ -0,0 +1,154 @@
+import pytest
+from datetime import timedelta
+from unittest.mock import patch
+
+from app.core.config import settings
+from app.core.db import db
+from app.core.timezone import now_tr
+from app.services.email_outbox_service import email_outbox_service
+
+
+@pytest.fixture(autouse=True)
+async def clean_outbox():
+    await db.emailoutbox.delete_many()
+    yield
+    await db.emailoutbox.delete_many()
+
+
+class RecordingSender:
+    def __init__(self, fail_times=0):
+        self.fail_times = fail_times
+        self.sent = []
+
+    async def __call__(self, email_to, subject, html):
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise ConnectionError("smtp down")
+        self.sent.append((email_to, subject))
+
+
+@pytest.mark.asyncio
+async def test_deliver_due_sends_batch_and_marks_sent():
+    for i in range(3):
+        await email_outbox_service.enqueue(f"user{i}@example.com", f"Subject {i}", "<p>hi</p>")
+    sender = RecordingSender()
+
+    counts = await email_outbox_service.deliver_due(batch_size=2, sender=sender)
+    assert counts == {"sent": 2, "retried": 0, "dead": 0}
+    counts = await email_outbox_service.deliver_due(batch_size=2, sender=sender)
+    assert counts["sent"] == 1
+
+    assert sorted(to for to, _ in sender.sent) == [f"user{i}@example.com" for i in range(3)]
+    rows = await db.emailoutbox.find_many()
+    assert all(row.status == "SENT" and row.attempts == 1 for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_failed_delivery_is_retried_with_backoff_then_dead_lettered():
+    message = await email_outbox_service.enqueue("retry@example.com", "Retry", "<p>x</p>")
+    sender = RecordingSender(fail_times=100)
+
+    with patch.object(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 2):
+        counts = await email_outbox_service.deliver_due(sender=sender)
+        assert counts["retried"] == 1
+        row = await db.emailoutbox.find_unique(where={"id": message.id})
+        assert row.status == "PENDING"
+        assert row.nextAttemptAt > now_tr()
+        assert "smtp down" in row.lastError
+
+        # Not due yet: nothing is claimed
+        assert await email_outbox_service.deliver_due(sender=sender) == {"sent": 0, "retried": 0, "dead": 0}
+
+        await db.emailoutbox.update(where={"id": message.id}, data={"nextAttemptAt": now_tr() - timedelta(seconds=1)})
+        counts = await email_outbox_service.deliver_due(sender=sender)
+        assert counts["dead"] == 1
+
+    row = await db.emailoutbox.find_unique(where={"id": message.id})
+    assert row.status == "DEAD"
+    assert row.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_claimed_message_is_not_sent_twice_but_stale_lock_is_recovered():
+    message = await email_outbox_service.enqueue("once@example.com", "Once", "<p>x</p>")
+    await db.emailoutbox.update(where={"id": message.id}, data={"status": "SENDING", "lockedAt": now_tr()})
+    sender = RecordingSender()
+
+    assert (await email_outbox_service.deliver_due(sender=sender))["sent"] == 0
+
+    await db.emailoutbox.update(where={"id": message.id}, data={"lockedAt": now_tr() - timedelta(hours=1)})
+    assert (await email_outbox_service.deliver_due(sender=sender))["sent"] == 1
+    assert sender.sent == [("once@example.com", "Once")]
+
+
+@pytest.mark.asyncio
+async def test_register_queues_verification_email(client):
+    user_data = {
+        "email": "outbox_register@example.com",
+        "full_name": "Outbox Register",
+        "phone": "5557778899",
+        "gender": "FEMALE",
+        "password": "Password123!",
+    }
+    with patch.object(settings, "EMAILS_ENABLED", True):
+        response = await client.post("/api/v1/auth/register", json=user_data)
+    assert response.status_code == 201, response.text
+
+    rows = await db.emailoutbox.find_many(where={"toEmail": user_data["email"]})
+    assert len(rows) == 1
+    assert rows[0].status == "PENDING"
+    assert "verify-email?token=" in rows[0].html
+
+    await db.user.delete(where={"email": user_data["email"]})
+
+
+@pytest.mark.asyncio
+async def test_booking_and_cancellation_queue_templated_emails():
+    from decimal import Decimal
+    from app.services.booking_service import booking_service
+
+    studio = await db.studio.create(data={"name": "Zen Pilates", "address": "Kadıköy"})
+    user = await db.user.create(
+        data={
+            "email": "mail-booker@example.com",
+            "phone": "+905550000001",
+            "fullName": "Ayşe Yılmaz",
+            "hashedPassword": "x",
+            "gender": "FEMALE",
+        }
+    )
+    now = now_tr()
+    auction = await db.auction.create(
+        data={
+            "title": "Reformer Akşam",
+            "description": "Outbox test auction",
+            "allowedGender": "ANY",
+            "startPrice": Decimal("120.00"),
+            "floorPrice": Decimal("60.00"),
+            "currentPrice": Decimal("89.90"),
+            "startTime": now - timedelta(minutes=5),
+            "endTime": now + timedelta(minutes=55),
+            "scheduledAt": now + timedelta(hours=3),
+            "dropIntervalMins": 5,
+            "dropAmount": Decimal("2.50"),
+            "status": "ACTIVE",
+            "studioId": studio.id,
+        }
+    )
+
+    try:
+        with patch.object(settings, "EMAILS_ENABLED", True):
+            booked = await booking_service.book_auction(auction.id, user.id)
+            await booking_service.cancel_reservation(booked["id"], cancel_source="ADMIN")
+    finally:
+        await db.reservation.delete_many(where={"auctionId": auction.id})
+        await db.auction.delete(where={"id": auction.id})
+        await db.user.delete(where={"id": user.id})
+        await db.studio.delete(where={"id": studio.id})
+
+    rows = sorted(await db.emailoutbox.find_many(), key=lambda row: row.id)
+    assert [row.toEmail for row in rows] == ["mail-booker@example.com"] * 2
+    assert booked["booking_code"] in rows[0].subject and "Onaylandı" in rows[0].subject
+    assert "89.90" in rows[0].html and "Zen Pilates" in rows[0].html
+    assert "İptal" in rows[1].subject
+    assert "stüdyo tarafından" in rows[1].html
@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import patch
+
+from app.core.config import settings
+from app.core.email_templates import CompiledTemplate, TEMPLATE_DEFINITIONS, email_templates
+
+
+def test_compiled_template_inlines_static_values_and_escapes_context():
+    template = CompiledTemplate("<p>${project_name}</p><p>${name}</p>${name}", {"project_name": "Hot & Hour"})
+
+    assert template.parts == ["<p>Hot &amp; Hour</p><p>", ("name",), "</p>", ("name",)]
+    assert template.render({"name": "<b>Ayşe</b>"}) == (
+        "<p>Hot &amp; Hour</p><p>&lt;b&gt;Ayşe&lt;/b&gt;</p>&lt;b&gt;Ayşe&lt;/b&gt;"
+    )
+    with pytest.raises(KeyError):
+        template.render({})
+
+
+def test_all_registered_templates_render():
+    contexts = {
+        "verification": {"verification_link": "http://x/verify-email?token=t"},
+        "booking_confirmation": {
+            "full_name": "Ayşe Yılmaz",
+            "auction_title": "Reformer",
+            "booking_code": "HH-ABC123",
+            "scheduled_at": "12.03.2026 18:00",
+            "locked_price": "450.00",
+            "studio_name": "Zen",
+            "studio_address": "Kadıköy",
+        },
+        "reservation_cancelled": {
+            "full_name": "Ayşe Yılmaz",
+            "auction_title": "Reformer",
+            "booking_code": "HH-ABC123",
+            "reason": "Stüdyo tarafından iptal edildi",
+        },
+    }
+    assert set(contexts) == set(TEMPLATE_DEFINITIONS)
+    for name, context in contexts.items():
+        subject, html_content = email_templates.render(name, **context)
+        assert "${" not in subject and "${" not in html_content
+        assert html_content.lstrip().startswith("<!DOCTYPE html>")
+        assert "Pilates Stüdyoları için Dinamik Fiyatlandırma Platformu" in html_content
+
+
+def test_registry_recompiles_when_settings_change():
+    with patch.object(settings, "FRONTEND_URL", "https://one.example"):
+        _, first = email_templates.render("verification", verification_link="l")
+    with patch.object(settings, "FRONTEND_URL", "https://two.example"):
+        _, second = email_templates.render("verification", verification_link="l")
+    assert "https://one.example/logo_marka_adi_var.png" in first
+    assert "https://two.example/logo_marka_adi_var.png" in second
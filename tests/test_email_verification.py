@@ -24,7 +24,7 @@ async def test_email_verification_flow(client: AsyncClient, db_session):
     }
 
     # Mock email sending to avoid actual network calls
-    with patch("app.core.email.FastMail.send_message", new_callable=AsyncMock) as mock_send_email:
+    with patch("app.core.email.smtp_pool.send", new_callable=AsyncMock) as mock_send_email:
         # Register response
         response = await client.post("/api/v1/auth/register", json=user_data)
         assert response.status_code == 201, response.text
@@ -83,7 +83,7 @@ async def test_verify_already_verified(client: AsyncClient):
     }
     
     # Register
-    with patch("app.core.email.FastMail.send_message", new_callable=AsyncMock):
+    with patch("app.core.email.smtp_pool.send", new_callable=AsyncMock):
         await client.post("/api/v1/auth/register", json=user_data)
 
     # Manually set verified
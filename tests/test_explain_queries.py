@@ -0,0 +1,36 @@
+import re
+from pathlib import Path
+
+from scripts.explain_queries import QUERIES, plan_nodes, summarize
+
+MIGRATIONS = Path(__file__).parent.parent / "prisma" / "migrations"
+
+
+def _created_indexes() -> set:
+    created, dropped = set(), set()
+    for sql_file in sorted(MIGRATIONS.glob("*/migration.sql")):
+        sql = sql_file.read_text()
+        created |= set(re.findall(r'CREATE (?:UNIQUE )?INDEX "([^"]+)"', sql))
+        dropped |= set(re.findall(r'DROP INDEX "public"\."([^"]+)"', sql))
+    return created - dropped
+
+
+def test_expected_indexes_exist_in_migrations():
+    indexes = _created_indexes()
+    missing = [expected for _, _, expected in QUERIES if expected and expected not in indexes]
+    assert missing == []
+    assert "auctions_status_idx" not in indexes
+
+
+def test_plan_summary_lists_index_names():
+    plan = {
+        "Plan": {
+            "Node Type": "Limit", "Total Cost": 12.5,
+            "Plans": [{"Node Type": "Index Scan", "Index Name": "reservations_reservedAt_id_idx",
+                       "Relation Name": "reservations", "Total Cost": 12.0}],
+        },
+        "Execution Time": 0.42,
+    }
+
+    assert {node.get("Index Name") for node in plan_nodes(plan["Plan"])} == {None, "reservations_reservedAt_id_idx"}
+    assert summarize(plan) == "cost=12.5, 0.42ms: Limit -> Index Scan using reservations_reservedAt_id_idx"
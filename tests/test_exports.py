@@ -0,0 +1,131 @@
+import csv
+import io
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core import security
+from app.core.config import settings
+from app.core.db import db
+from app.main import app
+from app.utils.export import keyset_batches
+
+
+async def _admin_headers():
+    uid = uuid.uuid4().hex[:8]
+    admin = await db.user.create(data={
+        "email": f"export_{uid}@example.com",
+        "phone": f"+906{uuid.uuid4().int % 10**9:09d}",
+        "fullName": "Export Admin",
+        "hashedPassword": "not-used",
+        "role": "ADMIN",
+        "gender": "FEMALE",
+        "isVerified": True,
+    })
+    return {"Authorization": f"Bearer {security.create_access_token(subject=admin.id)}"}
+
+
+async def _seed_reservations(count: int):
+    studio = await db.studio.create(data={"name": f"Export Studio {uuid.uuid4().hex[:6]}"})
+    user = await db.user.create(data={
+        "email": f"export_user_{uuid.uuid4().hex[:8]}@example.com",
+        "phone": f"+905{uuid.uuid4().int % 10**9:09d}",
+        "fullName": "Şule Öztürk",
+        "hashedPassword": "not-used",
+        "gender": "FEMALE",
+    })
+    base = datetime(2030, 1, 1, 10, tzinfo=timezone.utc)
+    for index in range(count):
+        auction = await db.auction.create(data={
+            "title": f"Export Auction {index}",
+            "description": None,
+            "startPrice": Decimal("100.00"),
+            "floorPrice": Decimal("50.00"),
+            "startTime": base,
+            "endTime": base + timedelta(hours=2),
+            "dropIntervalMins": 10,
+            "dropAmount": Decimal("5.00"),
+            "status": "SOLD",
+            "studioId": studio.id,
+        })
+        await db.reservation.create(data={
+            "auctionId": auction.id,
+            "userId": user.id,
+            "lockedPrice": Decimal("80.00"),
+            "bookingCode": f"EX-{uuid.uuid4().hex[:6]}",
+            "status": "PENDING_ON_SITE",
+            "reservedAt": base + timedelta(minutes=index),
+        })
+    return studio
+
+
+@pytest.mark.asyncio
+async def test_keyset_batches_follow_cursor_until_exhausted():
+    calls = []
+
+    async def fetch_page(cursor, limit):
+        calls.append(cursor)
+        start = int(cursor or 0)
+        rows = [{"id": i} for i in range(start + 1, min(start + limit, 7) + 1)]
+        return rows, str(rows[-1]["id"]) if rows and rows[-1]["id"] < 7 else None
+
+    batches = [batch async for batch in keyset_batches(fetch_page, 3)]
+
+    assert [[row["id"] for row in batch] for batch in batches] == [[1, 2, 3], [4, 5, 6], [7]]
+    assert calls == [None, "3", "6"]
+
+
+@pytest.mark.asyncio
+async def test_reservation_export_streams_every_row_in_batches(monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    studio = await _seed_reservations(5)
+    headers = await _admin_headers()
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        as_csv = await client.get(
+            "/api/v1/reservations/admin/export", params={"studio_id": studio.id}, headers=headers
+        )
+        as_ndjson = await client.get(
+            "/api/v1/reservations/admin/export",
+            params={"studio_id": studio.id, "format": "ndjson"},
+            headers=headers,
+        )
+
+    assert as_csv.status_code == 200
+    assert as_csv.headers["content-type"].startswith("text/csv")
+    assert "attachment" in as_csv.headers["content-disposition"]
+    rows = list(csv.DictReader(io.StringIO(as_csv.content.decode("utf-8-sig"))))
+    assert len(rows) == 5
+    assert rows[0]["user_name"] == "Şule Öztürk"
+    assert rows[0]["auction_title"] == "Export Auction 4"
+
+    lines = [json.loads(line) for line in as_ndjson.text.splitlines()]
+    assert [line["id"] for line in lines] == [int(row["id"]) for row in rows]
+    assert lines[0]["locked_price"] == "80.00"
+
+
+@pytest.mark.asyncio
+async def test_auction_and_user_exports_require_admin_and_skip_password(monkeypatch):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 3)
+    studio = await _seed_reservations(4)
+    headers = await _admin_headers()
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        anonymous = await client.get("/api/v1/auctions/export")
+        auctions = await client.get(
+            "/api/v1/auctions/export", params={"studio_id": studio.id, "format": "ndjson"}, headers=headers
+        )
+        users = await client.get("/api/v1/users/export", headers=headers)
+
+    assert anonymous.status_code == 401
+    exported = [json.loads(line) for line in auctions.text.splitlines()]
+    assert [a["title"] for a in exported] == [f"Export Auction {i}" for i in range(4)]
+    assert users.status_code == 200
+    assert "hashedPassword" not in users.text.splitlines()[0]
+    assert "not-used" not in users.text
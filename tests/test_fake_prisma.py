@@ -0,0 +1,92 @@
+import pytest
+
+from app.core.fake_prisma import FakePrisma
+
+
+@pytest.fixture
+def fake():
+    return FakePrisma()
+
+
+@pytest.mark.asyncio
+async def test_unique_fields_are_enforced_and_indexed(fake, monkeypatch):
+    await fake.user.create(data={"email": "a@example.com", "phone": "+1"})
+    with pytest.raises(Exception, match="email"):
+        await fake.user.create(data={"email": "a@example.com", "phone": "+2"})
+    with pytest.raises(Exception, match="phone"):
+        await fake.user.create(data={"email": "b@example.com", "phone": "+1"})
+    # NULLs never collide, as in SQL
+    await fake.user.create(data={"email": "c@example.com", "phone": None})
+    await fake.user.create(data={"email": "d@example.com", "phone": None})
+
+    def scan(*args, **kwargs):
+        raise AssertionError("unique lookups must not scan")
+
+    monkeypatch.setattr(fake.user, "_matches_where", scan)
+    user = await fake.user.find_unique(where={"email": "a@example.com"})
+    assert user.phone == "+1"
+    assert await fake.user.find_unique(where={"email": "missing@example.com"}) is None
+
+
+@pytest.mark.asyncio
+async def test_reservation_auction_uniqueness_survives_updates_and_deletes(fake):
+    first = await fake.reservation.create(data={"auctionId": 1, "userId": 1, "bookingCode": "HOT-1", "status": "PENDING_ON_SITE"})
+    with pytest.raises(Exception, match="auctionId"):
+        await fake.reservation.create(data={"auctionId": 1, "userId": 2, "bookingCode": "HOT-2"})
+
+    await fake.reservation.update(where={"id": first.id}, data={"auctionId": 5})
+    second = await fake.reservation.create(data={"auctionId": 1, "userId": 2, "bookingCode": "HOT-2"})
+    with pytest.raises(Exception, match="auctionId"):
+        await fake.reservation.update(where={"id": second.id}, data={"auctionId": 5})
+
+    await fake.reservation.delete(where={"bookingCode": "HOT-1"})
+    await fake.reservation.create(data={"auctionId": 5, "userId": 3, "bookingCode": "HOT-3"})
+    assert await fake.reservation.find_unique(where={"bookingCode": "HOT-1"}) is None
+
+
+@pytest.mark.asyncio
+async def test_secondary_indexes_follow_status_changes(fake):
+    for index in range(6):
+        await fake.auction.create(data={"status": "ACTIVE" if index % 2 else "DRAFT", "title": f"A{index}"})
+
+    updated = await fake.auction.update_many(where={"status": "DRAFT"}, data={"status": "EXPIRED"})
+
+    assert updated == 3
+    assert await fake.auction.count(where={"status": "DRAFT"}) == 0
+    assert [a.title for a in await fake.auction.find_many(where={"status": {"in": ["EXPIRED"]}})] == ["A0", "A2", "A4"]
+    assert await fake.auction.count(where={"AND": [{"status": "ACTIVE"}, {"title": "A3"}]}) == 1
+    assert (await fake.auction.delete_many(where={"status": "EXPIRED"})) == {"count": 3}
+    assert await fake.auction.count() == 3
+
+
+@pytest.mark.asyncio
+async def test_rows_are_copied_on_read_and_write(fake):
+    data = {"email": "copy@example.com", "tags": ["a"]}
+    created = await fake.user.create(data=data)
+    data["tags"].append("mutated-input")
+    created.tags.append("mutated-output")
+    created.email = "changed@example.com"
+
+    stored = await fake.user.find_unique(where={"id": created.id})
+    assert stored.email == "copy@example.com"
+    assert stored.tags == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_create_many_order_skip_and_take(fake):
+    created = await fake.auction.create_many(data=[
+        {"id": 1, "title": "b", "startPrice": 300},
+        {"id": 2, "title": "a", "startPrice": 100},
+        {"id": 3, "title": "c", "startPrice": None},
+    ])
+    assert created == 3
+    with pytest.raises(Exception):
+        await fake.auction.create_many(data=[{"id": 1, "title": "dup"}])
+    assert await fake.auction.create_many(data=[{"id": 1, "title": "dup"}, {"id": 4, "title": "d", "startPrice": 200}],
+                                          skip_duplicates=True) == 1
+
+    by_price = await fake.auction.find_many(order={"startPrice": "desc"})
+    assert [a.title for a in by_price] == ["b", "d", "a", "c"]
+    page = await fake.auction.find_many(order=[{"title": "asc"}], skip=1, take=2)
+    assert [a.title for a in page] == ["b", "c"]
+    assert (await fake.auction.find_first(where={"startPrice": {"gte": 200}}, order={"startPrice": "asc"})).title == "d"
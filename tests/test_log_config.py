@@ -0,0 +1,96 @@
+import io
+import json
+import logging
+import sys
+import threading
+
+import pytest
+
+from app.core import log_config
+from app.core.config import settings
+from app.core.log_config import JsonFormatter, SamplingFilter, parse_mapping
+
+
+@pytest.fixture
+def configured(monkeypatch):
+    """Configure queue logging into a buffer and restore the root logger afterwards."""
+    monkeypatch.setattr(settings, "LOG_FORMAT", "json")
+    monkeypatch.setattr(settings, "LOG_LEVEL", "INFO")
+    monkeypatch.setattr(settings, "LOG_LEVELS", "tests.quiet=ERROR")
+    monkeypatch.setattr(settings, "LOG_SAMPLE_RATES", "tests.sampled=10")
+    root = logging.getLogger()
+    saved_handlers, saved_level = list(root.handlers), root.level
+    stream = io.StringIO()
+    log_config.configure_logging(stream)
+    try:
+        yield stream
+    finally:
+        log_config.stop_logging()
+        for handler in saved_handlers:
+            root.addHandler(handler)
+        root.setLevel(saved_level)
+        for name in ("tests.quiet", "tests.sampled"):
+            logger = logging.getLogger(name)
+            logger.setLevel(logging.NOTSET)
+            logger.filters.clear()
+
+
+def _lines(stream):
+    log_config.stop_logging()
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_records_are_written_as_json_by_the_listener_thread(configured, monkeypatch):
+    writer_threads = set()
+    original_format = JsonFormatter.format
+
+    def tracking_format(self, record):
+        writer_threads.add(threading.current_thread().name)
+        return original_format(self, record)
+
+    monkeypatch.setattr(JsonFormatter, "format", tracking_format)
+    logging.getLogger("tests.app").info("booked %s", "HH-1", extra={"auction_id": 7})
+
+    [line] = _lines(configured)
+    assert line["msg"] == "booked HH-1"
+    assert line["level"] == "INFO"
+    assert line["logger"] == "tests.app"
+    assert line["auction_id"] == 7
+    assert threading.current_thread().name not in writer_threads
+
+
+def test_per_logger_levels_and_sampling(configured):
+    logging.getLogger("tests.quiet").warning("hidden")
+    logging.getLogger("tests.quiet").error("shown")
+    sampled = logging.getLogger("tests.sampled")
+    for index in range(25):
+        sampled.info("tick %d", index)
+    sampled.warning("always kept")
+
+    messages = [line["msg"] for line in _lines(configured)]
+    assert messages == ["shown", "tick 0", "tick 10", "tick 20", "always kept"]
+
+
+def test_exceptions_are_formatted():
+    record = logging.LogRecord("tests", logging.ERROR, __file__, 1, "failed", (), None)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record.exc_info = sys.exc_info()
+
+    payload = json.loads(JsonFormatter().format(record))
+    assert "ValueError: boom" in payload["exc"]
+
+
+def test_sampling_filter_keeps_one_in_n_below_warning():
+    sampling = SamplingFilter(every=3)
+    info = logging.LogRecord("tests", logging.INFO, __file__, 1, "x", (), None)
+    error = logging.LogRecord("tests", logging.ERROR, __file__, 1, "x", (), None)
+
+    assert [sampling.filter(info) for _ in range(6)] == [True, False, False, True, False, False]
+    assert sampling.filter(error) is True
+    assert sampling.dropped == 4
+
+
+def test_parse_mapping_ignores_malformed_items():
+    assert parse_mapping("a=1, b = WARNING,broken,=x,") == {"a": "1", "b": "WARNING"}
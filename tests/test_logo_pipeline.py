@@ -0,0 +1,106 @@
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.db import db
+from app.services import logo_service as logo_module
+from app.services.logo_service import LogoService
+from app.services.studio_service import studio_service
+from app.utils.images import LOGO_VARIANTS, render_logo_variants
+from app.utils.uploads import is_content_hashed
+from app.utils.urls import listing_logo_url
+
+
+async def _studio_with_logo(logo_url: str):
+    studio = await db.studio.create(data={"name": f"Pipeline Studio {uuid.uuid4().hex[:6]}"})
+    return await studio_service.set_logo(studio.id, logo_url)
+
+
+def _fake_render(source_path, directory, stem, sizes, quality):
+    return {variant: (f"{stem}_{variant}.webp", 100) for variant in sizes}
+
+
+@pytest.fixture
+def thread_pipeline(monkeypatch):
+    """LogoService whose renders run in a thread with a stubbed renderer."""
+    service = LogoService(max_workers=1, quality=80)
+    monkeypatch.setattr(logo_module, "images_available", lambda: True)
+    monkeypatch.setattr(logo_module, "render_logo_variants", _fake_render)
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(service, "_get_executor", lambda: executor)
+    yield service
+    executor.shutdown(wait=True)
+
+
+def test_listing_logo_url_prefers_card_variant():
+    assert listing_logo_url(None) is None
+    assert listing_logo_url({"logoUrl": "/uploads/studios/a.png"}) == "/uploads/studios/a.png"
+    assert listing_logo_url({"logoUrl": "/uploads/studios/a.png", "logoCardUrl": "/uploads/studios/a_card.webp"}) == "/uploads/studios/a_card.webp"
+    assert listing_logo_url(SimpleNamespace(logoUrl="/x.png", logoCardUrl=None)) == "/x.png"
+
+
+async def test_set_logo_clears_previous_variants():
+    studio = await _studio_with_logo("/uploads/studios/old.png")
+    await studio_service.set_logo_variants(studio.id, "/uploads/studios/old.png", {"card": "/uploads/studios/old_card.webp"})
+
+    updated = await studio_service.set_logo(studio.id, "/uploads/studios/new.png")
+
+    assert updated.logoUrl == "/uploads/studios/new.png"
+    assert updated.logoCardUrl is None
+
+
+async def test_pipeline_stores_variant_urls(thread_pipeline):
+    studio = await _studio_with_logo("/uploads/studios/7_abc.png")
+
+    task = thread_pipeline.schedule(studio.id, "/srv/uploads/studios/7_abc.png", "/uploads/studios/7_abc.png")
+    await thread_pipeline.drain()
+
+    assert task.result() == {
+        variant: f"/uploads/studios/7_abc_{variant}.webp" for variant in LOGO_VARIANTS
+    }
+    stored = await db.studio.find_unique(where={"id": studio.id})
+    assert stored.logoThumbUrl == "/uploads/studios/7_abc_thumb.webp"
+    assert stored.logoCardUrl == "/uploads/studios/7_abc_card.webp"
+    assert stored.logoFullUrl == "/uploads/studios/7_abc_full.webp"
+    assert thread_pipeline.stats()["completed"] == 1
+
+
+async def test_pipeline_skips_variants_of_replaced_logo(thread_pipeline):
+    studio = await _studio_with_logo("/uploads/studios/old.png")
+    # A newer upload lands before the old render finishes
+    await studio_service.set_logo(studio.id, "/uploads/studios/new.png")
+
+    assert await thread_pipeline.process(studio.id, "/srv/old.png", "/uploads/studios/old.png") is None
+
+    stored = await db.studio.find_unique(where={"id": studio.id})
+    assert stored.logoUrl == "/uploads/studios/new.png"
+    assert stored.logoCardUrl is None
+    assert thread_pipeline.stats()["stale"] == 1
+
+
+async def test_pipeline_is_noop_without_pillow(monkeypatch):
+    service = LogoService(max_workers=1, quality=80)
+    monkeypatch.setattr(logo_module, "images_available", lambda: False)
+
+    assert service.schedule(1, "/tmp/x.png", "/uploads/studios/x.png") is None
+    assert LogoService(max_workers=1, quality=80, enabled=False).schedule(1, "/tmp/x.png", "/uploads/studios/x.png") is None
+
+
+def test_render_logo_variants_resizes_and_recompresses(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    source = tmp_path / "5_logo.png"
+    Image.new("RGBA", (2000, 1000), (200, 40, 40, 255)).save(source)
+
+    rendered = render_logo_variants(str(source), str(tmp_path), "5_logo", LOGO_VARIANTS, quality=80)
+
+    assert set(rendered) == set(LOGO_VARIANTS)
+    for variant, (filename, size) in rendered.items():
+        assert filename.startswith(f"5_logo_{variant}_") and is_content_hashed(filename)
+        with Image.open(tmp_path / filename) as image:
+            assert image.format == "WEBP"
+            assert max(image.size) == LOGO_VARIANTS[variant]
+        assert size == os.path.getsize(tmp_path / filename)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".part")]
@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.loop_monitor import EVENT_LOOP_STALLS, SLOW_CALLBACKS, EventLoopMonitor
+
+
+def _blocking_handler():
+    time.sleep(0.35)
+
+
+@pytest.mark.asyncio
+async def test_records_lag_and_blocking_stack():
+    monitor = EventLoopMonitor(interval=0.05, stall_threshold=0.1)
+    stalls_before = EVENT_LOOP_STALLS.labels().value
+    monitor.start()
+    try:
+        await asyncio.sleep(0.1)
+        _blocking_handler()
+        await asyncio.sleep(0.15)
+    finally:
+        await monitor.stop()
+
+    assert monitor.max_lag >= 0.2
+    assert len(monitor.recent_stalls) == 1
+    assert "_blocking_handler" in monitor.recent_stalls[0]["stack"]
+    assert EVENT_LOOP_STALLS.labels().value == stalls_before + 1
+    stats = monitor.stats()
+    assert stats["stalls"] == 1
+    assert stats["max_lag_ms"] >= 200
+
+
+@pytest.mark.asyncio
+async def test_idle_loop_reports_no_stalls():
+    monitor = EventLoopMonitor(interval=0.02, stall_threshold=0.2)
+    monitor.start()
+    try:
+        await asyncio.sleep(0.15)
+    finally:
+        await monitor.stop()
+
+    assert len(monitor.recent_stalls) == 0
+    assert monitor.max_lag < 0.2
+
+
+@pytest.mark.asyncio
+async def test_debug_mode_counts_slow_callbacks():
+    loop = asyncio.get_running_loop()
+    debug_before, slow_before = loop.get_debug(), loop.slow_callback_duration
+    monitor = EventLoopMonitor(interval=1.0, stall_threshold=5.0, debug=True, slow_callback_duration=0.05)
+    counted_before = SLOW_CALLBACKS.labels().value
+    monitor.start()
+    try:
+        loop.call_soon(time.sleep, 0.1)
+        await asyncio.sleep(0.2)
+    finally:
+        await monitor.stop()
+
+    # stop() restores the loop's own debug settings
+    assert loop.get_debug() == debug_before
+    assert loop.slow_callback_duration == slow_before
+    assert SLOW_CALLBACKS.labels().value > counted_before
+    assert any("took" in message for message in monitor.recent_slow_callbacks)
+    assert monitor.stats()["slow_callbacks"] >= 1
+
+
+def test_stall_count_keeps_growing_past_recent_window():
+    monitor = EventLoopMonitor(interval=1.0, stall_threshold=0.1, keep_recent=2)
+    for _ in range(5):
+        monitor._report_stall(0.5)
+
+    assert len(monitor.recent_stalls) == 2
+    assert monitor.stats()["stalls"] == 5
+
+
+@pytest.mark.asyncio
+async def test_health_reports_event_loop_stats():
+    from app.main import app
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get("/health")
+
+    assert response.status_code == 200
+    assert set(response.json()["event_loop"]) >= {"lag_ms", "max_lag_ms", "stalls"}
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from app.core import email as email_module
+from app.core.mail_transport import GmailTokenCache, SMTPConnectionPool
+
+
+class FakeSMTP:
+    def __init__(self):
+        self.is_connected = True
+        self.sent = []
+        self.noops = 0
+
+    async def send_message(self, message):
+        self.sent.append(message)
+
+    async def noop(self):
+        self.noops += 1
+
+    async def quit(self):
+        self.is_connected = False
+
+    def close(self):
+        self.is_connected = False
+
+
+@pytest.mark.asyncio
+async def test_token_cache_refreshes_once_under_concurrency():
+    cache = GmailTokenCache(refresh_margin=60)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return f"token-{calls}", 3600
+
+    tokens = await asyncio.gather(*(cache.get(fetch) for _ in range(10)))
+    assert set(tokens) == {"token-1"}
+    assert calls == 1
+
+    # Inside the refresh margin the token is treated as expired
+    cache._expires_at -= 3600 - 30
+    assert await cache.get(fetch) == "token-2"
+
+    cache.invalidate()
+    assert await cache.get(fetch) == "token-3"
+
+
+@pytest.mark.asyncio
+async def test_smtp_pool_reuses_connection_and_pings_idle_ones(monkeypatch):
+    pool = SMTPConnectionPool(email_module.conf, max_size=2, keepalive=60, idle_timeout=240)
+    opened = []
+
+    async def connect():
+        client = FakeSMTP()
+        opened.append(client)
+        return client
+
+    monkeypatch.setattr(pool, "_connect", connect)
+
+    for _ in range(3):
+        await pool.send(object())
+    assert len(opened) == 1
+    assert len(opened[0].sent) == 3
+
+    # Idle past keepalive: NOOP before reuse; past idle timeout: reconnect
+    client, _ = pool._idle[0]
+    pool._idle[0] = (client, pool._idle[0][1] - 120)
+    await pool.send(object())
+    assert opened[0].noops == 1
+    pool._idle[0] = (client, pool._idle[0][1] - 300)
+    await pool.send(object())
+    assert len(opened) == 2
+    assert opened[0].is_connected is False
+
+    await pool.close()
+    assert opened[1].is_connected is False
@@ -0,0 +1,89 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.db import db
+from app.core.metrics import (
+    BOOKING_OUTCOMES,
+    DB_QUERY_DURATION,
+    Counter,
+    Histogram,
+    MetricsRegistry,
+)
+from app.main import app
+from app.services.booking_service import AuctionNotFoundError, booking_service
+
+
+def test_histogram_and_counter_exposition():
+    registry = MetricsRegistry()
+    latency = registry.register(Histogram("t_latency_seconds", "latency", ("route",), buckets=(0.1, 1.0)))
+    hits = registry.register(Counter("t_hits", "hits", ("route",)))
+
+    latency.labels("/a").observe(0.05)
+    latency.labels("/a").observe(0.5)
+    latency.labels("/a").observe(5)
+    hits.labels('/b"x').inc(2)
+
+    text = registry.render()
+    assert "# TYPE t_latency_seconds histogram" in text
+    assert 't_latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 't_latency_seconds_bucket{route="/a",le="1"} 2' in text
+    assert 't_latency_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 't_latency_seconds_count{route="/a"} 3' in text
+    assert 't_hits_total{route="/b\\"x"} 2' in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_routes_db_calls_and_runtime_gauges():
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/api/v1/auctions/999999")
+        await client.get("/does-not-exist")
+        response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = response.text
+    assert 'route="/api/v1/auctions/{auction_id}"' in text
+    assert 'route="unmatched",status="404"' in text
+    assert 'hothour_db_query_duration_seconds_count{model="auction",operation="find_unique"}' in text
+    assert 'hothour_password_hash_pool{stat="queued"}' in text
+    assert 'hothour_redis_circuit_state{state="closed"}' in text
+
+
+@pytest.mark.asyncio
+async def test_db_proxy_and_booking_outcomes_are_counted():
+    find_many = DB_QUERY_DURATION.labels("studio", "find_many")
+    calls_before = find_many.count
+    await db.studio.find_many()
+    assert find_many.count == calls_before + 1
+
+    rejected = BOOKING_OUTCOMES.labels("rejected")
+    rejected_before = rejected.value
+    with pytest.raises(AuctionNotFoundError):
+        await booking_service.book_auction(auction_id=987654, user_id=1)
+    assert rejected.value == rejected_before + 1
+
+
+def test_counter_help_and_type_use_sample_name():
+    registry = MetricsRegistry()
+    registry.register(Counter("t_requests", "requests")).inc()
+
+    lines = registry.render().splitlines()
+    assert lines == ["# HELP t_requests_total requests", "# TYPE t_requests_total counter", "t_requests_total 1"]
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_requires_token_when_configured(monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        anonymous = await client.get("/metrics")
+        wrong = await client.get("/metrics", headers={"Authorization": "Bearer nope"})
+        scraper = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+
+    assert anonymous.status_code == 401
+    assert wrong.status_code == 401
+    assert scraper.status_code == 200
+    assert "# TYPE hothour_booking_outcomes_total counter" in scraper.text
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+from app.core import security
+from app.core.security import PasswordHashPool
+
+
+@pytest.mark.asyncio
+async def test_async_hash_and_verify_roundtrip():
+    hashed = await security.get_password_hash_async("TestPass123!")
+    assert await security.verify_password_async("TestPass123!", hashed) is True
+    assert await security.verify_password_async("WrongPass123!", hashed) is False
+    assert await security.verify_password_async("TestPass123!", "") is False
+    # Hashes stay compatible with the synchronous helpers used by scripts
+    assert security.verify_password("TestPass123!", hashed) is True
+
+
+@pytest.mark.asyncio
+async def test_hashing_does_not_block_event_loop():
+    pool = PasswordHashPool(max_workers=2, queue_warn_threshold=100)
+    ticks = 0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(0)
+
+    ticker_task = asyncio.create_task(ticker())
+    try:
+        await asyncio.gather(*(pool.run(security.get_password_hash, "TestPass123!") for _ in range(4)))
+    finally:
+        done.set()
+        await ticker_task
+        pool.shutdown()
+
+    assert ticks > 4
+    stats = pool.stats()
+    assert stats["completed"] == 4
+    assert stats["queued"] == 0
+    assert stats["in_flight"] == 0
+    assert stats["max_queued"] >= 2
+
+
+@pytest.mark.asyncio
+async def test_queue_depth_warning_is_rate_limited(caplog):
+    pool = PasswordHashPool(max_workers=1, queue_warn_threshold=0)
+    try:
+        with caplog.at_level("WARNING", logger="app.core.security"):
+            await asyncio.gather(*(pool.run(sum, [1, 2]) for _ in range(10)))
+    finally:
+        pool.shutdown()
+
+    warnings = [r for r in caplog.records if "Password hash queue depth" in r.getMessage()]
+    assert len(warnings) == 1
+    assert pool.stats()["queue_warnings"] == 10
@@ -0,0 +1,105 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core.compression import compressed_body_cache
+from app.core.db import db
+from app.main import app
+from app.services.feed_service import PublicFeed, public_feed
+
+TR = timezone(timedelta(hours=3))
+
+
+def _auction(title: str) -> dict:
+    return {
+        "title": title, "description": None, "startPrice": Decimal("400.00"), "floorPrice": Decimal("200.00"),
+        "startTime": datetime(2030, 5, 1, 10, tzinfo=TR), "endTime": datetime(2030, 5, 1, 11, tzinfo=TR),
+        "dropIntervalMins": 30, "dropAmount": Decimal("20.00"), "status": "DRAFT",
+    }
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_built_once_for_concurrent_requests():
+    feed = PublicFeed(max_age_seconds=60)
+    builds = []
+
+    async def build():
+        builds.append(1)
+        await asyncio.sleep(0.01)
+        return b'[{"id":1}]' * 10
+
+    snapshots = await asyncio.gather(*[feed.get("http://test", build) for _ in range(20)])
+
+    assert len(builds) == 1
+    assert all(snapshot is snapshots[0] for snapshot in snapshots)
+    assert feed.stats()["hits"] == 19
+
+
+@pytest.mark.asyncio
+async def test_snapshot_rebuilds_after_invalidation_and_expiry():
+    feed = PublicFeed(max_age_seconds=60)
+    bodies = iter([b"[1]", b"[2]", b"[3]"])
+
+    async def build():
+        return next(bodies)
+
+    assert (await feed.get("k", build)).body == b"[1]"
+    assert (await feed.get("k", build)).body == b"[1]"
+    feed.invalidate()
+    assert (await feed.get("k", build)).body == b"[2]"
+    feed.max_age_seconds = 0
+    assert (await feed.get("k", build)).body == b"[3]"
+
+
+@pytest.mark.asyncio
+async def test_snapshots_per_host_are_bounded():
+    feed = PublicFeed(max_age_seconds=60, max_snapshots=2)
+
+    async def build():
+        return b"[]"
+
+    await feed.get("http://a", build)
+    await feed.get("http://b", build)
+    await feed.get("http://a", build)  # a is now the most recently used
+    await feed.get("http://evil", build)
+
+    assert feed.stats()["snapshots"] == 2
+    assert set(feed._snapshots) == {"http://a", "http://evil"}
+
+
+@pytest.mark.asyncio
+async def test_feed_endpoint_serves_snapshot_with_etag_and_gzip():
+    # Enough items to pass COMPRESSION_MIN_BYTES
+    created = [await db.auction.create(data=_auction(f"Feed A{i}")) for i in range(4)]
+    transport = ASGITransport(app=app)
+
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/v1/auctions/feed", headers={"Accept-Encoding": "gzip"})
+        rebuilds = public_feed.rebuilds
+        cache_hits = compressed_body_cache.hits
+        repeated = await client.get("/api/v1/auctions/feed", headers={"Accept-Encoding": "gzip"})
+        again = await client.get(
+            "/api/v1/auctions/feed",
+            headers={"Accept-Encoding": "gzip", "If-None-Match": first.headers["etag"]},
+        )
+        assert public_feed.rebuilds == rebuilds
+        # The snapshot was compressed once; the second request reused those bytes
+        assert compressed_body_cache.hits == cache_hits + 1
+
+        # Any auction write invalidates the snapshot
+        added = await db.auction.create(data=_auction("Feed B"))
+        refreshed = await client.get("/api/v1/auctions/feed", headers={"Accept-Encoding": "identity"})
+
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.headers["etag"].startswith('W/"')
+    assert "Accept-Encoding" in first.headers["vary"]
+    assert {a.id for a in created} <= {a["id"] for a in first.json()}
+    assert repeated.content == first.content
+    assert again.status_code == 304
+    assert "content-encoding" not in refreshed.headers
+    assert added.id in [a["id"] for a in refreshed.json()]
+    assert refreshed.headers["etag"] != first.headers["etag"]
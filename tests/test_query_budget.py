@@ -0,0 +1,115 @@
+import logging
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+
+from app.core.config import settings
+from app.core.db import db
+from app.core.query_tracker import track_queries
+from app.core.timezone import now_tr
+
+
+async def seed_draft_auctions(count):
+    start = now_tr() + timedelta(days=2)
+    created = []
+    for i in range(count):
+        created.append(await db.auction.create(
+            data={
+                "title": f"Budget Auction {i}",
+                "description": "Query budget seed",
+                "allowedGender": "ANY",
+                "startPrice": Decimal("500.00"),
+                "floorPrice": Decimal("300.00"),
+                "currentPrice": Decimal("500.00"),
+                "startTime": start,
+                "endTime": start + timedelta(hours=2),
+                "scheduledAt": start + timedelta(hours=3),
+                "dropIntervalMins": 30,
+                "dropAmount": Decimal("10.00"),
+                "status": "DRAFT",
+            }
+        ))
+    return created
+
+
+@pytest.mark.asyncio
+async def test_track_queries_counts_and_reports_to_parent():
+    with track_queries() as outer:
+        await db.user.find_many()
+        with track_queries() as inner:
+            await db.studio.find_many()
+            await db.studio.find_many()
+    assert inner.count == 2
+    assert outer.count == 3
+    assert inner.repeated(2) == [("studio.find_many", 2)]
+    assert "studio.find_many×2" in outer.summary()
+
+
+@pytest.mark.asyncio
+async def test_list_auctions_query_count_does_not_grow_with_rows(client, query_budget):
+    seeded = await seed_draft_auctions(1)
+    try:
+        await client.get("/api/v1/auctions/")  # settle status/price syncs of auctions left by other tests
+        with track_queries() as baseline:
+            response = await client.get("/api/v1/auctions/")
+        assert response.status_code == 200
+
+        seeded += await seed_draft_auctions(5)
+        with query_budget(baseline.count):
+            response = await client.get("/api/v1/auctions/")
+        assert response.status_code == 200
+    finally:
+        for auction in seeded:
+            await db.auction.delete(where={"id": auction.id})
+
+
+@pytest.mark.asyncio
+async def test_server_timing_header_and_budget_warning(client, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "DB_QUERY_BUDGET", 0)
+    with caplog.at_level(logging.WARNING, logger="app.core.query_tracker"):
+        response = await client.get("/api/v1/auctions/")
+
+    assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert "queries" in response.headers["server-timing"]
+    assert any("DB query budget: GET /api/v1/auctions/" in record.getMessage() for record in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_list_auctions_does_not_touch_active_rows_one_by_one():
+    from app.services.auction_service import auction_service
+
+    seeded = []
+    now = now_tr()
+    for i in range(5):
+        seeded.append(await db.auction.create(
+            data={
+                "title": f"Active Budget Auction {i}",
+                "description": "Stale stored price",
+                "allowedGender": "ANY",
+                "startPrice": Decimal("500.00"),
+                "floorPrice": Decimal("300.00"),
+                "currentPrice": Decimal("500.00"),
+                "startTime": now - timedelta(hours=1),
+                "endTime": now + timedelta(hours=5),
+                "scheduledAt": now + timedelta(hours=6),
+                "dropIntervalMins": 10,
+                "dropAmount": Decimal("10.00"),
+                "turboEnabled": False,
+                "status": "ACTIVE",
+            }
+        ))
+    try:
+        with track_queries() as stats:
+            items = await auction_service.list_auctions(include_computed=True)
+
+        assert stats.operations[("auction", "find_unique")] == 0
+        assert stats.operations[("auction", "update")] == 0
+        listed = {item["id"]: item for item in items}
+        for auction in seeded:
+            # Price is computed for the response even though nothing was written
+            assert Decimal(str(listed[auction.id]["currentPrice"])) == Decimal("440.00")
+    finally:
+        for auction in seeded:
+            await db.auction.delete(where={"id": auction.id})
@@ -0,0 +1,216 @@
+import asyncio
+
+import pytest
+from jose import jwt
+
+from app.core import redis_client, security, token_revocation
+from app.core.config import settings
+from app.core.redis_client import CircuitBreaker
+from app.utils.bloom_filter import BloomFilter
+
+
+class FailingRedis:
+    def __init__(self):
+        self.calls = 0
+
+    async def set(self, *args, **kwargs):
+        self.calls += 1
+        raise ConnectionError("redis down")
+
+    async def exists(self, *args, **kwargs):
+        self.calls += 1
+        raise ConnectionError("redis down")
+
+
+class MemoryRedis:
+    def __init__(self):
+        self.store = {}
+        self.published = []
+        self.exists_calls = 0
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+        return True
+
+    async def exists(self, *keys):
+        self.exists_calls += 1
+        return sum(1 for key in keys if key in self.store)
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 0
+
+    async def scan_iter(self, match=None, count=None):
+        prefix = match.rstrip("*") if match else ""
+        for key in list(self.store):
+            if key.startswith(prefix):
+                yield key
+
+
+class FlakyPublishRedis(MemoryRedis):
+    def __init__(self, failures):
+        super().__init__()
+        self.failures = failures
+
+    async def publish(self, channel, message):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("publish failed")
+        return await super().publish(channel, message)
+
+
+@pytest.fixture(autouse=True)
+def fresh_revocation_state(monkeypatch):
+    monkeypatch.setattr(token_revocation, "_bloom", BloomFilter(1000, 0.001))
+    monkeypatch.setattr(token_revocation, "_bloom_synced", False)
+    monkeypatch.setattr(token_revocation, "_revoked_tokens", set())
+
+
+@pytest.fixture
+def breaker(monkeypatch):
+    fresh = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    monkeypatch.setattr(redis_client, "redis_breaker", fresh)
+    return fresh
+
+
+@pytest.mark.asyncio
+async def test_revocation_uses_async_redis_when_available(monkeypatch, breaker):
+    fake = MemoryRedis()
+    monkeypatch.setattr(redis_client, "get_async_redis_client", lambda: fake)
+
+    await token_revocation.revoke_refresh_token("token-redis")
+
+    assert "token-redis" not in token_revocation._revoked_tokens
+    assert await token_revocation.is_refresh_token_revoked("token-redis") is True
+    assert await token_revocation.is_refresh_token_revoked("token-other") is False
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_and_revocation_falls_back_to_memory(monkeypatch, breaker):
+    fake = FailingRedis()
+    monkeypatch.setattr(redis_client, "get_async_redis_client", lambda: fake)
+
+    await token_revocation.revoke_refresh_token("token-a")
+    await token_revocation.revoke_refresh_token("token-b")
+    assert breaker.state == "open"
+
+    # Open circuit: Redis is no longer contacted, the in-memory path answers
+    calls_before = fake.calls
+    await token_revocation.revoke_refresh_token("token-c")
+    assert await token_revocation.is_refresh_token_revoked("token-c") is True
+    assert fake.calls == calls_before
+
+
+@pytest.mark.asyncio
+async def test_revocation_keys_on_jti(monkeypatch, breaker):
+    fake = MemoryRedis()
+    monkeypatch.setattr(redis_client, "get_async_redis_client", lambda: fake)
+    token = security.create_refresh_token({"sub": "user@example.com"})
+    jti = jwt.get_unverified_claims(token)["jti"]
+
+    await token_revocation.revoke_refresh_token(token)
+
+    assert list(fake.store) == [f"{settings.REDIS_REVOKED_KEY_PREFIX}{jti}"]
+    assert fake.published == [(settings.REDIS_REVOKED_CHANNEL, jti)]
+    assert await token_revocation.is_refresh_token_revoked(token) is True
+
+
+@pytest.mark.asyncio
+async def test_synced_filter_answers_misses_without_redis(monkeypatch, breaker):
+    fake = MemoryRedis()
+    monkeypatch.setattr(redis_client, "get_async_redis_client", lambda: fake)
+    await token_revocation.revoke_refresh_token("token-revoked")
+
+    # A fresh worker rebuilds its filter from Redis before trusting it
+    monkeypatch.setattr(token_revocation, "_bloom", BloomFilter(1000, 0.001))
+    assert await token_revocation.rebuild_revocation_filter() is True
+    monkeypatch.setattr(token_revocation, "_bloom_synced", True)
+
+    assert await token_revocation.is_refresh_token_revoked("token-revoked") is True
+    calls_before = fake.exists_calls
+    for i in range(50):
+        assert await token_revocation.is_refresh_token_revoked(f"token-live-{i}") is False
+    # Allow for the odd false positive, but the common path must skip Redis
+    assert fake.exists_calls - calls_before <= 2
+
+
+
+@pytest.mark.asyncio
+async def test_legacy_full_token_keys_are_still_honoured(monkeypatch, breaker):
+    fake = MemoryRedis()
+    monkeypatch.setattr(redis_client, "get_async_redis_client", lambda: fake)
+    legacy_token = jwt.encode({"sub": "1", "type": "refresh"}, settings.SECRET_KEY, algorithm="HS256")
+    # Written by the previous release: key holds the whole JWT
+    fake.store[f"{settings.REDIS_REVOKED_KEY_PREFIX}{legacy_token}"] = "1"
+
+    assert await token_revocation.is_refresh_token_revoked(legacy_token) is True
+
+    # A synced worker folds legacy keys into its filter as well
+    assert await token_revocation.rebuild_revocation_filter() is True
+    monkeypatch.setattr(token_revocation, "_bloom_synced", True)
+    assert await token_revocation.is_refresh_token_revoked(legacy_token) is True
+
+
+@pytest.mark.asyncio
+async def test_failed_publish_is_retried(monkeypatch):
+    monkeypatch.setattr(redis_client, "redis_breaker", CircuitBreaker(failure_threshold=5, reset_timeout=60))
+    monkeypatch.setattr(token_revocation, "_PUBLISH_RETRY_DELAY", 0)
+    fake = FlakyPublishRedis(failures=2)
+    monkeypatch.setattr(redis_client, "get_async_redis_client", lambda: fake)
+
+    await token_revocation.revoke_refresh_token("token-flaky")
+    assert fake.published == []
+    await asyncio.gather(*token_revocation._publish_tasks)
+
+    assert fake.published == [(settings.REDIS_REVOKED_CHANNEL, token_revocation.token_revocation_id("token-flaky"))]
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(500, 0.01)
+    items = [f"jti-{i}" for i in range(500)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other-{i}" in bloom for i in range(1000))
+    assert false_positives < 50
+    assert len(bloom) == 500
+
+
+def test_breaker_half_opens_after_reset_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.state == "half-open"
+    assert breaker.allow() is True
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_half_open_breaker_lets_one_probe_through(monkeypatch):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    monkeypatch.setattr(redis_client, "redis_breaker", breaker)
+
+    class SlowRedis:
+        calls = 0
+
+        async def ping(self):
+            SlowRedis.calls += 1
+            await asyncio.sleep(0.01)
+            return True
+
+    monkeypatch.setattr(redis_client, "get_async_redis_client", lambda: SlowRedis())
+    results = await asyncio.gather(*(redis_client.redis_call(lambda c: c.ping()) for _ in range(5)))
+
+    assert SlowRedis.calls == 1
+    assert [ok for ok, _ in results].count(True) == 1
+    assert breaker.state == "closed"
+    assert (await redis_client.redis_call(lambda c: c.ping()))[0] is True
+
+
+def test_failed_probe_reopens_and_allows_next_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow() is True
+    assert breaker.allow() is False  # probe still in flight
+    breaker.record_failure()
+    assert breaker.allow() is True
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from pydantic import TypeAdapter, ValidationError
+
+from app.core.config import settings
+from app.core.db import db
+from app.main import app
+from app.models.auction import AuctionResponse
+from app.utils.serialization import ResponseSerializer
+
+TR = timezone(timedelta(hours=3))
+
+
+def _rows():
+    studio = {
+        "id": 4, "name": "Stüdyo", "logoUrl": "http://test/uploads/studios/4_card.webp",
+        "logoCardUrl": "/uploads/studios/4_card.webp", "address": None, "googleMapsUrl": None,
+        "createdAt": datetime(2026, 1, 1, tzinfo=timezone.utc), "updatedAt": datetime(2026, 1, 2, tzinfo=timezone.utc),
+    }
+    return [
+        {
+            "id": 1, "title": "Pilates", "description": "Sabah", "allowed_gender": "FEMALE",
+            "start_price": Decimal("500.00"), "floor_price": Decimal("250.00"),
+            "start_time": datetime(2026, 3, 1, 10, tzinfo=TR), "end_time": datetime(2026, 3, 1, 11, tzinfo=TR),
+            "drop_interval_mins": 30, "drop_amount": Decimal("25.00"), "turbo_enabled": True,
+            "status": "ACTIVE", "current_price": Decimal("475.00"),
+            "computedPrice": "475.00", "priceDetails": {"drops": 1, "next_drop_at": datetime(2026, 3, 1, 10, 30, tzinfo=TR)},
+            "created_at": datetime(2026, 2, 1, 9, 0, 0, 123000, tzinfo=timezone.utc),
+            "studioId": 4, "studio": studio,
+        },
+        {
+            # In-memory rows may carry ints and ISO strings; these take the validating path
+            "id": 2, "title": "Yoga", "allowed_gender": None,
+            "start_price": 300, "floor_price": "150.5",
+            "start_time": "2026-03-02T10:00:00+03:00", "end_time": datetime(2026, 3, 2, 11),
+            "drop_interval_mins": None, "status": "DRAFT", "current_price": None, "studio": None,
+        },
+    ]
+
+
+def test_serializer_output_matches_response_model():
+    rows = _rows()
+    adapter = TypeAdapter(list[AuctionResponse])
+
+    expected = adapter.dump_json(adapter.validate_python(rows))
+
+    assert ResponseSerializer(AuctionResponse).dumps(rows) == expected
+
+
+def test_serializer_still_rejects_invalid_rows():
+    row = _rows()[1]
+    row["start_price"] = "not-a-price"
+
+    with pytest.raises(ValidationError):
+        ResponseSerializer(AuctionResponse).dumps([row])
+
+
+@pytest.mark.asyncio
+async def test_list_auctions_identical_with_fast_serialization(monkeypatch):
+    auction = await db.auction.create(data={
+        "title": "Serializer", "description": None, "startPrice": Decimal("400.00"), "floorPrice": Decimal("200.00"),
+        "startTime": datetime(2030, 3, 3, 10, tzinfo=TR), "endTime": datetime(2030, 3, 3, 11, tzinfo=TR),
+        "dropIntervalMins": 30, "dropAmount": Decimal("20.00"), "status": "DRAFT",
+    })
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        monkeypatch.setattr(settings, "FAST_RESPONSE_SERIALIZATION", True)
+        fast = await client.get("/api/v1/auctions/")
+        monkeypatch.setattr(settings, "FAST_RESPONSE_SERIALIZATION", False)
+        validated = await client.get("/api/v1/auctions/")
+
+    assert fast.status_code == validated.status_code == 200
+    assert fast.headers["content-type"] == "application/json"
+    def ours(response):
+        # The list call re-syncs rows, so updated_at moves between requests
+        return [{**a, "updated_at": None} for a in response.json() if a["id"] == auction.id]
+
+    assert ours(fast) == ours(validated)
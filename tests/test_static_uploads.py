@@ -0,0 +1,56 @@
+import gzip
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from app.core.static_files import CachedStaticFiles
+from app.utils.uploads import content_hash_name
+
+HASHED = content_hash_name("7", "ab" * 32, "png")
+
+
+@pytest.fixture
+def static_client(tmp_path):
+    (tmp_path / HASHED).write_bytes(b"\x89PNG\r\n\x1a\nhashed")
+    (tmp_path / "7_legacy01.png").write_bytes(b"\x89PNG\r\n\x1a\nlegacy")
+    (tmp_path / "site.css").write_text("body { color: red; }" * 50)
+    (tmp_path / "site.css.gz").write_bytes(gzip.compress((tmp_path / "site.css").read_bytes()))
+    (tmp_path / "7_legacy01.png.gz").write_bytes(b"never served")
+
+    app = Starlette(routes=[Mount("/uploads", CachedStaticFiles(directory=str(tmp_path), max_age=60))])
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_content_hashed_uploads_are_immutable_and_revalidate(static_client):
+    async with static_client as client:
+        response = await client.get(f"/uploads/{HASHED}")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert response.headers["etag"] and response.headers["last-modified"]
+
+        cached = await client.get(f"/uploads/{HASHED}", headers={"If-None-Match": response.headers["etag"]})
+        assert cached.status_code == 304
+        assert cached.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+        legacy = await client.get("/uploads/7_legacy01.png")
+        assert legacy.headers["cache-control"] == "public, max-age=60"
+
+
+@pytest.mark.asyncio
+async def test_precompressed_sidecar_served_for_text_only(static_client):
+    async with static_client as client:
+        compressed = await client.get("/uploads/site.css", headers={"Accept-Encoding": "br;q=0, gzip"})
+        plain = await client.get("/uploads/site.css", headers={"Accept-Encoding": "identity"})
+        image = await client.get("/uploads/7_legacy01.png", headers={"Accept-Encoding": "gzip"})
+
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.headers["content-type"].startswith("text/css")
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    # httpx transparently decodes the gzip body
+    assert compressed.text == plain.text
+    assert "content-encoding" not in plain.headers
+    assert "content-encoding" not in image.headers
+    assert image.content.startswith(b"\x89PNG")
@@ -0,0 +1,178 @@
+import os
+import uuid
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core import db, security
+from app.core.config import settings
+from app.main import app
+from app.utils.uploads import UploadTooLargeError, is_content_hashed, save_image_upload, sniff_image
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 200
+
+
+class ChunkedUpload:
+    """Minimal UploadFile stand-in that records how it was read."""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.position = 0
+        self.reads = 0
+
+    async def read(self, size: int) -> bytes:
+        self.reads += 1
+        chunk = self.data[self.position:self.position + size]
+        self.position += len(chunk)
+        return chunk
+
+
+@pytest.fixture
+def uploads_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "UPLOADS_DIR", str(tmp_path))
+    (tmp_path / "studios").mkdir()
+    return tmp_path
+
+
+async def _admin_headers():
+    studio = await db.db.studio.create(data={"name": f"Logo Studio {uuid.uuid4().hex[:6]}"})
+    admin = await db.db.user.create(
+        data={
+            "email": f"logo_{uuid.uuid4().hex[:8]}@example.com",
+            "phone": f"+905{uuid.uuid4().int % 10**9:09d}",
+            "fullName": "Logo Admin",
+            "hashedPassword": "unused",
+            "role": "ADMIN",
+            "gender": "FEMALE",
+            "isVerified": True,
+            "studioId": studio.id,
+        }
+    )
+    token = security.create_access_token(subject=admin.id)
+    return studio, {"Authorization": f"Bearer {token}"}
+
+
+def test_sniff_image_detects_formats_by_magic_bytes():
+    assert sniff_image(PNG) == ("png", "image/png")
+    assert sniff_image(b"\xff\xd8\xff\xe0rest") == ("jpg", "image/jpeg")
+    assert sniff_image(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == ("webp", "image/webp")
+    assert sniff_image(b"<svg xmlns=...>") is None
+
+
+@pytest.mark.asyncio
+async def test_save_streams_in_chunks_and_renames_atomically(tmp_path):
+    upload = ChunkedUpload(PNG * 10)
+
+    saved = await save_image_upload(upload, str(tmp_path), "7", max_bytes=10_000, chunk_size=256)
+
+    assert upload.reads > 5
+    assert saved.filename.startswith("7_") and saved.filename.endswith(".png")
+    assert saved.size == len(PNG) * 10
+    with open(saved.path, "rb") as handle:
+        assert handle.read() == PNG * 10
+    assert os.listdir(tmp_path) == [saved.filename]
+
+
+@pytest.mark.asyncio
+async def test_saved_name_is_derived_from_content(tmp_path):
+    first = await save_image_upload(ChunkedUpload(PNG), str(tmp_path), "7", max_bytes=10_000)
+    again = await save_image_upload(ChunkedUpload(PNG), str(tmp_path), "7", max_bytes=10_000)
+    other = await save_image_upload(ChunkedUpload(PNG + b"\x01"), str(tmp_path), "7", max_bytes=10_000)
+
+    assert is_content_hashed(first.filename)
+    assert first.filename == again.filename
+    assert other.filename != first.filename
+    assert sorted(os.listdir(tmp_path)) == sorted([first.filename, other.filename])
+
+
+@pytest.mark.asyncio
+async def test_save_stops_at_size_cap_and_leaves_nothing(tmp_path):
+    upload = ChunkedUpload(PNG * 100)
+
+    with pytest.raises(UploadTooLargeError):
+        await save_image_upload(upload, str(tmp_path), "7", max_bytes=1000, chunk_size=256)
+
+    # Stopped right after crossing the cap instead of reading everything
+    assert upload.position < 1500
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_logo_endpoint_stores_sniffed_image(uploads_dir):
+    studio, headers = await _admin_headers()
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.post(
+            "/api/v1/studios/me/logo",
+            files={"file": ("logo.exe", PNG, "image/png")},
+            headers=headers,
+        )
+
+    assert response.status_code == 200, response.text
+    logo_url = response.json()["logoUrl"]
+    assert logo_url.startswith("http://test/uploads/studios/") and logo_url.endswith(".png")
+    stored = os.listdir(uploads_dir / "studios")
+    assert len(stored) == 1 and stored[0].startswith(f"{studio.id}_")
+
+
+@pytest.mark.asyncio
+async def test_upload_logo_rejects_spoofed_and_oversized_files(uploads_dir, monkeypatch):
+    _, headers = await _admin_headers()
+    monkeypatch.setattr(settings, "LOGO_MAX_BYTES", 100)
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        spoofed = await client.post(
+            "/api/v1/studios/me/logo",
+            files={"file": ("logo.png", b"<script>alert(1)</script>", "image/png")},
+            headers=headers,
+        )
+        oversized = await client.post(
+            "/api/v1/studios/me/logo",
+            files={"file": ("logo.png", PNG, "image/png")},
+            headers=headers,
+        )
+
+    assert spoofed.status_code == 400
+    assert oversized.status_code == 413
+    assert os.listdir(uploads_dir / "studios") == []
+
+
+@pytest.mark.asyncio
+async def test_oversized_content_length_is_rejected_before_the_body_is_read(monkeypatch):
+    monkeypatch.setattr(settings, "LOGO_MAX_BYTES", 100)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/api/v1/studios/me/logo",
+        "raw_path": b"/api/v1/studios/me/logo",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test"), (b"content-length", str(50 * 1024 * 1024).encode())],
+        "client": ("127.0.0.1", 1234),
+        "server": ("test", 80),
+    }
+    sent = []
+
+    async def receive():
+        raise AssertionError("body must not be read")
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+
+    assert sent[0]["status"] == 413
+    assert b"en fazla" in sent[1]["body"]
+
+
+@pytest.mark.asyncio
+async def test_save_image_upload_trusts_known_size(tmp_path):
+    upload = ChunkedUpload(PNG)
+    upload.size = len(PNG)
+
+    with pytest.raises(UploadTooLargeError):
+        await save_image_upload(upload, str(tmp_path), "1", max_bytes=100)
+    assert upload.reads == 0
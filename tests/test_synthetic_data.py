@@ -0,0 +1,106 @@
+import csv
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+
+from app.core.fake_prisma import FakePrisma
+from app.core.timezone import TR_TIMEZONE
+from benchmarks.synthetic import LoadProfile, SyntheticDataset, load_dataset, user_gender, write_csv
+
+PROFILE = LoadProfile(users=300, admins=3, studios=4, auctions=600, seed=7)
+NOW = datetime(2026, 6, 1, 12, 0, tzinfo=TR_TIMEZONE)
+
+
+@pytest.fixture
+def dataset():
+    data = SyntheticDataset(PROFILE, now=NOW)
+    # Skip the pbkdf2 hash; it is irrelevant to the generated shapes
+    data._hashed_password = "hashed"
+    return data
+
+
+def test_same_seed_gives_same_rows_and_tables_are_independent(dataset):
+    again = SyntheticDataset(PROFILE, now=NOW)
+    again._hashed_password = "hashed"
+    assert list(dataset.auctions()) == list(again.auctions())
+    assert list(dataset.reservations()) == list(again.reservations())
+
+    more_users = SyntheticDataset(replace(PROFILE, users=500), now=NOW)
+    more_users._hashed_password = "hashed"
+    assert list(more_users.auctions()) == list(dataset.auctions())
+
+    other_seed = SyntheticDataset(replace(PROFILE, seed=8), now=NOW)
+    assert list(other_seed.auctions()) != list(dataset.auctions())
+
+
+def test_rows_are_consistent_with_app_rules(dataset):
+    auctions = {row["id"]: row for row in dataset.auctions()}
+    reservations = list(dataset.reservations())
+
+    for auction in auctions.values():
+        assert auction["startTime"] < auction["endTime"] < auction["scheduledAt"]
+        assert auction["floorPrice"] <= auction["currentPrice"] <= auction["startPrice"]
+        if auction["status"] == "DRAFT":
+            assert auction["startTime"] > NOW
+        elif auction["status"] == "ACTIVE":
+            assert auction["startTime"] <= NOW < auction["endTime"]
+        else:
+            assert auction["endTime"] <= NOW
+
+    assert len({row["auctionId"] for row in reservations}) == len(reservations)
+    assert len({row["bookingCode"] for row in reservations}) == len(reservations)
+    for reservation in reservations:
+        auction = auctions[reservation["auctionId"]]
+        assert auction["status"] == "SOLD"
+        assert auction["startTime"] <= reservation["reservedAt"] <= auction["endTime"]
+        assert auction["floorPrice"] <= reservation["lockedPrice"] <= auction["startPrice"]
+        assert reservation["userId"] > PROFILE.admins
+        if auction["allowedGender"] != "ANY":
+            assert user_gender(reservation["userId"]) == auction["allowedGender"]
+
+    statuses = {auction["status"] for auction in auctions.values()}
+    assert {"SOLD", "EXPIRED"} <= statuses
+
+
+@pytest.mark.asyncio
+async def test_load_into_fake_prisma_in_batches(dataset):
+    fake = FakePrisma()
+
+    counts = await load_dataset(fake, dataset, batch_size=128)
+
+    assert counts["users"] == PROFILE.users
+    assert counts["auctions"] == PROFILE.auctions
+    assert await fake.reservation.count() == counts["reservations"] > 0
+    assert await fake.notification.count() == counts["notifications"]
+    assert await fake.user.count(where={"role": "ADMIN"}) == PROFILE.admins
+    notification = (await fake.notification.find_many(take=1))[0]
+    assert notification.userId <= PROFILE.admins
+    assert notification.type in ("AUTO_CANCEL_NO_SHOW", "USER_CANCELLED_BY_CUSTOMER")
+    # Ids continue after the generated rows
+    created = await fake.auction.create(data={"title": "after load"})
+    assert created.id == PROFILE.auctions + 1
+
+
+def test_write_csv_for_copy(dataset, tmp_path):
+    counts = write_csv(dataset, str(tmp_path))
+
+    with open(tmp_path / "reservations.csv", newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(rows) == counts["reservations"]
+    assert set(rows[0]) == {"id", "auctionId", "userId", "lockedPrice", "bookingCode", "status", "reservedAt"}
+    load_sql = (tmp_path / "load.sql").read_text(encoding="utf-8")
+    assert "\\copy \"reservations\"" in load_sql
+    assert "setval(pg_get_serial_sequence('\"auctions\"', 'id')" in load_sql
+
+
+def test_default_reference_time_is_fixed_and_overridable():
+    from scripts.generate_load_data import parse_args
+    from benchmarks.synthetic import DEFAULT_NOW
+
+    assert parse_args([]).now == DEFAULT_NOW
+    assert SyntheticDataset(PROFILE).now == DEFAULT_NOW
+    assert parse_args(["--now", "2026-06-01T12:00"]).now == NOW
+    assert parse_args(["--now", "2026-06-01T09:00+00:00"]).now == NOW
+    with pytest.raises(SystemExit):
+        parse_args(["--now", "yesterday"])
@@ -0,0 +1,62 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.core import security
+from app.core.config import settings
+from app.core.db import db
+from app.main import app
+from app.utils.urls import UrlResolver
+
+
+def test_absolute_only_rewrites_upload_paths():
+    urls = UrlResolver("http://api.test/")
+
+    assert urls.absolute("/uploads/studios/1_logo.png") == "http://api.test/uploads/studios/1_logo.png"
+    assert urls.absolute("https://cdn.example/logo.png") == "https://cdn.example/logo.png"
+    assert urls.absolute(None) is None
+
+
+def test_studio_is_resolved_without_mutating_the_model():
+    studio = SimpleNamespace(id=3, name="S", logoUrl="/uploads/studios/3_a.png", logoCardUrl="/uploads/studios/3_card.webp")
+    urls = UrlResolver("http://api.test")
+
+    detail = urls.studio(studio)
+    card = urls.studio(studio, listing=True)
+
+    assert detail["logoUrl"] == "http://api.test/uploads/studios/3_a.png"
+    assert card["logoUrl"] == "http://api.test/uploads/studios/3_card.webp"
+    assert studio.logoUrl == "/uploads/studios/3_a.png"
+    # Every auction of the same studio shares one resolved dict
+    assert urls.studio(studio, listing=True) is card
+    assert urls.studio(None) is None
+
+
+@pytest.mark.asyncio
+async def test_my_studio_uses_public_base_url(monkeypatch):
+    monkeypatch.setattr(settings, "PUBLIC_BASE_URL", "https://cdn.hothour.test")
+    studio = await db.studio.create(data={"name": "Resolver Studio", "logoUrl": "/uploads/studios/r.png"})
+    admin = await db.user.create(
+        data={
+            "email": f"resolver_{uuid.uuid4().hex[:8]}@example.com",
+            "phone": f"+905{uuid.uuid4().int % 10**9:09d}",
+            "fullName": "Resolver Admin",
+            "hashedPassword": "unused",
+            "role": "ADMIN",
+            "gender": "FEMALE",
+            "isVerified": True,
+            "studioId": studio.id,
+        }
+    )
+    headers = {"Authorization": f"Bearer {security.create_access_token(subject=admin.id)}"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        first = await client.get("/api/v1/studios/me", headers=headers)
+        second = await client.get("/api/v1/studios/me", headers=headers)
+
+    assert first.json()["logoUrl"] == "https://cdn.hothour.test/uploads/studios/r.png"
+    assert second.json()["logoUrl"] == first.json()["logoUrl"]
+    stored = await db.studio.find_unique(where={"id": studio.id})
+    assert stored.logoUrl == "/uploads/studios/r.png"
@@ -0,0 +1,141 @@
+import uuid
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from app.main import app
+from app.core import db
+from app.core import security
+from app.core.user_cache import UserCache, user_cache
+
+
+@pytest_asyncio.fixture(scope="function", autouse=True)
+async def db_connect():
+    if not db.db.is_connected():
+        await db.db.connect()
+    user_cache.clear()
+    yield
+    user_cache.clear()
+
+
+async def create_user_in_db(role: str = "USER"):
+    email = f"cache_{uuid.uuid4().hex[:8]}@example.com"
+    phone = f"+906{uuid.uuid4().int % 10**9:09d}"
+    return await db.db.user.create(
+        data={
+            "email": email,
+            "phone": phone,
+            "fullName": "Cache Admin" if role == "ADMIN" else "Cache User",
+            "hashedPassword": security.get_password_hash("TestPass123!"),
+            "role": role,
+            "gender": "FEMALE",
+            "isVerified": True,
+        }
+    )
+
+
+def count_user_lookups(monkeypatch):
+    calls = {"count": 0}
+    original = db.db.user.find_unique
+
+    async def counting_find_unique(*args, **kwargs):
+        calls["count"] += 1
+        return await original(*args, **kwargs)
+
+    monkeypatch.setattr(db.db.user, "find_unique", counting_find_unique)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_repeated_requests_hit_user_cache(monkeypatch):
+    user = await create_user_in_db()
+    headers = {"Authorization": f"Bearer {security.create_access_token(subject=user.id)}"}
+    calls = count_user_lookups(monkeypatch)
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for _ in range(3):
+            response = await client.get("/api/v1/auth/me", headers=headers)
+            assert response.status_code == 200, response.text
+
+    assert calls["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_admin_update_invalidates_cached_user():
+    admin = await create_user_in_db(role="ADMIN")
+    target = await create_user_in_db(role="USER")
+    admin_headers = {"Authorization": f"Bearer {security.create_access_token(subject=admin.id)}"}
+    target_headers = {"Authorization": f"Bearer {security.create_access_token(subject=target.id)}"}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        first = await client.get("/api/v1/auth/me", headers=target_headers)
+        assert first.json()["full_name"] == "Cache User"
+
+        update = await client.put(
+            f"/api/v1/users/{target.id}",
+            json={
+                "full_name": "Renamed User",
+                "email": target.email,
+                "phone": target.phone,
+                "role": "USER",
+                "gender": "FEMALE",
+            },
+            headers=admin_headers,
+        )
+        assert update.status_code == 200, update.text
+
+        second = await client.get("/api/v1/auth/me", headers=target_headers)
+        assert second.json()["full_name"] == "Renamed User"
+
+
+@pytest.mark.asyncio
+async def test_user_cache_evicts_least_recently_used_and_expired():
+    cache = UserCache(max_entries=2, ttl_seconds=60)
+    await cache.set(1, {"id": 1})
+    await cache.set(2, {"id": 2})
+    assert await cache.get(1) == {"id": 1}  # 1 is now most recently used
+    await cache.set(3, {"id": 3})
+
+    assert await cache.get(2) is None
+    assert await cache.get(1) == {"id": 1}
+
+    expired = UserCache(max_entries=2, ttl_seconds=0)
+    await expired.set(1, {"id": 1})
+    assert await expired.get(1) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_user_has_no_password_hash_and_change_password_still_works():
+    user = await create_user_in_db()
+    headers = {"Authorization": f"Bearer {security.create_access_token(subject=user.id)}"}
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        me = await client.get("/api/v1/auth/me", headers=headers)
+        assert me.status_code == 200, me.text
+
+        cached = await user_cache.get(user.id)
+        assert cached is not None
+        assert cached.hashedPassword is None
+
+        changed = await client.post(
+            "/api/v1/auth/change-password",
+            json={"current_password": "TestPass123!", "new_password": "NewPass456!"},
+            headers=headers,
+        )
+        assert changed.status_code == 200, changed.text
+
+    stored = await db.db.user.find_unique(where={"id": user.id})
+    assert security.verify_password("NewPass456!", stored.hashedPassword)
+
+
+@pytest.mark.asyncio
+async def test_user_cache_hands_out_copies():
+    cache = UserCache(max_entries=2, ttl_seconds=60)
+    await cache.set(1, {"id": 1, "fullName": "Ayşe", "hashedPassword": "secret"})
+
+    first = await cache.get(1)
+    assert "hashedPassword" not in first
+    first["fullName"] = "Changed"
+    assert (await cache.get(1))["fullName"] == "Ayşe"